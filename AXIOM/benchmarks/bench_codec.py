@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark comparing the JSON and binary event codecs.
+
+For representative state-update and conversation-turn events, reports
+encode and decode time per event and encoded size. The binary codec is measured with each payload
+format available here (msgpack only if installed).
+
+Run from the AXIOM directory:
+    PYTHONPATH=src python benchmarks/bench_codec.py
+"""
+
+import argparse
+import time
+from typing import Callable
+
+from axiom.bus.codec import BinaryCodec, JsonCodec, msgpack
+from axiom.bus.events import ConversationTurnEvent, Event, StateUpdatedEvent
+
+
+def bench_ns(run: Callable[[], object], iterations: int) -> float:
+    """Return mean nanoseconds per call, best of three runs."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            run()
+        best = min(best, (time.perf_counter_ns() - start) / iterations)
+    return best
+
+
+def sample_events():
+    yield "state.updated", StateUpdatedEvent(
+        source="sensor_monitor",
+        changes={"temperature": 21.5, "humidity": 0.43, "motion": False},
+        entity_type="sensor",
+        entity_id="kitchen-01"
+    )
+    yield "conversation.turn", ConversationTurnEvent(
+        source="va_pipeline",
+        session_id="session-42",
+        user_input="Remind me to take my medication at eight",
+        assistant_response="Okay, I'll remind you at 8 PM to take your medication.",
+        intent={"name": "set_reminder", "confidence": 0.93, "slots": {"time": "20:00"}},
+        processing_time=0.214
+    )
+
+
+def main(iterations: int) -> None:
+    codecs = [("json", JsonCodec())]
+    formats = ["marshal", "json"] + (["msgpack"] if msgpack is not None else [])
+    codecs += [(f"binary/{fmt}", BinaryCodec(payload_format=fmt)) for fmt in formats]
+    
+    print(f"{'event':>18} {'codec':>15} {'encode (ns)':>12} {'decode (ns)':>12} {'bytes':>6}")
+    for label, event in sample_events():
+        for name, codec in codecs:
+            data = codec.encode(event)
+            assert codec.decode(data).payload == event.payload
+            encode_ns = bench_ns(lambda: codec.encode(event), iterations)
+            decode_ns = bench_ns(lambda: codec.decode(data), iterations)
+            print(f"{label:>18} {name:>15} {encode_ns:>12.0f} {decode_ns:>12.0f} {len(data):>6}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Event codec microbenchmark")
+    parser.add_argument("--iterations", type=int, default=50_000, help="Calls per measurement")
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for EventBus dispatch cost per subscriber fan-out.
+
+Measures, at 1, 10 and 100 subscribers on one topic:
+- Routing lookup (the lock-free snapshot read done per event)
+- Full dispatch of one event to no-op coroutine handlers
+
+Run from the AXIOM directory:
+    PYTHONPATH=src python benchmarks/bench_dispatch.py
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+import structlog
+
+from axiom.bus.event_bus import EventBus
+from axiom.bus.events import Event, EventType
+
+FAN_OUTS = (1, 10, 100)
+
+
+def _make_handler():
+    async def handler(event: Event) -> None:
+        pass
+    return handler
+
+
+def bench_lookup(bus: EventBus, event_type: str, iterations: int) -> float:
+    """Return mean nanoseconds per routing lookup."""
+    lookup = bus._routes.lookup
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        lookup(event_type)
+    return (time.perf_counter_ns() - start) / iterations
+
+
+async def bench_dispatch(bus: EventBus, event: Event, iterations: int) -> float:
+    """Return mean microseconds to dispatch one event to every subscriber."""
+    # Warm up task creation paths
+    for _ in range(min(100, iterations)):
+        await bus._process_event(event)
+    
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        await bus._process_event(event)
+    return (time.perf_counter_ns() - start) / iterations / 1000
+
+
+async def main(iterations: int) -> None:
+    event_type = EventType.STATE_UPDATED.value
+    event = Event(event_type=event_type, payload={}, source="bench")
+    
+    print(f"{'subscribers':>12} {'lookup (ns)':>14} {'dispatch (us)':>15} {'per handler (us)':>18}")
+    for fan_out in FAN_OUTS:
+        bus = EventBus()
+        for _ in range(fan_out):
+            bus.subscribe(event_type, _make_handler())
+        
+        lookup_ns = bench_lookup(bus, event_type, iterations * 10)
+        dispatch_us = await bench_dispatch(bus, event, iterations)
+        print(f"{fan_out:>12} {lookup_ns:>14.1f} {dispatch_us:>15.2f} {dispatch_us / fan_out:>18.3f}")
+        
+        await bus.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="EventBus dispatch microbenchmark")
+    parser.add_argument("--iterations", type=int, default=2000, help="Dispatches per fan-out")
+    args = parser.parse_args()
+    
+    # Keep per-event log lines out of the measurement
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for Event construction cost and footprint.
+
+Compares the slotted Event against the dataclass it replaced (reproduced
+below as ``DataclassEvent``, uuid4 IDs, ``datetime.now()`` and a list
+membership check on every construction) for:
+- Construction of a new event
+- ``Event.correlate`` from an existing event
+- Memory retained per event (tracemalloc, payload dict included)
+
+The CPU column is the share of one core spent building events at 10k
+events/s.
+
+Run from the AXIOM directory:
+    PYTHONPATH=src python benchmarks/bench_events.py
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict
+
+from axiom.bus.events import Event, EventType
+
+EVENT_TYPE = EventType.STATE_UPDATED.value
+RATE = 10_000
+
+
+@dataclass
+class DataclassEvent:
+    """The dataclass Event as it was before it was slotted."""
+    event_type: str
+    payload: Dict[str, Any]
+    source: str
+    timestamp: datetime = field(default_factory=datetime.now)
+    correlation_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    
+    def __post_init__(self):
+        if self.event_type not in EventType.values():
+            raise ValueError(f"Invalid event type: {self.event_type}")
+        if not isinstance(self.payload, dict):
+            raise TypeError("Payload must be a dictionary")
+        if not self.source:
+            raise ValueError("Source cannot be empty")
+    
+    @staticmethod
+    def correlate(event: 'DataclassEvent') -> 'DataclassEvent':
+        return DataclassEvent(
+            event_type=event.event_type,
+            payload=event.payload,
+            source=event.source,
+            correlation_id=event.correlation_id
+        )
+
+
+def bench_ns(build: Callable[[], Any], iterations: int) -> float:
+    """Return mean nanoseconds per call, best of three runs."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            build()
+        best = min(best, (time.perf_counter_ns() - start) / iterations)
+    return best
+
+
+def bench_bytes(build: Callable[[], Any], count: int) -> float:
+    """Return bytes retained per event while ``count`` events are alive."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    events = [build() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del events
+    # Exclude the list holding the events
+    return (after - before - 8 * count) / count
+
+
+def main(iterations: int) -> None:
+    payload = {"entity_type": "sensor", "entity_id": "kitchen", "changes": {"temp": 21.5}}
+    cases = {
+        "dataclass": (
+            lambda: DataclassEvent(event_type=EVENT_TYPE, payload=dict(payload), source="bench"),
+            DataclassEvent.correlate
+        ),
+        "slotted": (
+            lambda: Event(event_type=EVENT_TYPE, payload=dict(payload), source="bench"),
+            Event.correlate
+        ),
+    }
+    
+    print(f"{'event':>10} {'new (ns)':>10} {'correlate (ns)':>15} {'bytes/event':>12} {'CPU @10k/s':>11}")
+    for name, (build, correlate) in cases.items():
+        original = build()
+        new_ns = bench_ns(build, iterations)
+        correlate_ns = bench_ns(lambda: correlate(original), iterations)
+        per_event = bench_bytes(build, iterations)
+        cpu = new_ns * RATE / 1e9 * 100
+        print(f"{name:>10} {new_ns:>10.0f} {correlate_ns:>15.0f} {per_event:>12.0f} {cpu:>10.2f}%")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Event construction microbenchmark")
+    parser.add_argument("--iterations", type=int, default=100_000, help="Events built per measurement")
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the write-ahead event journal's throughput cost.
+
+Concurrent publishers push events through an EventBus with one no-op
+subscriber, with no journal, with a journal whose publishes wait for the
+group commit (journal_sync=True), and with one whose publishes do not.
+Reports end-to-end events/s (published and delivered) and the cost
+relative to no journal.
+
+Budget: an asynchronously committed journal should cost no more than 35%
+of no-journal throughput with 8 or more publishers; that is the encoding
+and bookkeeping, the writes happen off the event loop. A synchronously
+committed one should cost no more than 50% with 32 or more publishers.
+Each sync publish waits out a commit round trip, so its throughput grows
+with the number of publishers sharing a commit; with few publishers it is
+bound by commit latency and is reported for reference only (batch with
+publish_many if that path matters).
+
+Run from the AXIOM directory:
+    PYTHONPATH=src python benchmarks/bench_journal.py [--dir /path/on/target/disk]
+"""
+
+import argparse
+import asyncio
+import logging
+import shutil
+import tempfile
+import time
+
+import structlog
+
+from axiom.bus.event_bus import EventBus
+from axiom.bus.events import Event, EventType
+from axiom.bus.journal import EventJournal
+
+TOPIC = EventType.STATE_UPDATED.value
+# Mode -> (minimum publishers the budget applies to, maximum cost)
+BUDGET = {"sync": (32, 0.50), "async": (8, 0.35)}
+
+
+async def run(mode: str, directory: str, publishers: int, events: int) -> float:
+    """Return events/s for one configuration."""
+    journal = None
+    if mode != "none":
+        journal = EventJournal(tempfile.mkdtemp(dir=directory))
+    bus = EventBus(max_events=10_000, journal=journal, journal_sync=(mode == "sync"))
+    bus.register_publisher("bench", [TOPIC])
+    
+    delivered = 0
+    done = asyncio.Event()
+    async def handler(event: Event) -> None:
+        nonlocal delivered
+        delivered += 1
+        if delivered == events:
+            done.set()
+    bus.subscribe(TOPIC, handler)
+    
+    runner = asyncio.create_task(bus.start())
+    await asyncio.sleep(0.05)
+    per_publisher = events // publishers
+    payload = {"entity_type": "sensor", "entity_id": "kitchen", "changes": {"temp": 21.5}}
+    
+    async def publish() -> None:
+        for _ in range(per_publisher):
+            await bus.publish(Event(event_type=TOPIC, payload=dict(payload), source="bench"))
+    
+    start = time.perf_counter()
+    await asyncio.gather(*(publish() for _ in range(publishers)))
+    await done.wait()
+    elapsed = time.perf_counter() - start
+    
+    await bus.stop()
+    runner.cancel()
+    return events / elapsed
+
+
+async def main(directory: str, events: int) -> None:
+    print(f"{'publishers':>10} {'mode':>6} {'events/s':>10} {'cost':>7} {'budget':>7}")
+    for publishers in (1, 8, 32):
+        count = events // publishers * publishers
+        baseline = await run("none", directory, publishers, count)
+        print(f"{publishers:>10} {'none':>6} {baseline:>10.0f}")
+        for mode in ("sync", "async"):
+            rate = await run(mode, directory, publishers, count)
+            cost = 1 - rate / baseline
+            min_publishers, max_cost = BUDGET[mode]
+            budget = f"{max_cost:.0%}" if publishers >= min_publishers else "-"
+            print(f"{publishers:>10} {mode:>6} {rate:>10.0f} {cost:>7.0%} {budget:>7}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Event journal throughput benchmark")
+    parser.add_argument("--dir", default=None, help="Directory on the disk to measure (default: temp dir)")
+    parser.add_argument("--events", type=int, default=4000, help="Events per configuration")
+    args = parser.parse_args()
+    
+    # Keep per-event log lines out of the measurement
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    root = args.dir or tempfile.mkdtemp(prefix="bench-journal-")
+    try:
+        asyncio.run(main(root, args.events))
+    finally:
+        if args.dir is None:
+            shutil.rmtree(root, ignore_errors=True)
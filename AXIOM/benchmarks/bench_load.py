@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Load generator for EventBus: throughput, latency and memory under load.
+
+Synthetic publishers push events at a target rate (or as fast as they can)
+to a fan-out of synthetic subscribers whose handlers take a set time and
+fail at a set rate. Every combination of the swept options is one run;
+each run reports:
+- Publish and delivery throughput (events/s, handler completions/s)
+- End-to-end latency percentiles, from when an event was due to be
+  published until a handler finished with it; measured from the schedule
+  rather than the actual publish, so a bus that falls behind is not
+  flattered (coordinated omission)
+- Enqueue, queue-wait and handler-time percentiles from ``get_metrics``
+- Peak and final process RSS
+
+Budget: SRS REQ-NFR-005 asks for responses within 2 seconds, so a run
+passes when its p95 end-to-end latency is under ``--p95-budget`` (2s).
+Results can be written as JSON with ``--json`` and checked against an
+earlier file with ``--baseline``; the script exits non-zero if a run
+misses the budget or regresses past ``--tolerance``.
+
+Run from the AXIOM directory:
+    PYTHONPATH=src python benchmarks/bench_load.py [--rate 1000,5000] \\
+        [--fan-out 1,10] [--payload-bytes 64,4096] [--handler-ms 0,5] \\
+        [--failure-rate 0,0.01] [--json results.json] [--baseline old.json]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import psutil
+import structlog
+
+from axiom.bus.event_bus import EventBus
+from axiom.bus.events import Event, EventType
+from axiom.utils.metrics import Histogram
+
+TOPIC = EventType.STATE_UPDATED.value
+# Options that take comma-separated lists; every combination is one run
+SWEPT = ("rate", "fan_out", "payload_bytes", "handler_ms", "failure_rate")
+
+
+class Subscriber:
+    """Synthetic handler that takes a set time and sometimes fails."""
+    
+    def __init__(self, latency: Histogram, delay: float, failure_rate: float,
+                 rng: random.Random):
+        self._latency = latency
+        self._delay = delay
+        self._failure_rate = failure_rate
+        self._rng = rng
+    
+    async def handle(self, event: Event) -> None:
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        self._finish(event)
+    
+    def handle_blocking(self, event: Event) -> None:
+        if self._delay:
+            time.sleep(self._delay)
+        self._finish(event)
+    
+    def _finish(self, event: Event) -> None:
+        if self._failure_rate and self._rng.random() < self._failure_rate:
+            raise RuntimeError("synthetic handler failure")
+        self._latency.record((time.perf_counter_ns() - event.payload["due_ns"]) / 1e9)
+
+
+async def publisher(bus: EventBus, name: str, count: int, interval: Optional[float],
+                    start_ns: int, offset: int, stride: int, data: str) -> int:
+    """Publish ``count`` events on schedule; return how many were accepted."""
+    accepted = 0
+    for i in range(count):
+        due_ns = time.perf_counter_ns()
+        if interval is not None:
+            due_ns = start_ns + int((offset + i * stride) * interval * 1e9)
+            delay = (due_ns - time.perf_counter_ns()) / 1e9
+            if delay > 0:
+                await asyncio.sleep(delay)
+        event = Event(event_type=TOPIC, payload={"due_ns": due_ns, "data": data}, source=name)
+        if await bus.publish(event):
+            accepted += 1
+    return accepted
+
+
+async def sample_rss(process: psutil.Process, peak: List[int], stop: asyncio.Event) -> None:
+    """Track peak resident memory until stopped."""
+    while not stop.is_set():
+        peak[0] = max(peak[0], process.memory_info().rss)
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=0.1)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def drain(bus: EventBus, expected: int, timeout: float) -> bool:
+    """Wait until ``expected`` deliveries have succeeded or been given up on."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if sum(count_deliveries(bus.get_metrics()["counters"])[:2]) >= expected:
+            return True
+        await asyncio.sleep(0.01)
+    return False
+
+
+def count_deliveries(counters: Dict[str, int]) -> Tuple[int, int, int]:
+    """Total deliveries made, failed and retried across subscribers."""
+    totals = {"bus_delivered_total": 0, "bus_delivery_failures_total": 0, "bus_retries_total": 0}
+    for key, value in counters.items():
+        name = key.split("{")[0]
+        if name in totals:
+            totals[name] += value
+    return tuple(totals.values())
+
+
+def summarize(histograms: Dict[str, Dict[str, Any]], name: str) -> Dict[str, Optional[float]]:
+    """Merge a bus histogram's label sets into count-weighted p50/p99 and the worst max."""
+    parts = [summary for key, summary in histograms.items()
+             if key.split("{")[0] == name and summary["count"]]
+    if not parts:
+        return {"count": 0, "p50": None, "p99": None, "max": None}
+    count = sum(part["count"] for part in parts)
+    return {
+        "count": count,
+        "p50": sum(part["p50"] * part["count"] for part in parts) / count,
+        "p99": max(part["p99"] for part in parts),
+        "max": max(part["max"] for part in parts)
+    }
+
+
+async def run(config: Dict[str, Any], args: argparse.Namespace) -> Dict[str, Any]:
+    """Drive one configuration and return its results."""
+    rng = random.Random(args.seed)
+    process = psutil.Process()
+    rss_before = process.memory_info().rss
+    
+    bus = EventBus(
+        max_events=args.max_events,
+        num_dispatchers=args.dispatchers,
+        retry_delay=timedelta(milliseconds=args.retry_delay_ms),
+        circuit_breaker=None
+    )
+    bus.register_publisher("load", [TOPIC])
+    latency = Histogram()
+    for _ in range(config["fan_out"]):
+        subscriber = Subscriber(latency, config["handler_ms"] / 1000, config["failure_rate"], rng)
+        # The bus awaits coroutine handlers and runs plain ones on its worker threads
+        bus.subscribe(TOPIC, subscriber.handle_blocking if args.handler_kind == "blocking"
+                      else subscriber.handle)
+    
+    runner = asyncio.create_task(bus.start())
+    await asyncio.sleep(0.05)
+    peak = [rss_before]
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(sample_rss(process, peak, stop))
+    
+    rate = config["rate"]
+    interval = 1 / rate if rate else None
+    total = args.events if not rate else int(rate * args.duration)
+    publishers = args.publishers
+    data = "x" * config["payload_bytes"]
+    
+    started = time.perf_counter()
+    start_ns = time.perf_counter_ns()
+    counts = [total // publishers + (1 if i < total % publishers else 0) for i in range(publishers)]
+    accepted = sum(await asyncio.gather(*(
+        publisher(bus, "load", counts[i], interval, start_ns, i, publishers, data)
+        for i in range(publishers)
+    )))
+    published = time.perf_counter()
+    drained = await drain(bus, accepted * config["fan_out"], args.drain_timeout)
+    finished = time.perf_counter()
+    
+    stop.set()
+    await sampler
+    metrics = bus.get_metrics()
+    await bus.stop()
+    await runner
+    
+    delivered, failed, retries = count_deliveries(metrics["counters"])
+    end_to_end = latency.snapshot((50.0, 95.0, 99.0, 99.9))
+    p95 = end_to_end["p95"]
+    
+    return {
+        "config": config,
+        "published": accepted,
+        "dropped": total - accepted,
+        "delivered": delivered,
+        "failed": failed,
+        "retries": retries,
+        "drained": drained,
+        "publish_seconds": published - started,
+        "total_seconds": finished - started,
+        "publish_rate": accepted / (published - started),
+        "delivery_rate": delivered / (finished - started),
+        "latency": end_to_end,
+        "enqueue": summarize(metrics["histograms"], "bus_enqueue_seconds"),
+        "queue_wait": summarize(metrics["histograms"], "bus_queue_wait_seconds"),
+        "handler": summarize(metrics["histograms"], "bus_handler_seconds"),
+        "rss_before_mb": rss_before / 2**20,
+        "rss_peak_mb": peak[0] / 2**20,
+        "rss_after_mb": process.memory_info().rss / 2**20,
+        "passed": drained and p95 is not None and p95 < args.p95_budget
+    }
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: str, tolerance: float) -> List[str]:
+    """List runs that regressed against a baseline file by more than ``tolerance``."""
+    with open(baseline_path) as f:
+        baseline = {json.dumps(run["config"], sort_keys=True): run for run in json.load(f)["runs"]}
+    regressions = []
+    for result in results:
+        old = baseline.get(json.dumps(result["config"], sort_keys=True))
+        if old is None:
+            continue
+        if result["delivery_rate"] < old["delivery_rate"] * (1 - tolerance):
+            regressions.append(
+                f"{result['config']}: delivery rate {old['delivery_rate']:.0f} -> "
+                f"{result['delivery_rate']:.0f}/s"
+            )
+        old_p95, new_p95 = old["latency"]["p95"], result["latency"]["p95"]
+        if old_p95 and new_p95 and new_p95 > old_p95 * (1 + tolerance):
+            regressions.append(f"{result['config']}: p95 {old_p95 * 1000:.2f} -> {new_p95 * 1000:.2f}ms")
+    return regressions
+
+
+def print_result(result: Dict[str, Any]) -> None:
+    config, latency = result["config"], result["latency"]
+    
+    def ms(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value * 1000:.2f}"
+    
+    print(
+        f"{config['rate'] or 'max':>7} {config['fan_out']:>4} {config['payload_bytes']:>7} "
+        f"{config['handler_ms']:>6g} {config['failure_rate']:>5g} "
+        f"{result['publish_rate']:>9.0f} {result['delivery_rate']:>9.0f} "
+        f"{ms(latency['p50']):>8} {ms(latency['p95']):>8} {ms(latency['p99']):>8} "
+        f"{ms(result['queue_wait']['p99']):>8} {result['rss_peak_mb']:>7.1f} "
+        f"{'ok' if result['passed'] else 'FAIL':>5}"
+    )
+
+
+def parse_list(kind):
+    def parse(value: str):
+        return [kind(item) for item in value.split(",")]
+    return parse
+
+
+async def main(args: argparse.Namespace) -> int:
+    configs = [
+        dict(zip(SWEPT, values))
+        for values in itertools.product(*(getattr(args, option) for option in SWEPT))
+    ]
+    print(
+        f"{'rate':>7} {'fan':>4} {'payload':>7} {'hdl ms':>6} {'fail':>5} "
+        f"{'pub/s':>9} {'deliv/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+        f"{'qwait99':>8} {'rss MB':>7} {'p95':>5}"
+    )
+    results = []
+    for config in configs:
+        result = await run(config, args)
+        print_result(result)
+        results.append(result)
+    
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "benchmark": "bench_load",
+                "timestamp": datetime.now().isoformat(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "options": {k: v for k, v in vars(args).items() if k not in ("json", "baseline")},
+                "runs": results
+            }, f, indent=2)
+        print(f"Results written to {args.json}")
+    
+    status = 0
+    if not all(result["passed"] for result in results):
+        print(f"FAIL: p95 budget of {args.p95_budget}s missed, or the bus did not drain")
+        status = 1
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="EventBus load generator")
+    parser.add_argument("--rate", type=parse_list(int), default=[1000, 5000],
+                        help="Target publish rates in events/s; 0 publishes as fast as possible")
+    parser.add_argument("--fan-out", type=parse_list(int), default=[1, 10],
+                        help="Subscribers per event")
+    parser.add_argument("--payload-bytes", type=parse_list(int), default=[64],
+                        help="Payload sizes")
+    parser.add_argument("--handler-ms", type=parse_list(float), default=[0.0],
+                        help="Time each handler call takes")
+    parser.add_argument("--failure-rate", type=parse_list(float), default=[0.0],
+                        help="Fraction of handler calls that raise")
+    parser.add_argument("--handler-kind", choices=("async", "blocking"), default="async",
+                        help="Coroutine handlers, or plain ones run on the bus's worker threads")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per rate-limited run")
+    parser.add_argument("--events", type=int, default=20_000, help="Events per unlimited-rate run")
+    parser.add_argument("--publishers", type=int, default=4, help="Concurrent publishers")
+    parser.add_argument("--dispatchers", type=int, default=4, help="Bus dispatch workers")
+    parser.add_argument("--max-events", type=int, default=10_000, help="Bus queue capacity")
+    parser.add_argument("--retry-delay-ms", type=float, default=100.0, help="Bus retry delay")
+    parser.add_argument("--drain-timeout", type=float, default=30.0,
+                        help="Seconds to wait for deliveries after publishing stops")
+    parser.add_argument("--p95-budget", type=float, default=2.0, help="p95 end-to-end budget (s)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for synthetic failures")
+    parser.add_argument("--json", help="Write results to this file")
+    parser.add_argument("--baseline", help="Earlier --json file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Relative drop in throughput or rise in p95 counted as a regression")
+    args = parser.parse_args()
+    
+    # Keep per-event log lines, including synthetic failures, out of the measurement
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+    sys.exit(asyncio.run(main(args)))
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark for EventBus priority lanes under rising low-priority load.
+
+A steady stream of high-priority events (conversation.turn, standing in for
+caregiver notifications) shares the bus with bulk low-priority traffic
+(state.updated, standing in for sensor events) whose handler costs CPU.
+Low-priority load is run at a base rate and at 10x, once with every topic
+in the same lane (plain FIFO) and once with the topics in separate lanes.
+
+Reports p50/p99 publish-to-handler latency of the high-priority events.
+The defaults oversubscribe the dispatcher at 10x load, so the low lane
+backs up. With lanes, high-priority p99 should stay within about one
+low-priority handler's cost of the base case; with FIFO it tracks the
+backlog.
+
+Run from the AXIOM directory:
+    PYTHONPATH=src python benchmarks/bench_priority.py
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import List
+
+import structlog
+
+from axiom.bus.event_bus import EventBus
+from axiom.bus.events import Event, EventType
+from axiom.bus.queues import EventPriority
+
+HIGH_TOPIC = EventType.CONVERSATION_TURN.value
+LOW_TOPIC = EventType.STATE_UPDATED.value
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _produce(bus: EventBus, topic: str, rate: float, duration: float) -> None:
+    """Publish at a fixed rate, catching up in bursts if the loop falls behind."""
+    interval = 1.0 / rate
+    start = time.perf_counter()
+    sent = 0
+    while time.perf_counter() - start < duration:
+        due = int((time.perf_counter() - start) / interval) + 1
+        while sent < due:
+            await bus.publish(Event(topic, {"sent": time.perf_counter()}, "bench"))
+            sent += 1
+        await asyncio.sleep(interval / 2)
+
+
+async def run_case(lanes: bool, low_rate: float, high_rate: float,
+                   low_cost: float, duration: float) -> List[float]:
+    """Run one load case and return high-priority latencies in milliseconds."""
+    bus = EventBus(max_events=100_000, num_dispatchers=1)
+    bus.register_publisher("bench", [HIGH_TOPIC, LOW_TOPIC])
+    if lanes:
+        bus.set_topic_priority(HIGH_TOPIC, EventPriority.CRITICAL)
+        bus.set_topic_priority(LOW_TOPIC, EventPriority.LOW)
+    
+    latencies: List[float] = []
+    
+    async def on_high(event: Event) -> None:
+        latencies.append((time.perf_counter() - event.payload["sent"]) * 1000)
+    
+    async def on_low(event: Event) -> None:
+        # Simulate CPU-bound work that holds the loop
+        end = time.perf_counter() + low_cost
+        while time.perf_counter() < end:
+            pass
+    
+    bus.subscribe(HIGH_TOPIC, on_high)
+    bus.subscribe(LOW_TOPIC, on_low)
+    
+    runner = asyncio.create_task(bus.start())
+    await asyncio.gather(
+        _produce(bus, HIGH_TOPIC, high_rate, duration),
+        _produce(bus, LOW_TOPIC, low_rate, duration),
+    )
+    await bus._event_queue.join()
+    await bus.stop()
+    await runner
+    return latencies
+
+
+async def main(args: argparse.Namespace) -> None:
+    print(f"{'scheduler':>10} {'low rate/s':>11} {'high p50 (ms)':>14} {'high p99 (ms)':>14}")
+    for lanes in (False, True):
+        for multiplier in (1, 10):
+            low_rate = args.low_rate * multiplier
+            latencies = await run_case(
+                lanes, low_rate, args.high_rate, args.low_cost_ms / 1000, args.duration
+            )
+            print(
+                f"{'lanes' if lanes else 'fifo':>10} {low_rate:>11.0f} "
+                f"{statistics.median(latencies):>14.2f} {_percentile(latencies, 99):>14.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="EventBus priority lane benchmark")
+    parser.add_argument("--high-rate", type=float, default=50, help="High-priority events/s")
+    parser.add_argument("--low-rate", type=float, default=100, help="Base low-priority events/s")
+    parser.add_argument("--low-cost-ms", type=float, default=1.1, help="CPU cost per low-priority event")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds per case")
+    args = parser.parse_args()
+    
+    # Keep per-event log lines out of the measurement
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    asyncio.run(main(args))
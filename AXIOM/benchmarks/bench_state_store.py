@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark for StateStore insert throughput, before and after connection tuning.
+
+Logs conversation turns one commit at a time, as the pipeline does, with
+SQLite's defaults (rollback journal, synchronous=FULL; "before") and with
+StateStore's tuned defaults (WAL, synchronous=NORMAL, sized page cache,
+mmap I/O; "after"). Each configuration runs twice: with the writer alone,
+and with a reader thread polling conversation history the whole time,
+which reports how many reads it managed and how many failed with
+"database is locked".
+
+Run from the AXIOM directory:
+    PYTHONPATH=src python benchmarks/bench_state_store.py [--dir /path/on/target/disk]
+"""
+
+import argparse
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from axiom.state.models import ConversationTurn
+from axiom.state.store import StateStore
+from axiom.state.exceptions import QueryExecutionError
+
+CONFIGS = {
+    "before": dict(journal_mode="DELETE", synchronous="FULL", cache_size_kb=2000, mmap_size=0),
+    "after": dict()  # StateStore defaults
+}
+
+
+def reader(path: Path, settings: dict, ready: threading.Event, stop: threading.Event,
+           counts: dict) -> None:
+    """Poll conversation history until stopped, counting reads and lock errors."""
+    # A store of its own, as a separate reader process would have
+    store = StateStore(path, busy_timeout_ms=50, **settings)
+    ready.set()
+    while not stop.is_set():
+        try:
+            store.get_conversation_history("bench", limit=10)
+            counts["reads"] += 1
+        except QueryExecutionError:
+            counts["locked"] += 1
+    store.close()
+
+
+def run(directory: str, settings: dict, turns: int, with_reader: bool) -> dict:
+    """Return inserts/s and reader counts for one configuration."""
+    path = Path(tempfile.mkdtemp(dir=directory)) / "bench.db"
+    # Short busy timeout so blocked readers show up as errors rather than stalls
+    store = StateStore(path, busy_timeout_ms=50, **settings)
+    now = datetime.now()
+    # (session_id, timestamp) is unique, so every turn gets its own timestamp
+    batch = [
+        ConversationTurn(
+            session_id="bench",
+            user_input="What is the weather like today?",
+            assistant_response="It is sunny with a light breeze." * 4,
+            detected_intent={"intent": "weather", "confidence": 0.92},
+            processing_time=42,
+            timestamp=now + timedelta(microseconds=i)
+        )
+        for i in range(turns)
+    ]
+    
+    ready = threading.Event()
+    stop = threading.Event()
+    counts = {"reads": 0, "locked": 0}
+    thread = threading.Thread(target=reader, args=(path, settings, ready, stop, counts))
+    if with_reader:
+        thread.start()
+        ready.wait()
+    
+    start = time.perf_counter()
+    for turn in batch:
+        store.log_conversation_turn(turn)
+    elapsed = time.perf_counter() - start
+    
+    stop.set()
+    if with_reader:
+        thread.join()
+    store.close()
+    shutil.rmtree(path.parent, ignore_errors=True)
+    return {"rate": turns / elapsed, **counts}
+
+
+def main(directory: str, turns: int) -> None:
+    print(f"SQLite {sqlite3.sqlite_version}, {turns} single-commit inserts per run")
+    print(f"{'config':>8} {'reader':>7} {'inserts/s':>10} {'reads':>8} {'locked':>7}")
+    rates = {}
+    for name, settings in CONFIGS.items():
+        for with_reader in (False, True):
+            result = run(directory, settings, turns, with_reader)
+            rates[name, with_reader] = result["rate"]
+            reads = f"{result['reads']:>8} {result['locked']:>7}" if with_reader else f"{'-':>8} {'-':>7}"
+            print(f"{name:>8} {'yes' if with_reader else 'no':>7} {result['rate']:>10.0f} {reads}")
+    for with_reader in (False, True):
+        speedup = rates["after", with_reader] / rates["before", with_reader]
+        print(f"Speedup {'with' if with_reader else 'without'} reader: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="StateStore insert throughput benchmark")
+    parser.add_argument("--dir", default=tempfile.gettempdir(),
+                        help="Directory for the databases; use the disk the store will live on")
+    parser.add_argument("--turns", type=int, default=2000, help="Inserts per run")
+    args = parser.parse_args()
+    main(args.dir, args.turns)
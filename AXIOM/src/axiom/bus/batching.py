@@ -0,0 +1,74 @@
+"""Batch accumulation for subscribers that receive lists of events."""
+
+import asyncio
+from typing import Awaitable, Callable, List, Optional
+
+from .events import Event
+
+class BatchAccumulator:
+    """
+    Collects events for one batched subscription.
+    
+    A batch is released when it reaches ``max_size`` events, or when
+    ``linger`` seconds have passed since its first event, whichever comes
+    first. Size-triggered batches are returned to the caller to deliver;
+    linger-triggered batches are handed to ``on_linger``.
+    """
+    
+    def __init__(self, max_size: int, linger: float,
+                 on_linger: Callable[[List[Event]], Awaitable[None]]):
+        """
+        Initialize the accumulator.
+        
+        Args:
+            max_size: Number of events that releases a batch immediately
+            linger: Seconds a partial batch may wait for more events
+            on_linger: Coroutine function called with a batch released by time
+        """
+        self._max_size = max_size
+        self._linger = linger
+        self._on_linger = on_linger
+        self._events: List[Event] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._pending: set = set()  # Linger deliveries still running
+    
+    def add(self, event: Event) -> Optional[List[Event]]:
+        """
+        Add an event to the current batch.
+        
+        Args:
+            event: Event to batch
+            
+        Returns:
+            The completed batch if this event filled it, otherwise None
+        """
+        self._events.append(event)
+        if len(self._events) >= self._max_size:
+            return self.drain()
+        
+        if self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self._linger, self._linger_expired)
+        return None
+    
+    def drain(self) -> List[Event]:
+        """Take the current partial batch and cancel its linger timer."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        events, self._events = self._events, []
+        return events
+    
+    async def wait_pending(self) -> None:
+        """Wait for linger-triggered deliveries that are still running."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+    
+    def _linger_expired(self) -> None:
+        """Release a partial batch once its linger time has passed."""
+        self._timer = None
+        batch = self.drain()
+        if batch:
+            task = asyncio.create_task(self._on_linger(batch))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
@@ -0,0 +1,166 @@
+"""Debounce bursts of updates to the same entity into one merged event."""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .events import Event
+
+@dataclass(frozen=True)
+class CoalesceConfig:
+    """How one topic's updates are merged."""
+    window: timedelta                                   # Quiet time that ends a burst
+    max_delay: Optional[timedelta] = None               # Longest the first update of a burst is held
+    key_fields: Tuple[str, ...] = ("entity_type", "entity_id")  # Payload fields naming the entity
+    merge_field: str = "changes"                        # Payload dict merged across the burst
+    
+    def __post_init__(self):
+        """Validate coalescing options."""
+        if self.window.total_seconds() <= 0:
+            raise ValueError("window must be positive")
+        if self.max_delay is not None and self.max_delay < self.window:
+            raise ValueError("max_delay cannot be shorter than window")
+        if not self.key_fields:
+            raise ValueError("key_fields cannot be empty")
+
+class _Burst:
+    """Updates to one entity held since the burst began."""
+    __slots__ = ("config", "latest", "changes", "count", "first_at", "last_at", "timer")
+    
+    def __init__(self, config: CoalesceConfig, event: Event, changes: Dict[str, Any], now: float):
+        self.config = config
+        self.latest = event
+        self.changes = dict(changes)
+        self.count = 1
+        self.first_at = now
+        self.last_at = now
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+class EventCoalescer:
+    """
+    Holds updates per entity and releases one merged update per burst.
+    
+    An update to an entity opens a burst; later updates to the same entity
+    merge their ``merge_field`` dict into it, newer values winning. The
+    burst is released once no update has arrived for ``window``, or
+    ``max_delay`` after it began so a constant stream still gets through.
+    The released event is the latest update with the merged dict and a
+    ``coalesced_count`` payload field giving the number of updates it
+    replaces, so subscribers run once per burst instead of once per update.
+    
+    Events of unconfigured topics, or without the key fields or a dict to
+    merge, are not held.
+    """
+    
+    def __init__(self, on_release: Callable[[Event], Awaitable[None]]):
+        """
+        Initialize the coalescer.
+        
+        Args:
+            on_release: Coroutine function called with each merged event
+        """
+        self._on_release = on_release
+        self._configs: Dict[str, CoalesceConfig] = {}
+        self._bursts: Dict[Tuple[Any, ...], _Burst] = {}
+        self._pending: set = set()  # Release calls still running
+        self._received = 0
+        self._released = 0
+    
+    def configure(self, event_type: str, config: Optional[CoalesceConfig]) -> None:
+        """Set or, with None, remove a topic's coalescing."""
+        if config is None:
+            self._configs.pop(event_type, None)
+        else:
+            self._configs[event_type] = config
+    
+    def add(self, event: Event) -> bool:
+        """
+        Hold an event in its entity's burst.
+        
+        Args:
+            event: Published event
+        
+        Returns:
+            True if the event was taken, False if it should be published as is
+        """
+        config = self._configs.get(event.event_type)
+        if config is None:
+            return False
+        changes = event.payload.get(config.merge_field)
+        if not isinstance(changes, dict):
+            return False
+        entity = tuple(event.payload.get(field) for field in config.key_fields)
+        if None in entity:
+            return False
+        
+        key = (event.event_type,) + entity
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        burst = self._bursts.get(key)
+        if burst is None:
+            burst = self._bursts[key] = _Burst(config, event, changes, now)
+            burst.timer = loop.call_at(now + config.window.total_seconds(), self._expire, key)
+        else:
+            # The timer is not moved on every update; it re-arms itself when it fires early
+            burst.changes.update(changes)
+            burst.latest = event
+            burst.count += 1
+            burst.last_at = now
+        self._received += 1
+        return True
+    
+    def drain(self) -> List[Event]:
+        """Release every held burst now, returning the merged events."""
+        bursts, self._bursts = self._bursts, {}
+        merged = []
+        for key, burst in bursts.items():
+            if burst.timer is not None:
+                burst.timer.cancel()
+            merged.append(self._merge(burst))
+        return merged
+    
+    async def wait_pending(self) -> None:
+        """Wait for releases that are still running."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+    
+    def stats(self) -> Dict[str, int]:
+        """Get the entities held, and updates received and released so far."""
+        return {
+            "held": len(self._bursts),
+            "received": self._received,
+            "released": self._released
+        }
+    
+    def _expire(self, key: Tuple[Any, ...]) -> None:
+        """Release a burst whose time is up, or re-arm for its new deadline."""
+        burst = self._bursts.get(key)
+        if burst is None:
+            return
+        config = burst.config
+        loop = asyncio.get_running_loop()
+        due = burst.last_at + config.window.total_seconds()
+        if config.max_delay is not None:
+            due = min(due, burst.first_at + config.max_delay.total_seconds())
+        if due > loop.time():
+            burst.timer = loop.call_at(due, self._expire, key)
+            return
+        
+        del self._bursts[key]
+        task = asyncio.create_task(self._on_release(self._merge(burst)))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+    
+    def _merge(self, burst: _Burst) -> Event:
+        """Build the event delivered for a burst."""
+        self._released += 1
+        latest = burst.latest
+        if burst.count == 1:
+            return latest
+        payload = dict(latest.payload)
+        payload[burst.config.merge_field] = burst.changes
+        payload["coalesced_count"] = burst.count
+        return Event._from_parts(
+            latest.event_type, payload, latest.source, latest.correlation_id, latest.timestamp_ns
+        )
@@ -0,0 +1,296 @@
+"""Pluggable event serialization: JSON and a compact binary format."""
+
+import json
+import marshal
+from abc import ABC, abstractmethod
+import struct
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Tuple, Union
+
+try:
+    import msgpack
+except ImportError:  # Optional; binary payloads fall back to marshal
+    msgpack = None
+
+from .events import Event, EventType
+from .exceptions import EventCodecError
+
+@dataclass(frozen=True)
+class EventSchema:
+    """Wire identity of an event type."""
+    type_id: int   # One byte on the wire; permanent once assigned
+    event_type: str
+    version: int   # Bumped when the payload layout changes
+
+_SCHEMAS_BY_TYPE: Dict[str, EventSchema] = {}
+_SCHEMAS_BY_ID: Dict[int, EventSchema] = {}
+_UPGRADERS: Dict[Tuple[str, int], Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+
+def register_event_schema(event_type: str, type_id: int, version: int = 1) -> None:
+    """
+    Assign an event type its wire ID and current payload schema version.
+    
+    IDs are written to journals and sent to other processes, so never reuse
+    or renumber one; give new event types new IDs.
+    
+    Args:
+        event_type: Event type string
+        type_id: Wire ID, 1-255
+        version: Current payload schema version, 1-255
+        
+    Raises:
+        ValueError: If the ID is out of range or taken by another type
+    """
+    if not 0 < type_id < 256 or not 0 < version < 256:
+        raise ValueError(f"type_id and version must be in 1-255, got {type_id} and {version}")
+    existing = _SCHEMAS_BY_ID.get(type_id)
+    if existing is not None and existing.event_type != event_type:
+        raise ValueError(f"Wire ID {type_id} is already assigned to {existing.event_type}")
+    schema = EventSchema(type_id=type_id, event_type=event_type, version=version)
+    _SCHEMAS_BY_TYPE[event_type] = schema
+    _SCHEMAS_BY_ID[type_id] = schema
+
+def register_payload_upgrader(event_type: str, from_version: int,
+                              upgrade: Callable[[Dict[str, Any]], Dict[str, Any]]) -> None:
+    """
+    Register a function that upgrades a payload from one schema version to the next.
+    
+    Binary-encoded events written with an older schema version are passed
+    through each upgrader in turn when decoded.
+    
+    Args:
+        event_type: Event type the upgrader applies to
+        from_version: Version the upgrader reads; it returns version + 1
+        upgrade: Function taking and returning a payload dictionary
+    """
+    _UPGRADERS[(event_type, from_version)] = upgrade
+
+# Wire IDs of the built-in event types. Fixed here rather than derived from
+# the enum's order, so adding or reordering EventType members leaves them be.
+_BUILTIN_TYPE_IDS: Dict[EventType, int] = {
+    EventType.SYSTEM_START: 1,
+    EventType.SYSTEM_SHUTDOWN: 2,
+    EventType.CONVERSATION_TURN: 3,
+    EventType.STATE_UPDATED: 4,
+    EventType.VISION_FRAME: 5,
+}
+
+for _event_type, _type_id in _BUILTIN_TYPE_IDS.items():
+    register_event_schema(_event_type.value, _type_id)
+
+class EventCodec(ABC):
+    """Base abstract class for event serializers."""
+    name = ""
+    
+    @abstractmethod
+    def encode(self, event: Event) -> bytes:
+        """
+        Serialize an event.
+        
+        Raises:
+            EventCodecError: If the event cannot be encoded
+        """
+        pass
+    
+    @abstractmethod
+    def decode(self, data: Union[bytes, memoryview]) -> Event:
+        """
+        Deserialize an event.
+        
+        Raises:
+            EventCodecError: If the data is not a valid encoded event
+        """
+        pass
+
+class JsonCodec(EventCodec):
+    """UTF-8 ``Event.to_json`` documents; readable, and compatible with older data."""
+    name = "json"
+    
+    def encode(self, event: Event) -> bytes:
+        try:
+            return event.to_json().encode("utf-8")
+        except (TypeError, ValueError) as e:
+            raise EventCodecError(f"Cannot encode {event.event_type} event: {e}") from e
+    
+    def decode(self, data: Union[bytes, memoryview]) -> Event:
+        try:
+            return Event.from_json(bytes(data).decode("utf-8"))
+        except (TypeError, ValueError, KeyError) as e:
+            raise EventCodecError(f"Invalid JSON event: {e}") from e
+
+# magic, format version, payload encoding, type ID, schema version,
+# timestamp_ns, source length, correlation ID length
+_HEADER = struct.Struct("!BBBBBqHH")
+_MAGIC = 0xAE
+_FORMAT_VERSION = 1
+PAYLOAD_FORMATS = {"json": 0, "msgpack": 1, "marshal": 2}
+_PAYLOAD_JSON = PAYLOAD_FORMATS["json"]
+_PAYLOAD_MSGPACK = PAYLOAD_FORMATS["msgpack"]
+_PAYLOAD_MARSHAL = PAYLOAD_FORMATS["marshal"]
+# Pinned so payloads stay readable by later Python versions
+_MARSHAL_VERSION = 4
+# Sources are a small, fixed set; cap the caches in case they are not
+_MAX_INTERNED = 1024
+
+class BinaryCodec(EventCodec):
+    """
+    Compact binary encoding: a fixed struct header and the payload.
+    
+    The header carries the event type as a one-byte schema ID, so event
+    types cost one byte and payloads written under an older schema version
+    are upgraded on decode. The timestamp is the event's integer
+    nanoseconds, so no datetime is built on either side. Source strings are
+    interned: encoded bytes are cached per source, and decoded sources are
+    shared ``sys.intern`` strings.
+    
+    Payloads use msgpack when it is installed and ``marshal`` otherwise; each
+    message records its payload format, so any of them decodes whatever the
+    encoder's setting. ``marshal`` is several times faster than JSON but is
+    only safe on trusted data, such as this process's own journal; an
+    untrusted codec neither writes nor reads it.
+    """
+    name = "binary"
+    
+    def __init__(self, payload_format: str = "auto", trusted: bool = True):
+        """
+        Initialize the codec.
+        
+        Args:
+            payload_format: "msgpack", "marshal", "json", or "auto" for
+                msgpack if installed and otherwise marshal, or json when
+                not trusted
+            trusted: Whether decoded data comes only from trusted writers;
+                if False, marshal payloads are refused
+                
+        Raises:
+            ValueError: If the format is unknown, msgpack is not installed,
+                or marshal is asked for by an untrusted codec
+        """
+        if payload_format == "auto":
+            if msgpack is not None:
+                payload_format = "msgpack"
+            else:
+                payload_format = "marshal" if trusted else "json"
+        if payload_format not in PAYLOAD_FORMATS:
+            raise ValueError(f"Unknown payload format {payload_format!r}")
+        if payload_format == "marshal" and not trusted:
+            raise ValueError("payload_format 'marshal' is only safe for trusted data")
+        if payload_format == "msgpack" and msgpack is None:
+            raise ValueError("payload_format 'msgpack' requires the msgpack package")
+        self._payload_encoding = PAYLOAD_FORMATS[payload_format]
+        self._trusted = trusted
+        self._json_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+        self._encoded_sources: Dict[str, bytes] = {}
+        self._decoded_sources: Dict[bytes, str] = {}
+    
+    def encode(self, event: Event) -> bytes:
+        schema = _SCHEMAS_BY_TYPE.get(event.event_type)
+        if schema is None:
+            raise EventCodecError(f"No wire schema registered for {event.event_type}")
+        
+        source = self._encoded_sources.get(event.source)
+        if source is None:
+            source = event.source.encode("utf-8")
+            if len(self._encoded_sources) < _MAX_INTERNED:
+                self._encoded_sources[event.source] = source
+        correlation_id = event.correlation_id.encode("utf-8")
+        
+        try:
+            if self._payload_encoding == _PAYLOAD_MARSHAL:
+                payload = marshal.dumps(event.payload, _MARSHAL_VERSION)
+            elif self._payload_encoding == _PAYLOAD_MSGPACK:
+                payload = msgpack.packb(event.payload, use_bin_type=True)
+            else:
+                payload = self._json_encode(event.payload).encode("utf-8")
+            header = _HEADER.pack(
+                _MAGIC, _FORMAT_VERSION, self._payload_encoding, schema.type_id,
+                schema.version, event.timestamp_ns, len(source), len(correlation_id)
+            )
+        except (TypeError, ValueError, OverflowError, struct.error) as e:
+            raise EventCodecError(f"Cannot encode {event.event_type} event: {e}") from e
+        return b"".join((header, source, correlation_id, payload))
+    
+    def decode(self, data: Union[bytes, memoryview]) -> Event:
+        try:
+            (magic, format_version, payload_encoding, type_id, version,
+             timestamp_ns, source_len, correlation_len) = _HEADER.unpack_from(data)
+        except struct.error as e:
+            raise EventCodecError(f"Truncated event header: {e}") from e
+        if magic != _MAGIC or format_version != _FORMAT_VERSION:
+            raise EventCodecError(f"Not a binary event (magic {magic:#x}, format {format_version})")
+        schema = _SCHEMAS_BY_ID.get(type_id)
+        if schema is None:
+            raise EventCodecError(f"Unknown event type ID {type_id}")
+        
+        offset = _HEADER.size
+        end = offset + source_len
+        if end + correlation_len > len(data):
+            raise EventCodecError("Truncated event body")
+        raw_source = bytes(data[offset:end])
+        offset, end = end, end + correlation_len
+        try:
+            source = self._decoded_sources.get(raw_source)
+            if source is None:
+                source = sys.intern(raw_source.decode("utf-8"))
+                if len(self._decoded_sources) < _MAX_INTERNED:
+                    self._decoded_sources[raw_source] = source
+            correlation_id = bytes(data[offset:end]).decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise EventCodecError(f"Invalid event source or correlation ID: {e}") from e
+        
+        try:
+            if payload_encoding == _PAYLOAD_MARSHAL:
+                if not self._trusted:
+                    raise EventCodecError("Refusing a marshal-encoded payload from untrusted data")
+                payload = marshal.loads(data[end:])
+            elif payload_encoding == _PAYLOAD_JSON:
+                payload = json.loads(bytes(data[end:]))
+            elif payload_encoding == _PAYLOAD_MSGPACK:
+                if msgpack is None:
+                    raise EventCodecError("Event payload is msgpack-encoded but msgpack is not installed")
+                payload = msgpack.unpackb(data[end:], raw=False)
+            else:
+                raise EventCodecError(f"Unknown payload encoding {payload_encoding}")
+        except (ValueError, TypeError, EOFError) as e:
+            raise EventCodecError(f"Invalid event payload: {e}") from e
+        if not isinstance(payload, dict):
+            raise EventCodecError("Event payload is not a dictionary")
+        
+        if version != schema.version:
+            payload = _upgrade_payload(schema, version, payload)
+        return Event._from_parts(schema.event_type, payload, source, correlation_id, timestamp_ns)
+
+def _upgrade_payload(schema: EventSchema, version: int, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Bring a payload written under an older schema version up to date."""
+    if version > schema.version:
+        raise EventCodecError(
+            f"{schema.event_type} schema version {version} is newer than supported version {schema.version}"
+        )
+    while version < schema.version:
+        upgrade = _UPGRADERS.get((schema.event_type, version))
+        if upgrade is None:
+            raise EventCodecError(f"No upgrader for {schema.event_type} schema version {version}")
+        payload = upgrade(payload)
+        version += 1
+    return payload
+
+_CODECS: Dict[str, Callable[[], EventCodec]] = {
+    JsonCodec.name: JsonCodec,
+    BinaryCodec.name: BinaryCodec,
+}
+
+def get_codec(name: str) -> EventCodec:
+    """
+    Create a codec by name.
+    
+    Args:
+        name: "json" or "binary"
+        
+    Raises:
+        ValueError: If the name is unknown
+    """
+    try:
+        return _CODECS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown codec {name!r}; expected one of {sorted(_CODECS)}") from None
@@ -0,0 +1,264 @@
+"""SQLite-backed store for event deliveries that exhausted their retries."""
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Iterator, List, Optional, Tuple, Union
+
+from .events import Event
+
+CREATE_DEAD_LETTERS_TABLE = """
+CREATE TABLE IF NOT EXISTS dead_letters (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    correlation_id TEXT NOT NULL,
+    subscriber TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    events JSON NOT NULL,
+    batched INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL,
+    error TEXT,
+    failed_at TEXT NOT NULL
+);
+"""
+
+CREATE_DEAD_LETTERS_CORRELATION_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_dead_letters_correlation_id ON dead_letters(correlation_id);
+"""
+
+CREATE_DEAD_LETTERS_SUBSCRIBER_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_dead_letters_subscriber ON dead_letters(subscriber);
+"""
+
+# Every event in a letter, so a batch can be found by any of its members
+CREATE_DEAD_LETTER_EVENTS_TABLE = """
+CREATE TABLE IF NOT EXISTS dead_letter_events (
+    letter_id INTEGER NOT NULL REFERENCES dead_letters(id) ON DELETE CASCADE,
+    correlation_id TEXT NOT NULL
+);
+"""
+
+CREATE_DEAD_LETTER_EVENTS_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_dead_letter_events_correlation_id
+ON dead_letter_events(correlation_id);
+"""
+
+INSERT_DEAD_LETTER = """
+INSERT INTO dead_letters (
+    correlation_id, subscriber, event_type, events, batched, attempts, error, failed_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?);
+"""
+
+INSERT_DEAD_LETTER_EVENT = """
+INSERT INTO dead_letter_events (letter_id, correlation_id) VALUES (?, ?);
+"""
+
+TRIM_DEAD_LETTERS = """
+DELETE FROM dead_letters WHERE id IN (
+    SELECT id FROM dead_letters ORDER BY id ASC LIMIT ?
+);
+"""
+
+@dataclass
+class DeadLetter:
+    """A delivery that failed every attempt, as persisted."""
+    id: int
+    correlation_id: str  # Of the last event, for a batch
+    subscriber: str
+    event_type: str
+    events: List[Event]
+    batched: bool  # Whether the subscriber receives List[Event]
+    attempts: int
+    error: Optional[str]
+    failed_at: datetime
+    
+    @classmethod
+    def from_db_row(cls, row: sqlite3.Row) -> 'DeadLetter':
+        """Create instance from database row."""
+        return cls(
+            id=row['id'],
+            correlation_id=row['correlation_id'],
+            subscriber=row['subscriber'],
+            event_type=row['event_type'],
+            events=[Event.from_json(item) for item in json.loads(row['events'])],
+            batched=bool(row['batched']),
+            attempts=row['attempts'],
+            error=row['error'],
+            failed_at=datetime.fromisoformat(row['failed_at'])
+        )
+
+class DeadLetterStore:
+    """
+    Append-only log of failed deliveries in a SQLite table.
+    
+    Letters are written with ``Event.to_json`` and indexed by correlation ID
+    and subscriber; a batch letter is indexed under every event in it. Nothing is held in memory: queries and replay stream from
+    the table, and the table is trimmed to ``max_records`` (oldest first), so
+    memory and disk stay bounded however many deliveries fail in an outage.
+    """
+    
+    def __init__(self, path: Union[str, Path, None] = None, max_records: int = 10_000):
+        """
+        Initialize the store.
+        
+        Args:
+            path: SQLite database file; None keeps the table in memory
+            max_records: Maximum letters kept before the oldest are discarded
+        """
+        if max_records <= 0:
+            raise ValueError(f"max_records must be positive, got {max_records}")
+        self._max_records = max_records
+        self._lock = Lock()
+        
+        if path is None:
+            target = ":memory:"
+        else:
+            target = Path(path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+        # Appends come from executor threads; the lock serialises them
+        self._conn = sqlite3.connect(target, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        # Trimming and deleting letters cascades to their event index
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute(CREATE_DEAD_LETTERS_TABLE)
+        self._conn.execute(CREATE_DEAD_LETTERS_CORRELATION_INDEX)
+        self._conn.execute(CREATE_DEAD_LETTERS_SUBSCRIBER_INDEX)
+        self._conn.execute(CREATE_DEAD_LETTER_EVENTS_TABLE)
+        self._conn.execute(CREATE_DEAD_LETTER_EVENTS_INDEX)
+        self._conn.commit()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM dead_letters").fetchone()[0]
+    
+    def append(self, events: Union[Event, List[Event]], subscriber: str,
+               attempts: int, error: Optional[BaseException] = None) -> None:
+        """
+        Persist a failed delivery.
+        
+        Args:
+            events: Event, or batch of events, that could not be delivered
+            subscriber: Name of the subscriber that failed
+            attempts: Number of delivery attempts made
+            error: Last error raised by the subscriber
+        """
+        batched = isinstance(events, list)
+        items = events if batched else [events]
+        last = items[-1]
+        row = (
+            last.correlation_id,
+            subscriber,
+            last.event_type,
+            json.dumps([event.to_json() for event in items]),
+            int(batched),
+            attempts,
+            None if error is None else f"{type(error).__name__}: {error}",
+            datetime.now().isoformat()
+        )
+        with self._lock:
+            letter_id = self._conn.execute(INSERT_DEAD_LETTER, row).lastrowid
+            if batched:
+                self._conn.executemany(
+                    INSERT_DEAD_LETTER_EVENT,
+                    [(letter_id, event.correlation_id) for event in items]
+                )
+            self._count += 1
+            if self._count > self._max_records:
+                excess = self._count - self._max_records
+                self._conn.execute(TRIM_DEAD_LETTERS, (excess,))
+                self._count -= excess
+            self._conn.commit()
+    
+    def query(self, correlation_id: Optional[str] = None,
+              subscriber: Optional[str] = None, limit: int = 100) -> List[DeadLetter]:
+        """
+        Look up dead letters, oldest first.
+        
+        Args:
+            correlation_id: Only letters for this correlation ID
+            subscriber: Only letters for this subscriber
+            limit: Maximum number of letters to return
+            
+        Returns:
+            Matching dead letters
+        """
+        where, params = self._filter(correlation_id, subscriber)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM dead_letters{where} ORDER BY id ASC LIMIT ?",
+                params + (limit,)
+            ).fetchall()
+        return [DeadLetter.from_db_row(row) for row in rows]
+    
+    def iter_letters(self, correlation_id: Optional[str] = None,
+                     subscriber: Optional[str] = None,
+                     chunk_size: int = 100) -> Iterator[DeadLetter]:
+        """
+        Stream matching dead letters, oldest first, in bounded chunks.
+        
+        Only letters already stored when iteration starts are yielded, so
+        letters re-appended by a failed replay are not picked up again.
+        Deleting yielded letters while iterating is safe.
+        
+        Args:
+            correlation_id: Only letters for this correlation ID
+            subscriber: Only letters for this subscriber
+            chunk_size: Rows fetched per query
+        """
+        where, params = self._filter(correlation_id, subscriber)
+        where = f"{where} AND id > ? AND id <= ?" if where else " WHERE id > ? AND id <= ?"
+        with self._lock:
+            end_id = self._conn.execute("SELECT MAX(id) FROM dead_letters").fetchone()[0]
+        if end_id is None:
+            return
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT * FROM dead_letters{where} ORDER BY id ASC LIMIT ?",
+                    params + (last_id, end_id, chunk_size)
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                last_id = row['id']
+                yield DeadLetter.from_db_row(row)
+    
+    def delete(self, letter_id: int) -> None:
+        """Remove a letter, e.g. once it has been redelivered."""
+        with self._lock:
+            if self._conn.execute("DELETE FROM dead_letters WHERE id = ?", (letter_id,)).rowcount:
+                self._count -= 1
+            self._conn.commit()
+    
+    def count(self) -> int:
+        """Number of letters currently stored."""
+        return self._count
+    
+    def clear(self) -> None:
+        """Remove every letter."""
+        with self._lock:
+            self._conn.execute("DELETE FROM dead_letters")
+            self._conn.commit()
+            self._count = 0
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+    
+    @staticmethod
+    def _filter(correlation_id: Optional[str],
+                subscriber: Optional[str]) -> Tuple[str, tuple]:
+        """Build the WHERE clause for the optional lookup keys."""
+        clauses, params = [], []
+        if correlation_id is not None:
+            clauses.append(
+                "(correlation_id = ? OR id IN "
+                "(SELECT letter_id FROM dead_letter_events WHERE correlation_id = ?))"
+            )
+            params.extend((correlation_id, correlation_id))
+        if subscriber is not None:
+            clauses.append("subscriber = ?")
+            params.append(subscriber)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, tuple(params)
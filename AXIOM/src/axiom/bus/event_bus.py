@@ -1,95 +1,316 @@
-from typing import Dict, List, Callable, Set, Optional
-from queue import Queue
+from typing import Any, Deque, Dict, Iterable, List, Callable, Set, Optional, Tuple, Union
+from collections import deque
 import asyncio
+import inspect
+import multiprocessing
+import os
+import time
 from threading import Lock
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
+from enum import Enum
+from pathlib import Path
 
 from .events import Event, EventType
+from .routing import RoutingTable, is_pattern, validate_pattern
+from .subscription import (
+    Subscription, DEFAULT_BATCH_LINGER, ExecutionMode, handler_name, is_coroutine_handler
+)
+from .batching import BatchAccumulator
+from .coalescing import CoalesceConfig, EventCoalescer
+from .queues import EventQueue, EventPriority, OverflowConfig, OverflowPolicy, PutResult
+from .scheduling import RetryScheduler
+from .dead_letters import DeadLetter, DeadLetterStore
+from .tracking import DeliveryRecord, DeliveryStatus, DeliveryTracker
+from .journal import EventJournal
+from .resilience import BreakerConfig, CircuitBreaker, CircuitState
 from .exceptions import (
     EventBusException, InvalidEventTypeError,
-    UnregisteredPublisherError, EventDeliveryError
+    UnregisteredPublisherError, EventDeliveryError, CircuitOpenError,
+    RequestTimeoutError
 )
 from axiom.utils.logging import get_logger, log_event_bus_activity, PerformanceLogger, log_error
-from axiom.utils.errors import ErrorCode, EventBusError
+from axiom.utils.errors import ErrorCode, EventBusError, RetryConfig
+from axiom.utils.metrics import Counter, Histogram, MetricsRegistry
 
 logger = get_logger(__name__)
 
-@dataclass
-class DeliveryRecord:
-    """Record of event delivery attempt."""
-    event: Event
-    subscriber: Callable
-    attempts: int = 0
-    last_attempt: Optional[datetime] = None
-    error: Optional[Exception] = None
-    
-    def should_retry(self, max_attempts: int, retry_delay: timedelta) -> bool:
-        """Check if event should be retried based on attempt count and delay."""
-        if self.attempts >= max_attempts:
-            return False
-        if self.last_attempt is None:
-            return True
-        return datetime.now() - self.last_attempt >= retry_delay
+class DeliveryOrdering(Enum):
+    """Ordering guarantees kept between concurrent dispatch workers."""
+    UNORDERED = "unordered"                    # Any worker may take any event
+    PER_EVENT_TYPE = "per_event_type"          # FIFO within each event type
+    PER_CORRELATION_ID = "per_correlation_id"  # FIFO within each correlation ID
+
+class _PendingRequest:
+    """A request awaiting its reply."""
+    __slots__ = ("request", "reply_type", "future", "timer")
+    
+    def __init__(self, request: Event, reply_type: Optional[str], future: asyncio.Future):
+        self.request = request
+        self.reply_type = reply_type
+        self.future = future
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+class _TopicMetrics:
+    """Metrics kept per event type, looked up once and cached."""
+    __slots__ = ("published", "dropped", "enqueue_time", "queue_wait")
+    
+    def __init__(self, registry: MetricsRegistry, event_type: str):
+        self.published: Counter = registry.counter("bus_published_total", topic=event_type)
+        self.dropped: Counter = registry.counter("bus_dropped_total", topic=event_type)
+        self.enqueue_time: Histogram = registry.histogram("bus_enqueue_seconds", topic=event_type)
+        self.queue_wait: Histogram = registry.histogram("bus_queue_wait_seconds", topic=event_type)
+
+class _SubscriberMetrics:
+    """Metrics kept per subscription, looked up once and cached."""
+    __slots__ = ("delivered", "failed", "retries", "handler_time")
+    
+    def __init__(self, registry: MetricsRegistry, subscription: Subscription):
+        labels = {"subscriber": subscription.name, "pattern": subscription.pattern}
+        self.delivered: Counter = registry.counter("bus_delivered_total", **labels)
+        self.failed: Counter = registry.counter("bus_delivery_failures_total", **labels)
+        self.retries: Counter = registry.counter("bus_retries_total", **labels)
+        self.handler_time: Histogram = registry.histogram("bus_handler_seconds", **labels)
 
 class EventBus:
     """
     Central event bus implementation that handles publisher-subscriber pattern.
     Provides asynchronous, decoupled communication between system components.
+
+    Events are queued on an asyncio-native ``EventQueue`` owned by the running
+    event loop, so publishing and dispatching never leave the loop thread.
+    Coroutine handlers are awaited directly; only synchronous handlers are
+    sent to the worker thread pool. When the queue fills up, each topic's
+    overflow policy decides whether publishers wait, or events are dropped
+    or coalesced. Topics can be assigned priority lanes so safety-critical
+    events are not stuck behind a backlog of bulk traffic.
+
+    Several dispatch workers drain the queue concurrently, so a slow
+    subscriber only holds up events that share its ordering key.
+
+    Throughput counters and latency histograms are kept per topic and per
+    subscriber in a ``MetricsRegistry``; see ``get_metrics``.
     """
     
     def __init__(self, max_events: int = 1000, 
                  max_retry_attempts: int = 3,
                  retry_delay: timedelta = timedelta(seconds=1),
-                 num_workers: int = 4):
+                 num_workers: int = 4,
+                 num_dispatchers: int = 4,
+                 ordering: DeliveryOrdering = DeliveryOrdering.PER_EVENT_TYPE,
+                 overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                 publish_timeout: Optional[timedelta] = None,
+                 lane_weights: Optional[Dict[EventPriority, int]] = None,
+                 max_lane_wait: Optional[timedelta] = timedelta(seconds=1),
+                 dead_letter_path: Union[str, Path, None] = None,
+                 max_dead_letters: int = 10_000,
+                 max_tracked_deliveries: int = 1000,
+                 delivery_record_ttl: Optional[timedelta] = timedelta(minutes=5),
+                 journal: Optional[EventJournal] = None,
+                 journal_sync: bool = True,
+                 subscriber_concurrency: Optional[int] = None,
+                 circuit_breaker: Optional[BreakerConfig] = BreakerConfig(),
+                 metrics: Optional[MetricsRegistry] = None,
+                 stop_timeout: Optional[timedelta] = timedelta(seconds=5)):
         """
         Initialize the Event Bus with publisher-subscriber infrastructure.
         
         Args:
             max_events: Maximum number of events allowed in the queue
             max_retry_attempts: Maximum number of delivery attempts per event
-            retry_delay: Time to wait between retry attempts
-            num_workers: Number of worker threads for event processing
+            retry_delay: Wait before the first retry; later retries back off
+                exponentially per RetryConfig
+            num_workers: Number of worker threads for synchronous handlers
+            num_dispatchers: Number of concurrent dispatch workers draining the queue
+            ordering: Ordering guarantee kept between dispatch workers
+            overflow_policy: Default overflow policy for topics without their own
+                (COALESCE needs a key, so set it per topic)
+            publish_timeout: Default time a blocked publisher waits for room;
+                None waits indefinitely
+            lane_weights: Dequeues per scheduling round for each priority lane
+            max_lane_wait: Age at which a lane's oldest event may jump ahead of
+                the weights once per round; None disables it
+            dead_letter_path: SQLite file for failed deliveries, so they survive
+                restarts; None keeps them in memory
+            max_dead_letters: Dead letters kept before the oldest are discarded
+            max_tracked_deliveries: Completed deliveries kept for diagnostics
+            delivery_record_ttl: Age after which completed deliveries are
+                forgotten; None keeps them until pushed out by newer ones
+            journal: Write-ahead journal; events are recorded when published
+                and acknowledged once every subscriber has them, and
+                unacknowledged events are redelivered on the next start
+            journal_sync: Make publish wait until its events are durable in
+                the journal (group commit); if False a crash may lose the
+                last few milliseconds of published events
+            subscriber_concurrency: Default limit on calls in flight per
+                subscription, for those subscribed without max_concurrency
+            circuit_breaker: Per-subscription breaker settings; while a
+                subscriber's breaker is open its deliveries go straight to
+                the dead letters instead of its handler. None disables it
+            metrics: Registry to record bus metrics in, e.g. one shared with
+                other components; None gives the bus its own
+            stop_timeout: Time stop() lets in-flight deliveries finish before
+                cancelling them; None waits indefinitely
         """
+        if num_dispatchers <= 0:
+            raise ValueError(f"num_dispatchers must be positive, got {num_dispatchers}")
+        if subscriber_concurrency is not None and subscriber_concurrency <= 0:
+            raise ValueError(f"subscriber_concurrency must be positive, got {subscriber_concurrency}")
+
         # Core data structures
-        self._subscribers: Dict[str, Set[Callable[[Event], None]]] = {}
+        self._routes = RoutingTable()  # Copy-on-write; read without the lock
         self._publishers: Dict[str, Set[str]] = {}
-        self._event_queue: Queue = Queue(maxsize=max_events)
-        self._dead_letter_queue: Queue = Queue()  # For failed deliveries
+        self._event_queue = EventQueue(
+            maxsize=max_events,
+            default=OverflowConfig(policy=overflow_policy, timeout=publish_timeout),
+            lane_weights=lane_weights,
+            max_lane_wait=max_lane_wait,
+            on_discard=self._journal_discarded,
+            on_dequeue=self._record_queue_wait
+        )
+        # Failed deliveries; bounded, and persistent when given a path
+        self._dead_letters = DeadLetterStore(dead_letter_path, max_records=max_dead_letters)
         
         # Delivery tracking
-        self._delivery_records: Dict[str, DeliveryRecord] = {}
+        self._deliveries = DeliveryTracker(
+            max_completed=max_tracked_deliveries,
+            ttl=delivery_record_ttl
+        )
         self._max_retry_attempts = max_retry_attempts
         self._retry_delay = retry_delay
+        # Failed deliveries wait here, off the dispatch path, until due
+        self._retry_scheduler: RetryScheduler[DeliveryRecord] = RetryScheduler(
+            fire=self._deliver_to_subscriber
+        )
+        
+        # Crash safety: remaining deliveries per journaled event sequence
+        self._journal = journal
+        self._journal_sync = journal_sync
+        self._journal_outstanding: Dict[int, int] = {}
         
         # Thread management
         self._lock = Lock()
         self._executor = ThreadPoolExecutor(max_workers=num_workers)
         self._running = False
         
+        # Dispatch workers and per-key ordering state. A key present in
+        # _ordering_backlogs is owned by one worker; events for it that other
+        # workers dequeue are parked in its backlog and delivered in order.
+        # Parked events keep their queue slot, so backlogs stay bounded.
+        self._num_dispatchers = num_dispatchers
+        self._ordering = ordering
+        self._dispatch_tasks: List[asyncio.Task] = []
+        # Workers waiting on an empty queue; they hold no event, so stop()
+        # can cancel them without losing anything
+        self._idle_dispatchers: Set[asyncio.Task] = set()
+        self._stop_timeout = None if stop_timeout is None else stop_timeout.total_seconds()
+        self._ordering_backlogs: Dict[str, Deque[Event]] = {}
+        
+        # Pending batches for subscriptions that receive List[Event]
+        self._batchers: Dict[Subscription, BatchAccumulator] = {}
+        
+        # Bursts of updates held per entity until they can be merged
+        self._coalescer = EventCoalescer(on_release=self._publish_coalesced)
+        
+        # Requests awaiting a reply, by correlation ID
+        self._pending_requests: Dict[str, _PendingRequest] = {}
+        
+        # Per-subscription executors (dedicated threads, process pools) and
+        # concurrency limits, keeping heavy handlers off the shared pool
+        self._isolated: Dict[Subscription, Executor] = {}
+        self._limits: Dict[Subscription, asyncio.Semaphore] = {}
+        self._subscriber_concurrency = subscriber_concurrency
+        
+        # Shed deliveries to subscribers that keep failing
+        self._breaker_config = circuit_breaker
+        self._breakers: Dict[Subscription, CircuitBreaker] = {}
+        
+        # Counters and latency histograms, cached per topic and subscription
+        self._metrics = metrics if metrics is not None else MetricsRegistry()
+        self._topic_metrics: Dict[str, _TopicMetrics] = {}
+        self._subscriber_metrics: Dict[Subscription, _SubscriberMetrics] = {}
+        
         logger.info(
             "Event bus initialized",
             max_events=max_events,
             max_retry_attempts=max_retry_attempts,
             retry_delay_seconds=retry_delay.total_seconds(),
-            num_workers=num_workers
+            num_workers=num_workers,
+            num_dispatchers=num_dispatchers,
+            ordering=ordering.value,
+            overflow_policy=overflow_policy.value
         )
         
     async def start(self) -> None:
-        """Start the event processing loop."""
-        logger.info("Starting event bus processing loop")
+        """Start the dispatch workers and run them until stopped."""
+        logger.info(
+            "Starting event bus processing loop",
+            num_dispatchers=self._num_dispatchers,
+            ordering=self._ordering.value
+        )
         self._running = True
+        self._dispatch_tasks = [
+            asyncio.create_task(self._process_events_loop())
+            for _ in range(self._num_dispatchers)
+        ]
+        if self._journal is not None:
+            await self._recover_journal()
         
-        await self._process_events_loop()
+        try:
+            await asyncio.gather(*self._dispatch_tasks)
+        except asyncio.CancelledError:
+            if self._running:
+                raise
+        finally:
+            self._dispatch_tasks = []
         
     async def stop(self) -> None:
         """Stop the event processing loop."""
         logger.info("Stopping event bus processing loop")
+        # Queue held updates while the workers can still make room for them
+        for event in self._coalescer.drain():
+            await self._publish_coalesced(event)
+        await self._coalescer.wait_pending()
         self._running = False
+        for pending in list(self._pending_requests.values()):
+            pending.timer.cancel()
+            if not pending.future.done():
+                pending.future.set_exception(EventDeliveryError("Event bus stopped before a reply arrived"))
+        self._pending_requests.clear()
+        await self._stop_dispatchers()
+        await self._flush_batches()
+        
+        # Retries that are not yet due will never run
+        self._abandon_retries(await self._retry_scheduler.stop())
+        
+        if self._journal is not None:
+            await self._journal.close()
         self._executor.shutdown(wait=True)
+        for executor in self._isolated.values():
+            executor.shutdown(wait=True)
+        self._isolated.clear()
         logger.info("Event bus stopped")
         
+    async def _stop_dispatchers(self) -> None:
+        """Let in-flight deliveries finish, then wait for every worker to exit."""
+        tasks = list(self._dispatch_tasks)
+        if not tasks:
+            return
+        # Idle workers would wait on the queue forever; get() is cancel-safe
+        for task in self._idle_dispatchers:
+            task.cancel()
+        done, pending = await asyncio.wait(tasks, timeout=self._stop_timeout)
+        if pending:
+            logger.warning(
+                "Cancelling deliveries still in flight at stop",
+                workers=len(pending),
+                timeout_seconds=self._stop_timeout
+            )
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        
     def register_publisher(self, publisher_name: str, event_types: List[str]) -> None:
         """
         Register a publisher with the event types it can publish.
@@ -102,7 +323,7 @@ class EventBus:
             InvalidEventTypeError: If any event type is not valid
         """
         # Validate event types
-        invalid_types = [et for et in event_types if et not in EventType.values()]
+        invalid_types = [et for et in event_types if not EventType.is_valid(et)]
         if invalid_types:
             error = EventBusError(
                 error_code=ErrorCode.BUS_INVALID_EVENT_TYPE,
@@ -135,84 +356,170 @@ class EventBus:
                 del self._publishers[publisher_name]
                 logger.debug(f"Unregistered publisher {publisher_name}")
 
-    def subscribe(self, event_type: str, handler: Callable[[Event], None]) -> None:
+    def subscribe(self, event_type: str, handler: Callable[[Event], None],
+                  batch_size: Optional[int] = None,
+                  batch_linger: timedelta = DEFAULT_BATCH_LINGER,
+                  execution: ExecutionMode = ExecutionMode.AUTO,
+                  max_concurrency: Optional[int] = None) -> None:
         """
-        Subscribe a handler to a specific event type.
+        Subscribe a handler to an event type or a topic pattern.
+        
+        Patterns use dotted wildcard segments: ``*`` matches one segment and
+        ``#`` matches zero or more, so ``system.*`` receives ``system.start``
+        and ``system.shutdown`` and ``#`` receives every event.
+        
+        With ``batch_size`` set, the handler is called with a ``List[Event]``
+        instead of a single event. A batch is delivered once it holds
+        ``batch_size`` events or its first event has waited ``batch_linger``.
+        
+        ``execution`` picks where the handler runs. By default coroutine
+        functions are awaited on the event loop and plain functions share
+        the bus's worker threads. CPU-heavy handlers should use
+        DEDICATED_THREADS (for code that releases the GIL) or PROCESS_POOL
+        (for pure Python; the handler must be a picklable module-level
+        function and events are pickled to it), so they cannot starve other
+        subscribers. INLINE runs a plain function on the loop thread and
+        suits only trivial handlers.
+        
+        ``max_concurrency`` caps how many calls to this handler may run at
+        once, in any mode, and sizes its dedicated pool (one thread, or one
+        process per CPU, when unset).
+        
+        Subscribing a handler again with the same pattern is a no-op that
+        logs a warning; the first subscription's options stay in effect.
+        Unsubscribe first to change them.
         
         Args:
-            event_type: Type of event to subscribe to
+            event_type: Type of event, or topic pattern, to subscribe to
             handler: Callback function that will handle the event
+            batch_size: Opt in to batched delivery with this maximum batch size
+            batch_linger: Maximum time a partial batch waits before delivery
+            execution: Where the handler runs
+            max_concurrency: Maximum calls to the handler in flight at once
             
         Raises:
-            InvalidEventTypeError: If event type is not valid
+            InvalidEventTypeError: If event type is not valid or the pattern
+                is malformed
+            ValueError: If the batch or execution options are invalid
         """
-        if event_type not in EventType.values():
+        try:
+            if is_pattern(event_type):
+                validate_pattern(event_type)
+            elif not EventType.is_valid(event_type):
+                raise InvalidEventTypeError(f"Invalid event type: {event_type}")
+        except InvalidEventTypeError as e:
             error = EventBusError(
                 error_code=ErrorCode.BUS_INVALID_EVENT_TYPE,
-                message=f"Invalid event type: {event_type}",
+                message=str(e),
                 details={"event_type": event_type}
             )
             log_error(logger, error)
-            raise InvalidEventTypeError(f"Invalid event type: {event_type}")
+            raise
             
-        with self._lock:
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = set()
-            self._subscribers[event_type].add(handler)
-            log_event_bus_activity(
-                logger,
+        subscription = Subscription(
+            pattern=event_type,
+            handler=handler,
+            batch_size=batch_size,
+            batch_linger=batch_linger,
+            execution=execution,
+            max_concurrency=max_concurrency
+        )
+        if not self._routes.add(subscription):
+            logger.warning(
+                "Handler already subscribed; keeping its existing subscription and options",
                 event_type=event_type,
-                action="subscriber_added",
-                handler=handler.__name__ if hasattr(handler, '__name__') else str(handler)
+                handler=subscription.name
             )
+            return
+        if subscription.batched:
+            self._batchers[subscription] = BatchAccumulator(
+                max_size=subscription.batch_size,
+                linger=subscription.batch_linger.total_seconds(),
+                on_linger=lambda batch, sub=subscription: self._deliver(sub, batch)
+            )
+        self._setup_execution(subscription)
+        log_event_bus_activity(
+            logger,
+            event_type=event_type,
+            action="subscriber_added",
+            handler=handler.__name__ if hasattr(handler, '__name__') else str(handler),
+            batch_size=batch_size,
+            execution=execution.value,
+            max_concurrency=max_concurrency
+        )
     
     def unsubscribe(self, event_type: str, handler: Callable[[Event], None]) -> None:
         """
         Remove a handler's subscription to an event type.
         
         Args:
-            event_type: Type of event to unsubscribe from
+            event_type: Type of event, or pattern, the handler subscribed with
             handler: Handler to remove from subscribers
         """
-        with self._lock:
-            if event_type in self._subscribers and handler in self._subscribers[event_type]:
-                self._subscribers[event_type].remove(handler)
-                if not self._subscribers[event_type]:
-                    del self._subscribers[event_type]
-                logger.debug(f"Removed subscriber for event type: {event_type}")
+        subscription = self._routes.remove(event_type, handler)
+        if subscription is not None:
+            batcher = self._batchers.pop(subscription, None)
+            if batcher is not None:
+                # Hand over what was already collected rather than drop it
+                batch = batcher.drain()
+                if batch:
+                    asyncio.ensure_future(self._deliver(subscription, batch))
+            self._limits.pop(subscription, None)
+            self._breakers.pop(subscription, None)
+            self._subscriber_metrics.pop(subscription, None)
+            executor = self._isolated.pop(subscription, None)
+            if executor is not None:
+                # Calls already submitted still run; later ones use the shared pool
+                executor.shutdown(wait=False)
+            logger.debug(f"Removed subscriber for event type: {event_type}")
 
-    async def publish(self, event: Event) -> None:
+    async def publish(self, event: Event) -> bool:
         """
         Publish an event to all subscribers asynchronously.
         
         Args:
             event: Event instance to publish
             
+        Returns:
+            True if the event was queued, coalesced into a queued event or
+            held to be merged with later updates, False if its topic's
+            overflow policy dropped it
+            
         Raises:
             UnregisteredPublisherError: If publisher is not registered for this event type
+            EventQueueFullError: If the queue stayed full past the publish timeout
+            EventCodecError: If a journal is configured and the event cannot
+                be encoded for it
         """
+        started = time.perf_counter()
         with PerformanceLogger(logger, "event_publish", event_type=event.event_type, source=event.source):
             # Verify publisher registration
-            if event.source not in self._publishers or \
-                event.event_type not in self._publishers[event.source]:
-                error = EventBusError(
-                    error_code=ErrorCode.BUS_UNREGISTERED_PUBLISHER,
-                    message=f"Publisher {event.source} is not registered to publish {event.event_type}",
-                    details={"publisher": event.source, "event_type": event.event_type}
-                )
-                log_error(logger, error)
-                raise UnregisteredPublisherError(
-                    f"Publisher {event.source} is not registered to publish {event.event_type}"
-                )
+            self._check_publisher(event.source, event.event_type)
+            metrics = self._topic(event.event_type)
+            if self._pending_requests:
+                self._resolve_request(event)
+            if self._coalescer.add(event):
+                metrics.published.inc()
+                return True
+            if self._journal is not None:
+                await self._journal_append([event])
             
             # Add event to queue
+            queued = False
             try:
-                loop = asyncio.get_running_loop()
-                await loop.run_in_executor(
-                    self._executor, 
-                    self._event_queue.put,
-                    event
-                )
+                result = await self._event_queue.put(event)
+                queued = True
+                if result is PutResult.DROPPED:
+                    metrics.dropped.inc()
+                    self._journal_discarded(event)
+                    logger.debug(
+                        "Event dropped by overflow policy",
+                        event_type=event.event_type,
+                        correlation_id=event.correlation_id
+                    )
+                    return False
+                metrics.enqueue_time.record(time.perf_counter() - started)
+                metrics.published.inc()
                 log_event_bus_activity(
                     logger,
                     event_type=event.event_type,
@@ -220,7 +527,11 @@ class EventBus:
                     source=event.source,
                     correlation_id=event.correlation_id
                 )
+                return True
             except Exception as e:
+                if not queued:
+                    # The caller is told it failed; do not redeliver it after a restart
+                    self._journal_discarded(event)
                 error = EventBusError(
                     error_code=ErrorCode.BUS_QUEUE_FULL,
                     message="Failed to add event to queue",
@@ -230,29 +541,397 @@ class EventBus:
                 log_error(logger, error)
                 raise
     
+    async def publish_many(self, events: Iterable[Event]) -> int:
+        """
+        Publish a batch of events with per-batch rather than per-event overhead.
+        
+        Publisher registration is checked once per distinct (source, event
+        type) pair, and the batch is timed and logged as a single operation.
+        Events are queued in the order given, and each one's enqueue time is
+        measured from the start of the call.
+        
+        Args:
+            events: Events to publish
+            
+        Returns:
+            Number of events queued, coalesced or held for merging; the rest
+            were dropped by their topic's overflow policy
+            
+        Raises:
+            UnregisteredPublisherError: If any publisher is not registered for
+                its event type; no event from the batch is queued in that case
+            EventQueueFullError: If the queue stayed full past the publish timeout
+            EventCodecError: If a journal is configured and an event cannot
+                be encoded for it
+        """
+        started = time.perf_counter()
+        events = list(events)
+        if not events:
+            return 0
+        
+        event_types = sorted({event.event_type for event in events})
+        with PerformanceLogger(logger, "event_publish_batch", batch_size=len(events)):
+            for source, event_type in {(e.source, e.event_type) for e in events}:
+                self._check_publisher(source, event_type)
+            if self._pending_requests:
+                for event in events:
+                    self._resolve_request(event)
+            held = len(events)
+            queued = []
+            for event in events:
+                if self._coalescer.add(event):
+                    self._topic(event.event_type).published.inc()
+                else:
+                    queued.append(event)
+            events = queued
+            held -= len(events)
+            if self._journal is not None and events:
+                await self._journal_append(events)
+            
+            offered = 0
+            try:
+                accepted = held
+                for event in events:
+                    metrics = self._topic(event.event_type)
+                    result = await self._event_queue.put(event)
+                    offered += 1
+                    if result is not PutResult.DROPPED:
+                        metrics.enqueue_time.record(time.perf_counter() - started)
+                        metrics.published.inc()
+                        accepted += 1
+                    else:
+                        metrics.dropped.inc()
+                        self._journal_discarded(event)
+                log_event_bus_activity(
+                    logger,
+                    event_type=",".join(event_types),
+                    action="events_published",
+                    count=len(events) + held,
+                    dropped=len(events) + held - accepted
+                )
+                return accepted
+            except Exception as e:
+                # Events from the failed one on were journaled but never queued
+                for event in events[offered:]:
+                    self._journal_discarded(event)
+                error = EventBusError(
+                    error_code=ErrorCode.BUS_QUEUE_FULL,
+                    message="Failed to add event batch to queue",
+                    details={"event_types": event_types, "count": len(events), "error": str(e)},
+                    retry_allowed=True
+                )
+                log_error(logger, error)
+                raise
+    
+    async def request(self, event: Event,
+                      timeout: timedelta = timedelta(seconds=5),
+                      reply_type: Optional[str] = None) -> Event:
+        """
+        Publish a request and wait for the correlated reply.
+        
+        The reply is the first other event published with the request's
+        correlation ID (and, if given, of ``reply_type``), usually sent with
+        ``reply``. It is handed to the caller as soon as it is published,
+        without waiting for its turn in the queue, and is still delivered to
+        its own subscribers as usual.
+        
+        Args:
+            event: Request event; its correlation ID must not already have a
+                request pending
+            timeout: Time to wait for the reply
+            reply_type: Only accept a reply of this event type
+            
+        Returns:
+            The reply event
+            
+        Raises:
+            RequestTimeoutError: If no reply arrived within the timeout
+            EventDeliveryError: If the request was dropped by its topic's
+                overflow policy, or the bus stopped while waiting
+            ValueError: If a request with this correlation ID is pending
+        """
+        correlation_id = event.correlation_id
+        if correlation_id in self._pending_requests:
+            raise ValueError(f"A request with correlation ID {correlation_id} is already pending")
+        
+        loop = asyncio.get_running_loop()
+        pending = _PendingRequest(event, reply_type, loop.create_future())
+        pending.timer = loop.call_later(timeout.total_seconds(), self._expire_request, pending, timeout)
+        self._pending_requests[correlation_id] = pending
+        try:
+            if not await self.publish(event):
+                raise EventDeliveryError(f"Request {correlation_id} was dropped by the overflow policy")
+            return await pending.future
+        finally:
+            pending.timer.cancel()
+            if self._pending_requests.get(correlation_id) is pending:
+                del self._pending_requests[correlation_id]
+    
+    async def reply(self, request: Event, payload: Dict[str, Any], source: str,
+                    event_type: Optional[str] = None) -> bool:
+        """
+        Publish the reply to a request.
+        
+        Args:
+            request: Request event being answered
+            payload: Reply payload
+            source: Replying publisher; must be registered for the reply type
+            event_type: Reply event type; defaults to the request's type
+            
+        Returns:
+            Whether the reply was accepted, as for ``publish``
+        """
+        return await self.publish(Event.correlate(request, payload, event_type, source))
+    
+    def set_overflow_policy(self, event_type: str, policy: OverflowPolicy,
+                            timeout: Optional[timedelta] = None,
+                            coalesce_key: Union[str, Tuple[str, ...], None] = None,
+                            max_queued: Optional[int] = None) -> None:
+        """
+        Configure how a topic behaves when the event queue is full.
+        
+        Example: once the queue is full, replace an entity's queued state
+        update with its newer one instead of waiting for room, with
+        ``set_overflow_policy("state.updated", OverflowPolicy.COALESCE,
+        coalesce_key=("entity_type", "entity_id"))``.
+        
+        Args:
+            event_type: Event type to configure
+            policy: Overflow policy for the topic
+            timeout: Time a blocked publisher waits for room (BLOCK/COALESCE)
+            coalesce_key: Payload field(s) identifying duplicates (COALESCE)
+            max_queued: Cap on this topic's share of the queue, so a burst on
+                it overflows before it can crowd out other topics
+            
+        Raises:
+            InvalidEventTypeError: If event type is not valid
+            ValueError: If the policy options are inconsistent
+        """
+        if not EventType.is_valid(event_type):
+            raise InvalidEventTypeError(f"Invalid event type: {event_type}")
+        self._event_queue.set_config(event_type, OverflowConfig(
+            policy=policy,
+            timeout=timeout,
+            coalesce_key=coalesce_key,
+            max_queued=max_queued
+        ))
+        logger.info(
+            "Overflow policy configured",
+            event_type=event_type,
+            policy=policy.value,
+            max_queued=max_queued
+        )
+    
+    def set_coalescing(self, event_type: str, window: Optional[timedelta],
+                       max_delay: Optional[timedelta] = None,
+                       key_fields: Tuple[str, ...] = ("entity_type", "entity_id"),
+                       merge_field: str = "changes") -> None:
+        """
+        Merge bursts of updates to the same entity before they are queued.
+        
+        Unlike the COALESCE overflow policy, which only merges while the
+        queue is full, this holds every update for up to ``window`` and
+        merges its ``merge_field`` dict with any later update for the same
+        entity, newer values winning. Subscribers then get one event per
+        burst, carrying the merged dict and a ``coalesced_count`` field.
+        Held updates reach the journal only when released.
+        
+        Example: ``set_coalescing("state.updated", timedelta(milliseconds=50),
+        max_delay=timedelta(milliseconds=250))``.
+        
+        Args:
+            event_type: Event type to configure
+            window: Quiet time after an entity's last update before the
+                merged update is published; None turns coalescing off
+            max_delay: Longest an update may be held while updates to its
+                entity keep arriving; None holds it until a quiet window
+            key_fields: Payload fields identifying the entity
+            merge_field: Payload field holding the dict to merge
+            
+        Raises:
+            InvalidEventTypeError: If event type is not valid
+            ValueError: If the coalescing options are inconsistent
+        """
+        if not EventType.is_valid(event_type):
+            raise InvalidEventTypeError(f"Invalid event type: {event_type}")
+        config = None
+        if window is not None:
+            config = CoalesceConfig(
+                window=window,
+                max_delay=max_delay,
+                key_fields=tuple(key_fields),
+                merge_field=merge_field
+            )
+        self._coalescer.configure(event_type, config)
+        logger.info(
+            "Coalescing configured",
+            event_type=event_type,
+            window_seconds=window.total_seconds() if window is not None else None
+        )
+    
+    def set_topic_priority(self, event_type: str, priority: EventPriority) -> None:
+        """
+        Queue a topic in a priority lane.
+        
+        Assign priorities at startup, before the topic is published; events
+        already queued stay in the lane they were queued in.
+        
+        Args:
+            event_type: Event type to configure
+            priority: Lane to queue the topic's events in
+            
+        Raises:
+            InvalidEventTypeError: If event type is not valid
+        """
+        if not EventType.is_valid(event_type):
+            raise InvalidEventTypeError(f"Invalid event type: {event_type}")
+        self._event_queue.set_priority(event_type, priority)
+        logger.info(
+            "Topic priority configured",
+            event_type=event_type,
+            priority=priority.name.lower()
+        )
+    
+    def get_queue_stats(self) -> Dict[str, Any]:
+        """
+        Get event queue gauges: depth overall, per topic and per priority
+        lane, plus drop, coalesce and publish-timeout counts per topic, the
+        number of deliveries waiting to be retried, updates held for
+        coalescing, requests awaiting replies, tracked deliveries by status,
+        and each subscription's circuit breaker.
+        
+        Returns:
+            Dictionary of queue statistics
+        """
+        stats = self._event_queue.stats()
+        stats["pending_retries"] = len(self._retry_scheduler)
+        stats["coalescing"] = self._coalescer.stats()
+        stats["pending_requests"] = len(self._pending_requests)
+        stats["deliveries"] = self._deliveries.stats()
+        stats["circuit_breakers"] = {
+            f"{sub.pattern}:{sub.name}": breaker.stats()
+            for sub, breaker in list(self._breakers.items())
+        }
+        if self._journal is not None:
+            stats["journal_pending"] = self._journal.pending_count()
+        return stats
+    
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get a snapshot of the bus's metrics registry.
+        
+        Counters: events published and dropped per topic, and deliveries
+        made, failed and retried per subscriber. Histograms (seconds): time
+        to enqueue and time spent queued per topic, and handler run time per
+        subscriber. Gauges for queue depth, pending retries and in-flight
+        deliveries are sampled when the snapshot is taken.
+        
+        Returns:
+            Dictionary of ``counters``, ``gauges`` and ``histograms`` keyed
+            ``name{label=value,...}``; see ``MetricsRegistry.snapshot``
+        """
+        self._metrics.gauge("bus_queue_depth").set(self._event_queue.qsize())
+        self._metrics.gauge("bus_pending_retries").set(len(self._retry_scheduler))
+        self._metrics.gauge("bus_in_flight_deliveries").set(len(self._deliveries.in_flight()))
+        return self._metrics.snapshot()
+    
+    def _check_publisher(self, source: str, event_type: str) -> None:
+        """
+        Verify a publisher is registered for an event type.
+        
+        Args:
+            source: Publisher name
+            event_type: Event type being published
+            
+        Raises:
+            UnregisteredPublisherError: If the publisher is not registered
+        """
+        if source not in self._publishers or \
+            event_type not in self._publishers[source]:
+            error = EventBusError(
+                error_code=ErrorCode.BUS_UNREGISTERED_PUBLISHER,
+                message=f"Publisher {source} is not registered to publish {event_type}",
+                details={"publisher": source, "event_type": event_type}
+            )
+            log_error(logger, error)
+            raise UnregisteredPublisherError(
+                f"Publisher {source} is not registered to publish {event_type}"
+            )
+    
     async def _process_events_loop(self) -> None:
-        """Main event processing loop."""
+        """Dispatch worker loop; several of these run concurrently."""
+        worker = asyncio.current_task()
         while self._running:
+            # Suspend until an event is available; no thread is held
+            self._idle_dispatchers.add(worker)
             try:
-                loop = asyncio.get_running_loop()
-                # Get next event from queue
-                event = await loop.run_in_executor(
-                    self._executor,
-                    self._event_queue.get,
-                    True,  # Block until item available
-                    1.0    # Timeout after 1 second
-                )
-                
-                # Process event asynchronously
-                await self._process_event(event)
-                
-                # Handle any events in dead letter queue that are ready for retry
-                await self._process_dead_letter_queue()
-                
-            except asyncio.TimeoutError:
+                event = await self._event_queue.get()
+            finally:
+                self._idle_dispatchers.discard(worker)
+            
+            key = self._ordering_key(event)
+            if key is None:
+                await self._dispatch(event)
                 continue
-            except Exception as e:
-                logger.error(f"Error in event processing loop: {e}")
+            
+            # Another worker is delivering this key; queue behind it. There is
+            # no await between get() and this check, so dequeue order is kept.
+            # The event keeps its queue slot while parked, so a slow key
+            # backs up into the overflow policies instead of into memory.
+            backlog = self._ordering_backlogs.get(key)
+            if backlog is not None:
+                self._event_queue.park(event)
+                backlog.append(event)
+                continue
+            
+            backlog = self._ordering_backlogs[key] = deque()
+            try:
+                while True:
+                    await self._dispatch(event)
+                    if not backlog or not self._running:
+                        break
+                    event = backlog.popleft()
+                    self._event_queue.unpark(event)
+            finally:
+                del self._ordering_backlogs[key]
+                # Stopped mid-backlog: give the parked events back to the
+                # queue, in order, rather than lose them
+                while backlog:
+                    self._event_queue.requeue(backlog.pop())
+    
+    def _ordering_key(self, event: Event) -> Optional[str]:
+        """
+        Get the key whose events must be delivered one at a time, in order.
+        
+        Args:
+            event: Dequeued event
+            
+        Returns:
+            Ordering key, or None if the event may be delivered concurrently
+        """
+        if self._ordering is DeliveryOrdering.PER_EVENT_TYPE:
+            return event.event_type
+        if self._ordering is DeliveryOrdering.PER_CORRELATION_ID:
+            return event.correlation_id
+        return None
+    
+    async def _dispatch(self, event: Event) -> None:
+        """
+        Deliver one dequeued event and mark it done on the queue.
+        
+        Args:
+            event: Event to deliver
+        """
+        try:
+            # Process event asynchronously
+            await self._process_event(event)
+            
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error in event processing loop: {e}")
+        finally:
+            self._event_queue.task_done()
     
     async def _process_event(self, event: Event) -> None:
         """
@@ -261,78 +940,478 @@ class EventBus:
         Args:
             event: Event to process
         """
-        if event.event_type in self._subscribers:
-            delivery_tasks = []
-            
-            for handler in self._subscribers[event.event_type]:
-                # Create delivery record
-                record = DeliveryRecord(event=event, subscriber=handler)
-                self._delivery_records[event.correlation_id] = record
-                
-                # Schedule delivery
-                task = asyncio.create_task(self._deliver_to_subscriber(record))
-                delivery_tasks.append(task)
-            
-            # Wait for all deliveries to complete
+        # Snapshot of subscriptions; safe against concurrent (un)subscribe
+        subscriptions = self._routes.lookup(event.event_type)
+        delivery_tasks = []
+        recipients = 0
+        
+        for subscription in subscriptions:
+            if subscription.batched:
+                # Only a filled batch is delivered from the dispatch path
+                batcher = self._batchers.get(subscription)
+                if batcher is None:
+                    continue
+                recipients += 1
+                batch = batcher.add(event)
+                if not batch:
+                    continue
+                task = asyncio.create_task(self._deliver(subscription, batch))
+            else:
+                recipients += 1
+                task = asyncio.create_task(self._deliver(subscription, event))
+            delivery_tasks.append(task)
+        
+        # Deliveries have not started yet, so the count is in place before
+        # any of them can finish
+        if event.sequence is not None and self._journal is not None:
+            if recipients:
+                self._journal_outstanding[event.sequence] = recipients
+            else:
+                self._journal.ack(event.sequence)
+        
+        # Wait for all deliveries to complete
+        if delivery_tasks:
             await asyncio.gather(*delivery_tasks)
     
+    async def _deliver(self, subscription: Subscription,
+                       payload: Union[Event, List[Event]]) -> None:
+        """
+        Deliver an event, or a batch of events, to one subscription.
+        
+        Args:
+            subscription: Subscription to deliver to
+            payload: Single event, or list of events for batched subscriptions
+        """
+        record = DeliveryRecord(event=payload, subscriber=subscription.handler, subscription=subscription)
+        self._deliveries.start(record)
+        
+        await self._deliver_to_subscriber(record)
+    
+    async def _flush_batches(self) -> None:
+        """Deliver every partially filled batch and wait for in-flight ones."""
+        for subscription, batcher in list(self._batchers.items()):
+            batch = batcher.drain()
+            if batch:
+                await self._deliver(subscription, batch)
+            await batcher.wait_pending()
+    
     async def _deliver_to_subscriber(self, record: DeliveryRecord) -> None:
         """
-        Attempt to deliver an event to a subscriber with retry logic.
+        Make one delivery attempt, scheduling a retry if it fails.
+        
+        The retry is handed to the retry scheduler rather than awaited, so a
+        failing subscriber never holds up dispatch or healthy subscribers.
+        While the subscriber's circuit breaker is open the handler is not
+        called and the delivery is dead-lettered straight away, retries
+        included.
         
         Args:
             record: Delivery record containing event and subscriber
         """
-        while record.should_retry(self._max_retry_attempts, self._retry_delay):
-            try:
-                record.attempts += 1
-                record.last_attempt = datetime.now()
-                loop = asyncio.get_running_loop()
-                # Execute handler in thread pool
-                await loop.run_in_executor(
-                    self._executor,
-                    record.subscriber,
-                    record.event
-                )
-                
-                # Successful delivery
-                return
-                
-            except Exception as e:
-                record.error = e
-                logger.error(
-                    f"Error delivering event {record.event} to {record.subscriber} "
-                    f"(attempt {record.attempts}/{self._max_retry_attempts}): {e}"
-                )
-
-                # Wait before retry
-                await asyncio.sleep(self._retry_delay.total_seconds())
+        breaker = self._breakers.get(record.subscription) if record.subscription is not None else None
+        if breaker is not None and not breaker.allow():
+            record.error = CircuitOpenError(f"Circuit breaker open for {handler_name(record.subscriber)}")
+            logger.debug(
+                "Delivery shed by open circuit breaker",
+                subscriber=handler_name(record.subscriber),
+                attempts=record.attempts
+            )
+            await self._fail_delivery(record)
+            return
         
-        # Failed all retry attempts
-        self._dead_letter_queue.put(record)
+        try:
+            record.attempts += 1
+            record.last_attempt = datetime.now()
+            record.status = DeliveryStatus.IN_FLIGHT
+            await self._invoke_handler(record.subscriber, record.event, record.subscription)
+            
+            # Successful delivery
+            if breaker is not None:
+                self._record_outcome(record, breaker, None)
+            self._count_delivery(record, "delivered")
+            self._finish_delivery(record, DeliveryStatus.DELIVERED)
+            return
+            
+        except Exception as e:
+            record.error = e
+            logger.error(
+                f"Error delivering event {record.event} to {record.subscriber} "
+                f"(attempt {record.attempts}/{self._max_retry_attempts}): {e}"
+            )
+        except BaseException:
+            # Cancelled mid-call: the subscriber was not at fault, but a
+            # HALF_OPEN probe must be released or the breaker sheds forever
+            if breaker is not None:
+                breaker.record_ignored()
+            raise
         
-    async def _process_dead_letter_queue(self) -> None:
-        """Process events in the dead letter queue that are ready for retry."""
-        while not self._dead_letter_queue.empty():
-            record = self._dead_letter_queue.get()
+        if breaker is not None and \
+                self._record_outcome(record, breaker, record.error) is CircuitState.OPEN:
+            # Retrying would only be shed; give up now
+            await self._fail_delivery(record)
+            return
+        
+        if record.attempts < self._max_retry_attempts:
+            record.status = DeliveryStatus.RETRY_PENDING
+            if self._retry_scheduler.schedule(self._retry_backoff(record.attempts), record):
+                self._count_delivery(record, "retries")
+            else:
+                # The bus is stopping; the retry would never fire
+                self._abandon_retries([record])
+            return
+        
+        await self._fail_delivery(record)
+    
+    async def _fail_delivery(self, record: DeliveryRecord) -> None:
+        """Give up on a delivery and persist it as a dead letter off the event loop."""
+        self._finish_delivery(record, DeliveryStatus.FAILED)
+        self._count_delivery(record, "failed")
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._write_dead_letter, record)
+    
+    def _abandon_retries(self, records: List[DeliveryRecord]) -> None:
+        """
+        Give up on retries that will never run because the bus is stopping.
+        
+        Without a journal they are kept as dead letters; with one they stay
+        unacknowledged and are redelivered on the next start, like events
+        still queued.
+        
+        Args:
+            records: Deliveries that were waiting for a retry
+        """
+        for record in records:
+            self._deliveries.finish(record, DeliveryStatus.FAILED)
+            if self._journal is None:
+                self._write_dead_letter(record)
+        if records:
+            logger.warning(
+                "Pending retries abandoned on stop",
+                count=len(records),
+                kept_for_restart=self._journal is not None
+            )
+    
+    def _record_outcome(self, record: DeliveryRecord, breaker: CircuitBreaker,
+                        error: Optional[Exception]) -> CircuitState:
+        """
+        Feed a delivery outcome to the subscriber's breaker, logging state changes.
+        
+        Only errors RetryConfig says indicate an unhealthy subscriber count
+        as failures; the rest are blamed on the event and ignored, so they
+        neither open the breaker nor let a probe close it.
+        
+        Args:
+            record: Delivery that was attempted
+            breaker: The subscription's circuit breaker
+            error: Error the handler raised, or None if it succeeded
             
-            if record.should_retry(self._max_retry_attempts, self._retry_delay):
-                # Attempt redelivery
-                await self._deliver_to_subscriber(record)
+        Returns:
+            Breaker state after the outcome
+        """
+        before = breaker.state
+        if error is None:
+            after = breaker.record_success()
+        elif RetryConfig.trips_breaker(error):
+            after = breaker.record_failure()
+        else:
+            after = breaker.record_ignored()
+        
+        if after is CircuitState.OPEN and before is not CircuitState.OPEN:
+            error = EventBusError(
+                error_code=ErrorCode.BUS_CIRCUIT_OPEN,
+                message="Subscriber circuit breaker opened; shedding its deliveries",
+                details={
+                    "subscriber": handler_name(record.subscriber),
+                    "pattern": record.subscription.pattern,
+                    "probe": before is CircuitState.HALF_OPEN,
+                    "error": str(record.error)
+                }
+            )
+            log_error(logger, error)
+        elif after is CircuitState.CLOSED and before is not CircuitState.CLOSED:
+            logger.info(
+                "Subscriber circuit breaker closed",
+                subscriber=handler_name(record.subscriber),
+                pattern=record.subscription.pattern
+            )
+        return after
+    
+    def _finish_delivery(self, record: DeliveryRecord, status: DeliveryStatus) -> None:
+        """
+        Mark a delivery finished, acknowledging journaled events whose last
+        subscriber it was.
+        
+        Args:
+            record: Delivery that was made or dead-lettered
+            status: DELIVERED or FAILED
+        """
+        self._deliveries.finish(record, status)
+        if self._journal is None:
+            return
+        for event in record.event if isinstance(record.event, list) else (record.event,):
+            remaining = self._journal_outstanding.get(event.sequence)
+            if remaining is None:
+                continue
+            if remaining > 1:
+                self._journal_outstanding[event.sequence] = remaining - 1
             else:
-                self._dead_letter_queue.put(record)  # Put back if not ready
+                del self._journal_outstanding[event.sequence]
+                self._journal.ack(event.sequence)
+    
+    async def _journal_append(self, events: List[Event]) -> None:
+        """
+        Record events in the journal before they are queued.
+        
+        If journaling fails the publisher gets the error, so events that
+        were already recorded are acknowledged rather than left to be
+        recovered and delivered after a restart.
+        
+        Args:
+            events: Events being published
+        """
+        try:
+            for event in events:
+                self._journal.append(event)
+            if self._journal_sync:
+                # Group commit: one fsync covers every publisher waiting here
+                await self._journal.commit()
+        except BaseException:
+            for event in events:
+                self._journal_discarded(event)
+            raise
+    
+    def _resolve_request(self, event: Event) -> None:
+        """Complete the pending request an event replies to, if any."""
+        pending = self._pending_requests.get(event.correlation_id)
+        if pending is None or event is pending.request:
+            return
+        if pending.reply_type is not None and event.event_type != pending.reply_type:
+            return
+        del self._pending_requests[event.correlation_id]
+        pending.timer.cancel()
+        if not pending.future.done():
+            pending.future.set_result(event)
+    
+    def _expire_request(self, pending: _PendingRequest, timeout: timedelta) -> None:
+        """Fail a request whose reply did not arrive in time."""
+        correlation_id = pending.request.correlation_id
+        if self._pending_requests.get(correlation_id) is pending:
+            del self._pending_requests[correlation_id]
+        if not pending.future.done():
+            logger.warning(
+                "Request timed out waiting for a reply",
+                event_type=pending.request.event_type,
+                correlation_id=correlation_id,
+                timeout_seconds=timeout.total_seconds()
+            )
+            pending.future.set_exception(RequestTimeoutError(
+                f"No reply to {pending.request.event_type} request {correlation_id} "
+                f"within {timeout.total_seconds()}s"
+            ))
+    
+    async def _publish_coalesced(self, event: Event) -> None:
+        """
+        Queue a merged update released by the coalescer.
+        
+        Args:
+            event: Merged update; its publisher was checked when first held
+        """
+        try:
+            if self._journal is not None:
+                await self._journal_append([event])
+            if await self._event_queue.put(event) is PutResult.DROPPED:
+                self._journal_discarded(event)
+        except Exception as e:
+            self._journal_discarded(event)
+            error = EventBusError(
+                error_code=ErrorCode.BUS_QUEUE_FULL,
+                message="Failed to queue coalesced update",
+                details={"event": str(event), "error": str(e)},
+                retry_allowed=True
+            )
+            log_error(logger, error)
+    
+    def _topic(self, event_type: str) -> _TopicMetrics:
+        """Get a topic's metrics, creating them on its first event."""
+        metrics = self._topic_metrics.get(event_type)
+        if metrics is None:
+            metrics = self._topic_metrics[event_type] = _TopicMetrics(self._metrics, event_type)
+        return metrics
+    
+    def _record_queue_wait(self, event: Event, waited: float) -> None:
+        """Record how long a dequeued event spent in the queue."""
+        self._topic(event.event_type).queue_wait.record(waited)
+    
+    def _count_delivery(self, record: DeliveryRecord, counter: str) -> None:
+        """
+        Count a delivery outcome against its subscription.
+        
+        Args:
+            record: Delivery the outcome is for
+            counter: ``delivered``, ``failed`` or ``retries``
+        """
+        metrics = self._subscriber_metrics.get(record.subscription)
+        if metrics is not None:
+            getattr(metrics, counter).inc()
     
+    def _journal_discarded(self, event: Event) -> None:
+        """Acknowledge a journaled event that will never be dispatched."""
+        if event.sequence is not None and self._journal is not None:
+            self._journal.ack(event.sequence)
+    
+    async def _recover_journal(self) -> None:
+        """Open the journal and requeue events that were never fully delivered."""
+        loop = asyncio.get_running_loop()
+        recovered = await loop.run_in_executor(self._executor, self._journal.open)
+        for event in recovered:
+            # Sources may not have re-registered yet; skip the publisher check
+            if await self._event_queue.put(event) is PutResult.DROPPED:
+                self._journal_discarded(event)
+        if recovered:
+            logger.warning("Redelivering events recovered from the journal", count=len(recovered))
+    
+    def _write_dead_letter(self, record: DeliveryRecord) -> None:
+        """
+        Append an undeliverable record to the dead-letter store.
+        
+        Args:
+            record: Delivery record that exhausted its attempts
+        """
+        subscriber = handler_name(record.subscriber)
+        try:
+            self._dead_letters.append(
+                record.event, subscriber, attempts=record.attempts, error=record.error
+            )
+        except Exception as e:
+            events = record.event if isinstance(record.event, list) else [record.event]
+            error = EventBusError(
+                error_code=ErrorCode.BUS_EVENT_DELIVERY_FAILED,
+                message="Failed to store dead letter; delivery lost",
+                details={
+                    "subscriber": subscriber,
+                    "correlation_ids": [event.correlation_id for event in events],
+                    "error": str(e)
+                }
+            )
+            log_error(logger, error)
+    
+    def _retry_backoff(self, attempt: int) -> float:
+        """
+        Get the delay in seconds before retrying after a failed attempt.
+        
+        Follows RetryConfig's exponential schedule, scaled so the first retry
+        waits this bus's ``retry_delay``.
+        
+        Args:
+            attempt: Number of the attempt that just failed (1-indexed)
+        """
+        scale = self._retry_delay.total_seconds() / RetryConfig.BACKOFF_BASE
+        return RetryConfig.get_backoff_time(attempt) * scale
+        
+    def _setup_execution(self, subscription: Subscription) -> None:
+        """
+        Create a new subscription's concurrency limit, circuit breaker,
+        metrics and dedicated executor.
+        
+        Args:
+            subscription: Subscription just added to the routing table
+        """
+        limit = subscription.max_concurrency or self._subscriber_concurrency
+        if limit is not None:
+            self._limits[subscription] = asyncio.Semaphore(limit)
+        if self._breaker_config is not None:
+            self._breakers[subscription] = CircuitBreaker(self._breaker_config)
+        self._subscriber_metrics[subscription] = _SubscriberMetrics(self._metrics, subscription)
+        if subscription.execution is ExecutionMode.DEDICATED_THREADS:
+            self._isolated[subscription] = ThreadPoolExecutor(
+                max_workers=subscription.max_concurrency or 1,
+                thread_name_prefix=f"axiom-{subscription.name}"
+            )
+        elif subscription.execution is ExecutionMode.PROCESS_POOL:
+            self._isolated[subscription] = self._new_process_pool(subscription)
+    
+    @staticmethod
+    def _new_process_pool(subscription: Subscription) -> ProcessPoolExecutor:
+        """Start a process pool for a subscription; workers spawn on first use."""
+        # Spawn rather than fork: the bus process runs worker and journal threads
+        return ProcessPoolExecutor(
+            max_workers=subscription.max_concurrency or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    
+    async def _invoke_handler(self, handler: Callable,
+                              event: Union[Event, List[Event]],
+                              subscription: Optional[Subscription] = None) -> None:
+        """
+        Run a handler for an event on the appropriate execution context.
+        
+        The subscription's execution mode picks the context; by default
+        coroutine functions are awaited on the event loop and plain callables
+        are run in the worker thread pool so they cannot block dispatch. A
+        subscription with ``max_concurrency`` waits here for a free slot.
+        The handler's run time, from getting a slot until it returns or
+        raises, is recorded in the subscription's metrics; for handlers
+        run on a pool it includes any wait for a free worker.
+        
+        Args:
+            handler: Subscriber callback
+            event: Event, or batch of events, to pass to the handler
+            subscription: Subscription the delivery is for
+        """
+        limit = self._limits.get(subscription) if subscription is not None else None
+        if limit is not None:
+            await limit.acquire()
+        started = time.perf_counter()
+        try:
+            await self._run_handler(handler, event, subscription)
+        finally:
+            if limit is not None:
+                limit.release()
+            metrics = self._subscriber_metrics.get(subscription)
+            if metrics is not None:
+                metrics.handler_time.record(time.perf_counter() - started)
+    
+    async def _run_handler(self, handler: Callable,
+                           event: Union[Event, List[Event]],
+                           subscription: Optional[Subscription]) -> None:
+        """Call a handler in its subscription's execution context."""
+        mode = subscription.execution if subscription is not None else ExecutionMode.AUTO
+        if mode is ExecutionMode.INLINE:
+            result = handler(event)
+        elif mode in (ExecutionMode.AUTO, ExecutionMode.ASYNC) and is_coroutine_handler(handler):
+            await handler(event)
+            return
+        else:
+            executor = self._isolated.get(subscription, self._executor)
+            loop = asyncio.get_running_loop()
+            try:
+                result = await loop.run_in_executor(executor, handler, event)
+            except BrokenProcessPool:
+                # A worker died; give later attempts a fresh pool
+                if self._isolated.get(subscription) is executor:
+                    self._isolated[subscription] = self._new_process_pool(subscription)
+                    executor.shutdown(wait=False)
+                raise
+        if inspect.isawaitable(result):
+            await result
+
     def get_subscriber_count(self, event_type: str) -> int:
         """
         Get the number of subscribers for an event type.
         
+        For a concrete event type this counts every handler that would
+        receive it, including wildcard subscribers. For a pattern it counts
+        handlers subscribed with exactly that pattern.
+        
         Args:
-            event_type: Event type to check
+            event_type: Event type or pattern to check
             
         Returns:
             Number of subscribers for the event type
         """
-        return len(self._subscribers.get(event_type, set()))
+        if is_pattern(event_type):
+            return self._routes.pattern_count(event_type)
+        return len(self._routes.lookup(event_type))
     
     def get_publisher_events(self, publisher_name: str) -> Set[str]:
         """
@@ -346,21 +1425,160 @@ class EventBus:
         """
         return self._publishers.get(publisher_name, set())
     
-    def get_failed_deliveries(self) -> List[DeliveryRecord]:
+    def get_delivery_status(self, correlation_id: str) -> List[DeliveryRecord]:
+        """
+        Get the tracked deliveries of an event, one per subscriber.
+        
+        Only in-flight and recently completed deliveries are tracked; older
+        ones are evicted, and failed ones remain in the dead-letter store.
+        
+        Args:
+            correlation_id: Correlation ID of the event
+            
+        Returns:
+            Delivery records for the event
+        """
+        return self._deliveries.get(correlation_id)
+    
+    def get_in_flight_deliveries(self) -> List[DeliveryRecord]:
         """
-        Get all failed event deliveries.
+        Get deliveries being attempted or waiting for a retry.
         
         Returns:
-            List of delivery records for failed attempts
+            Delivery records that have not yet finished
+        """
+        return self._deliveries.in_flight()
+    
+    def get_recent_deliveries(self, limit: int = 100,
+                              status: Optional[DeliveryStatus] = None) -> List[DeliveryRecord]:
+        """
+        Get recently completed deliveries, newest first.
+        
+        Args:
+            limit: Maximum number of records to return
+            status: Only deliveries that finished with this status
+            
+        Returns:
+            Delivery records for completed deliveries
+        """
+        return self._deliveries.recent(limit, status)
+    
+    def get_failed_deliveries(self, correlation_id: Optional[str] = None,
+                              subscriber: Optional[str] = None,
+                              limit: int = 100) -> List[DeadLetter]:
         """
-        failed = []
-        while not self._dead_letter_queue.empty():
-            failed.append(self._dead_letter_queue.get())
-        return failed
+        Get failed event deliveries, oldest first.
+        
+        Dead letters are left in place; use ``replay_dead_letters`` to
+        redeliver and remove them.
+        
+        Args:
+            correlation_id: Only deliveries for this correlation ID
+            subscriber: Only deliveries to this subscriber (module-qualified
+                handler name)
+            limit: Maximum number of dead letters to return
+            
+        Returns:
+            List of dead letters
+        """
+        return self._dead_letters.query(correlation_id, subscriber, limit)
+    
+    async def replay_dead_letters(self, correlation_id: Optional[str] = None,
+                                  subscriber: Optional[str] = None,
+                                  rate: float = 50.0) -> int:
+        """
+        Redeliver dead letters to their subscribers, oldest first.
+        
+        Letters are streamed from the store and redelivered at no more than
+        ``rate`` per second, so a backlog from an outage does not swamp a
+        subscriber that has only just recovered. Each redelivery starts with
+        fresh retry attempts and is removed from the store once handed over;
+        if it fails again it is dead-lettered anew. Letters whose subscriber
+        is no longer subscribed to the event type, or whose circuit breaker
+        is open, are kept.
+        
+        Args:
+            correlation_id: Only replay letters for this correlation ID
+            subscriber: Only replay letters for this subscriber
+            rate: Maximum redeliveries per second
+            
+        Returns:
+            Number of dead letters redelivered
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        
+        interval = 1.0 / rate
+        next_slot = time.monotonic()
+        replayed = skipped = 0
+        # The store is SQLite; read and delete letters off the event loop
+        loop = asyncio.get_running_loop()
+        letters = self._dead_letters.iter_letters(correlation_id, subscriber)
+        while True:
+            letter = await loop.run_in_executor(self._executor, next, letters, None)
+            if letter is None:
+                break
+            target = next(
+                (sub for sub in self._routes.lookup(letter.event_type)
+                 if sub.name == letter.subscriber and sub.batched == letter.batched),
+                None
+            )
+            breaker = self._breakers.get(target) if target is not None else None
+            if target is None or (breaker is not None and breaker.state is CircuitState.OPEN):
+                skipped += 1
+                continue
+            
+            delay = next_slot - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            next_slot = max(next_slot, time.monotonic()) + interval
+            
+            await loop.run_in_executor(self._executor, self._dead_letters.delete, letter.id)
+            payload = letter.events if letter.batched else letter.events[0]
+            await self._deliver(target, payload)
+            replayed += 1
+        
+        logger.info(
+            "Dead letters replayed",
+            replayed=replayed,
+            skipped=skipped,
+            correlation_id=correlation_id,
+            subscriber=subscriber
+        )
+        return replayed
 
+    async def redeliver(self, event: Event, subscribers: Optional[Set[str]] = None) -> int:
+        """
+        Deliver an event straight to its current subscribers, bypassing the queue.
+        
+        Meant for replaying historical events: the publisher is not checked,
+        the event is not journaled, and the call returns once every handler
+        has run; failed deliveries are retried and dead-lettered as usual.
+        Batched subscriptions receive the event as a one-event batch.
+        
+        Args:
+            event: Event to deliver
+            subscribers: Only deliver to subscribers with these names (module
+                and qualified name of the handler); None delivers to all
+        
+        Returns:
+            Number of subscriptions the event was delivered to
+        """
+        targets = [
+            sub for sub in self._routes.lookup(event.event_type)
+            if subscribers is None or sub.name in subscribers
+        ]
+        if targets:
+            await asyncio.gather(*(
+                self._deliver(sub, [event] if sub.batched else event) for sub in targets
+            ))
+        return len(targets)
+    
     def clear(self) -> None:
         """Clear all events from the queues."""
+        self._coalescer.drain()
         while not self._event_queue.empty():
-            self._event_queue.get()
-        while not self._dead_letter_queue.empty():
-            self._dead_letter_queue.get()
+            self._journal_discarded(self._event_queue.get_nowait())
+            self._event_queue.task_done()
+        self._dead_letters.clear()
+        self._deliveries.clear()
@@ -1,7 +1,9 @@
-from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from enum import Enum, auto
+import itertools
+import os
+import time
 import uuid
 import json
 
@@ -11,14 +13,112 @@ class EventType(Enum):
     SYSTEM_SHUTDOWN = "system.shutdown"
     CONVERSATION_TURN = "conversation.turn"
     STATE_UPDATED = "state.updated"
+    VISION_FRAME = "vision.frame"
     
     @classmethod
     def values(cls) -> List[str]:
         """Get all valid event type strings."""
         return [e.value for e in cls]
+    
+    @classmethod
+    def is_valid(cls, value: str) -> bool:
+        """Check whether a string is a valid event type, in constant time."""
+        return value in _VALID_EVENT_TYPES
+
+_VALID_EVENT_TYPES = frozenset(EventType.values())
+
+# Timestamps are read from the wall clock on every call, so they stay in step
+# with other processes and earlier runs across suspends and NTP steps. If the
+# clock steps backwards, timestamps are held just past the last one handed out
+# until the clock catches up, so they never go backwards within a thread.
+_last_ns = 0
+
+# Correlation IDs: a random per-process prefix plus a counter. The prefix is
+# 64 random bits, so IDs from different processes collide no more often than
+# truncated uuid4s would. A forked child inherits both, so it draws a fresh
+# prefix and counter on fork.
+_CORRELATION_PREFIX = uuid.uuid4().hex[:16]
+_correlation_counter = itertools.count()
+
+def _reset_correlation_ids() -> None:
+    """Give this process its own correlation ID prefix and counter."""
+    global _CORRELATION_PREFIX, _correlation_counter
+    _CORRELATION_PREFIX = uuid.uuid4().hex[:16]
+    _correlation_counter = itertools.count()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_correlation_ids)
+
+def new_correlation_id() -> str:
+    """Generate a unique correlation ID."""
+    return f"{_CORRELATION_PREFIX}-{next(_correlation_counter):x}"
+
+def _now_ns() -> int:
+    """Current wall-clock time in nanoseconds, never behind the previous call."""
+    global _last_ns
+    now = time.time_ns()
+    if now <= _last_ns:
+        now = _last_ns + 1
+    _last_ns = now
+    return now
+
+def _datetime_to_ns(value: datetime) -> int:
+    """Convert a datetime to nanoseconds since the epoch."""
+    # Whole seconds are exact as a float, and truncating them is flooring, so
+    # this is exact on both sides of 1970.
+    seconds = int(value.replace(microsecond=0).timestamp())
+    return seconds * 1_000_000_000 + value.microsecond * 1000
 
-@dataclass
 class Event:
+    """
+    Base event class for the event bus system.
+    
+    Events are slotted and cheap to build: the timestamp is kept as integer
+    nanoseconds and only turned into a ``datetime`` when ``timestamp`` is
+    read, and the type check is a frozenset lookup. ``sequence`` is set
+    when an event journal records the event, and is not part of equality
+    or serialization.
+    """
+    __slots__ = ("event_type", "payload", "source", "correlation_id", "timestamp_ns", "sequence", "_timestamp")
+    
+    def __init__(self, event_type: str, payload: Dict[str, Any], source: str,
+                 timestamp: Optional[datetime] = None,
+                 correlation_id: Optional[str] = None):
+        """
+        Create and validate an event.
+        
+        Args:
+            event_type: The type of event (must be in EventType.values())
+            payload: The event payload dictionary
+            source: The event source string
+            timestamp: When the event occurred; defaults to now
+            correlation_id: Correlation ID; a new one is generated if omitted
+            
+        Raises:
+            ValueError: If the event type is invalid or the source is empty
+            TypeError: If the payload is not a dictionary
+        """
+        if event_type not in _VALID_EVENT_TYPES:
+            raise ValueError(f"Invalid event type: {event_type}")
+        
+        if not isinstance(payload, dict):
+            raise TypeError("Payload must be a dictionary")
+            
+        if not source:
+            raise ValueError("Source cannot be empty")
+        
+        self.event_type = event_type
+        self.payload = payload
+        self.source = source
+        self.correlation_id = correlation_id or new_correlation_id()
+        self.sequence: Optional[int] = None  # Journal position, once journaled
+        if timestamp is None:
+            self.timestamp_ns = _now_ns()
+            self._timestamp = None
+        else:
+            self.timestamp_ns = _datetime_to_ns(timestamp)
+            self._timestamp = timestamp
+    
     @staticmethod
     def factory(event_type: str, payload: Dict[str, Any], source: str, correlation_id: Optional[str] = None) -> 'Event':
         """
@@ -27,12 +127,10 @@ class Event:
             event_type: The type of event (must be in EventType.values())
             payload: The event payload dictionary
             source: The event source string
-            correlation_id: Optional correlation ID (if not provided, a new UUID is generated)
+            correlation_id: Optional correlation ID (if not provided, a new one is generated)
         Returns:
             Event instance
         """
-        if correlation_id is None:
-            correlation_id = str(uuid.uuid4())
         return Event(
             event_type=event_type,
             payload=payload,
@@ -44,6 +142,10 @@ class Event:
     def correlate(event: 'Event', new_payload: Optional[Dict[str, Any]] = None, new_type: Optional[str] = None, new_source: Optional[str] = None) -> 'Event':
         """
         Create a new event correlated to an existing event (same correlation_id).
+        
+        Fields carried over from the original were validated when it was
+        built, so only replacements are checked.
+        
         Args:
             event: The original event to correlate with
             new_payload: Optional new payload (defaults to original)
@@ -52,29 +154,66 @@ class Event:
         Returns:
             Event instance with same correlation_id
         """
-        return Event(
-            event_type=new_type or event.event_type,
-            payload=new_payload if new_payload is not None else event.payload,
-            source=new_source or event.source,
-            correlation_id=event.correlation_id
-        )
-    """Base event class for the event bus system."""
-    event_type: str
-    payload: Dict[str, Any]
-    source: str
-    timestamp: datetime = field(default_factory=datetime.now)
-    correlation_id: str = field(default_factory=lambda: str(uuid.uuid4()))
-
-    def __post_init__(self):
-        """Validate event after initialization."""
-        if self.event_type not in EventType.values():
-            raise ValueError(f"Invalid event type: {self.event_type}")
-        
-        if not isinstance(self.payload, dict):
+        if new_type is not None and new_type not in _VALID_EVENT_TYPES:
+            raise ValueError(f"Invalid event type: {new_type}")
+        if new_payload is not None and not isinstance(new_payload, dict):
             raise TypeError("Payload must be a dictionary")
-            
-        if not self.source:
-            raise ValueError("Source cannot be empty")
+        
+        return Event._from_parts(
+            new_type or event.event_type,
+            new_payload if new_payload is not None else event.payload,
+            new_source or event.source,
+            event.correlation_id,
+            _now_ns()
+        )
+    
+    @classmethod
+    def _from_parts(cls, event_type: str, payload: Dict[str, Any], source: str,
+                    correlation_id: str, timestamp_ns: int) -> 'Event':
+        """Build an event from already-validated fields, skipping the checks."""
+        event = object.__new__(cls)
+        event.event_type = event_type
+        event.payload = payload
+        event.source = source
+        event.correlation_id = correlation_id
+        event.timestamp_ns = timestamp_ns
+        event.sequence = None
+        event._timestamp = None
+        return event
+    
+    @property
+    def timestamp(self) -> datetime:
+        """When the event occurred, as a local naive datetime."""
+        if self._timestamp is None:
+            seconds, nanos = divmod(self.timestamp_ns, 1_000_000_000)
+            self._timestamp = datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000)
+        return self._timestamp
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self.timestamp_ns = _datetime_to_ns(value)
+        self._timestamp = value
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.event_type == other.event_type and
+            self.payload == other.payload and
+            self.source == other.source and
+            # datetime and JSON carry microseconds; compare at that precision
+            self.timestamp_ns // 1000 == other.timestamp_ns // 1000 and
+            self.correlation_id == other.correlation_id
+        )
+    
+    __hash__ = None  # Mutable, like the dataclass it replaced
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(event_type={self.event_type!r}, "
+            f"payload={self.payload!r}, source={self.source!r}, "
+            f"timestamp={self.timestamp!r}, correlation_id={self.correlation_id!r})"
+        )
 
     def __str__(self) -> str:
         return f"{self.event_type} from {self.source} at {self.timestamp}"
@@ -96,9 +235,10 @@ class Event:
         data['timestamp'] = datetime.fromisoformat(data['timestamp'])
         return cls(**data)
 
-@dataclass
 class SystemStartEvent(Event):
     """Event emitted when the system starts."""
+    __slots__ = ()
+    
     def __init__(self, source: str, version: str, configuration: Dict[str, Any]):
         super().__init__(
             event_type=EventType.SYSTEM_START.value,
@@ -110,9 +250,10 @@ class SystemStartEvent(Event):
             }
         )
 
-@dataclass
 class SystemShutdownEvent(Event):
     """Event emitted when the system is shutting down."""
+    __slots__ = ()
+    
     def __init__(self, source: str, reason: str, graceful: bool = True):
         super().__init__(
             event_type=EventType.SYSTEM_SHUTDOWN.value,
@@ -123,9 +264,10 @@ class SystemShutdownEvent(Event):
             }
         )
 
-@dataclass
 class ConversationTurnEvent(Event):
     """Event emitted for each conversation interaction."""
+    __slots__ = ()
+    
     def __init__(self, source: str, session_id: str, user_input: str, 
                  assistant_response: str, intent: Optional[Dict[str, Any]] = None,
                  processing_time: Optional[float] = None):
@@ -141,9 +283,10 @@ class ConversationTurnEvent(Event):
             }
         )
 
-@dataclass
 class StateUpdatedEvent(Event):
     """Event emitted when system state is modified."""
+    __slots__ = ()
+    
     def __init__(self, source: str, changes: Dict[str, Any], 
                  entity_type: str, entity_id: str):
         super().__init__(
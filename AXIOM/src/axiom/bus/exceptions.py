@@ -18,4 +18,31 @@ class EventDeliveryError(EventBusException):
 
 class EventValidationError(EventBusException):
     """Raised when event validation fails."""
-    pass
\ No newline at end of file
+    pass
+class EventQueueFullError(EventBusException):
+    """Raised when an event cannot be queued before its publish timeout."""
+    pass
+
+class EventCodecError(EventBusException):
+    """Raised when an event cannot be encoded or decoded."""
+    pass
+
+class RingBufferFullError(EventBusException):
+    """Raised when every slot of a shared-memory ring is still referenced."""
+    pass
+
+class StaleSlotError(EventBusException):
+    """Raised when a shared-memory slot was reused after its handle was made."""
+    pass
+
+class CircuitOpenError(EventDeliveryError):
+    """Raised in place of a delivery shed because the subscriber's circuit breaker is open."""
+    pass
+
+class RequestTimeoutError(EventBusException):
+    """Raised when no reply to a request arrives before its timeout."""
+    pass
+
+class BridgeAddressInUseError(EventBusException):
+    """Raised when another event bridge is already serving on a socket path."""
+    pass
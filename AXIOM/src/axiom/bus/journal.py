@@ -0,0 +1,484 @@
+"""Append-only write-ahead journal of published events and their acknowledgements."""
+
+import asyncio
+import os
+import struct
+import threading
+import time
+import zlib
+from datetime import timedelta
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from .codec import BinaryCodec, EventCodec
+from .events import Event
+from .exceptions import EventCodecError
+from axiom.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Record: body length, CRC32 of type + body, type; then the body
+_RECORD_HEADER = struct.Struct("!IIB")
+_SEQUENCE = struct.Struct("!Q")
+_EVENT_RECORD = 1  # Body: sequence, codec-encoded event
+_ACK_RECORD = 2    # Body: sequence
+_SEGMENT_GLOB = "segment-*.log"
+
+class EventJournal:
+    """
+    Crash-safe log of events between publish and delivery.
+    
+    ``append`` records a published event and gives it a sequence number;
+    ``ack`` records that it no longer needs delivering. Records go to
+    append-only segment files. On restart ``open`` returns the events that
+    were never acknowledged so they can be delivered again, which makes
+    delivery at-least-once across crashes.
+    
+    Writes use group commit: a committer thread writes everything appended
+    since its last pass and fsyncs once, so concurrent publishers share one
+    fsync instead of paying one each. When no ``commit()`` is waiting it
+    first lets records accumulate for ``commit_delay``, so it does not
+    contend with the event loop for the GIL on every record. ``commit()``
+    waits until every record appended so far is durable. Acknowledgements
+    are never waited on; a lost ack only means a duplicate delivery after
+    a crash.
+    
+    Segments are rolled at ``segment_size``. A compaction thread deletes
+    sealed segments whose events are all acknowledged, and rewrites those
+    whose live fraction falls below ``compact_ratio`` by copying their
+    unacknowledged events to the head of the journal. Segments are only
+    ever removed oldest first: a segment's ack records may refer to events
+    in older segments, and dropping them while those events are still on
+    disk would bring the events back on the next ``open``.
+    """
+    
+    def __init__(self, directory: Union[str, Path],
+                 codec: Optional[EventCodec] = None,
+                 segment_size: int = 16 * 1024 * 1024,
+                 fsync: bool = True,
+                 commit_delay: timedelta = timedelta(milliseconds=2),
+                 compact_interval: timedelta = timedelta(seconds=10),
+                 compact_ratio: float = 0.25):
+        """
+        Initialize the journal; call ``open`` before appending.
+        
+        Args:
+            directory: Directory holding the segment files
+            codec: Event codec for journaled events
+            segment_size: Bytes after which a new segment is started
+            fsync: fsync each group commit; disable only where losing the
+                last commits on power loss is acceptable
+            commit_delay: Time the committer lets records accumulate after
+                waking, trading commit latency for fewer, larger writes
+            compact_interval: Time between compaction passes
+            compact_ratio: Live-event fraction below which a sealed segment
+                is rewritten
+        """
+        if segment_size <= 0:
+            raise ValueError(f"segment_size must be positive, got {segment_size}")
+        self._directory = Path(directory)
+        self._codec = codec or BinaryCodec()
+        self._segment_size = segment_size
+        self._fsync = fsync
+        self._commit_delay = commit_delay.total_seconds()
+        self._compact_interval = compact_interval.total_seconds()
+        self._compact_ratio = compact_ratio
+        
+        # Guarded by _cond
+        self._cond = threading.Condition()
+        self._buffer: List[Tuple[int, bytes]] = []  # (segment, record) awaiting write
+        self._appended = 0                          # Records appended so far
+        self._durable = 0                           # Records written and synced
+        self._waiters: List[Tuple[int, asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._next_sequence = 1
+        self._segment = 0                           # Segment new records go to
+        self._segment_bytes = 0
+        self._live: Dict[int, Set[int]] = {}        # Segment -> unacked sequences
+        self._totals: Dict[int, int] = {}           # Segment -> events written
+        self._locations: Dict[int, int] = {}        # Sequence -> segment
+        self._error: Optional[BaseException] = None
+        
+        self._files: Dict[int, int] = {}            # Committer thread only
+        # With O_DSYNC each write returns once durable: one syscall, and one
+        # GIL hand-back, per group commit instead of a write plus an fsync
+        self._open_flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | (os.O_DSYNC if fsync else 0)
+        self._closing = False
+        self._stop_compaction = threading.Event()
+        self._committer: Optional[threading.Thread] = None
+        self._compactor: Optional[threading.Thread] = None
+    
+    def open(self) -> List[Event]:
+        """
+        Recover the journal and start the commit and compaction threads.
+        
+        Returns:
+            Unacknowledged events in publish order, with their ``sequence``
+            set; acknowledge each once it has been delivered again
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        events: Dict[int, Tuple[int, bytes]] = {}
+        acked: Set[int] = set()
+        last_segment = 0
+        
+        for path in sorted(self._directory.glob(_SEGMENT_GLOB)):
+            segment = int(path.stem.split("-")[1])
+            last_segment = max(last_segment, segment)
+            self._totals[segment] = 0
+            self._live[segment] = set()
+            for record_type, body in self._read_segment(path):
+                (sequence,) = _SEQUENCE.unpack_from(body)
+                self._next_sequence = max(self._next_sequence, sequence + 1)
+                if record_type == _EVENT_RECORD:
+                    events[sequence] = (segment, body[_SEQUENCE.size:])
+                    self._totals[segment] += 1
+                else:
+                    acked.add(sequence)
+        
+        recovered = []
+        for sequence in sorted(events.keys() - acked):
+            segment, data = events[sequence]
+            try:
+                event = self._codec.decode(data)
+            except EventCodecError as e:
+                logger.error("Dropping undecodable journaled event", sequence=sequence, error=str(e))
+                continue
+            event.sequence = sequence
+            self._locations[sequence] = segment
+            self._live[segment].add(sequence)
+            recovered.append(event)
+        
+        # Never append to a recovered segment; it may end in a torn record
+        self._segment = last_segment + 1
+        self._live.setdefault(self._segment, set())
+        self._totals.setdefault(self._segment, 0)
+        
+        self._committer = threading.Thread(target=self._commit_loop, name="event-journal-commit", daemon=True)
+        self._committer.start()
+        self._compactor = threading.Thread(target=self._compact_loop, name="event-journal-compact", daemon=True)
+        self._compactor.start()
+        
+        logger.info(
+            "Event journal opened",
+            directory=str(self._directory),
+            recovered=len(recovered),
+            segments=len(self._totals)
+        )
+        return recovered
+    
+    def append(self, event: Event) -> int:
+        """
+        Journal a published event and assign its sequence number.
+        
+        The record is durable once a later ``commit()`` returns.
+        
+        Args:
+            event: Event being published
+        
+        Returns:
+            The event's sequence number, also stored on ``event.sequence``
+        
+        Raises:
+            EventCodecError: If the event cannot be encoded
+        """
+        data = self._codec.encode(event)
+        with self._cond:
+            sequence = self._next_sequence
+            self._next_sequence += 1
+            body = _SEQUENCE.pack(sequence) + data
+            segment = self._enqueue(_EVENT_RECORD, body)
+            self._live[segment].add(sequence)
+            self._totals[segment] += 1
+            self._locations[sequence] = segment
+        event.sequence = sequence
+        return sequence
+    
+    def ack(self, sequence: int) -> None:
+        """
+        Record that an event needs no further delivery.
+        
+        Args:
+            sequence: Sequence number from ``append`` or recovery
+        """
+        with self._cond:
+            segment = self._locations.pop(sequence, None)
+            if segment is None:
+                return
+            self._live[segment].discard(sequence)
+            self._enqueue(_ACK_RECORD, _SEQUENCE.pack(sequence))
+    
+    async def commit(self) -> None:
+        """
+        Wait until every record appended so far is durable.
+        
+        Raises:
+            OSError: If the journal could not be written
+        """
+        loop = asyncio.get_running_loop()
+        with self._cond:
+            if self._error is not None:
+                raise self._error
+            target = self._appended
+            if self._durable >= target:
+                return
+            future = loop.create_future()
+            self._waiters.append((target, loop, future))
+        await future
+    
+    async def close(self) -> None:
+        """Write out buffered records and stop the journal's threads."""
+        self._stop_compaction.set()
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        for thread in (self._compactor, self._committer):
+            if thread is not None:
+                await asyncio.get_running_loop().run_in_executor(None, thread.join)
+        logger.info("Event journal closed", pending_events=len(self._locations))
+    
+    @classmethod
+    def read(cls, directory: Union[str, Path],
+             codec: Optional[EventCodec] = None) -> Iterator[Event]:
+        """
+        Stream every event still held in a journal, acknowledged or not.
+        
+        Events are yielded in sequence order, so a reader can resume after
+        the last sequence it saw. Compaction copies events to newer
+        segments, so the segments are first scanned one at a time for the
+        location of each event's earliest copy; only that index, not the
+        events, is held in memory. Events from segments already compacted
+        away are gone.
+        
+        Args:
+            directory: Journal directory
+            codec: Codec the journal was written with
+        
+        Yields:
+            Events with ``sequence`` set to their journal sequence number
+        """
+        journal = cls(directory, codec=codec)
+        locations: Dict[int, Tuple[Path, int, int]] = {}  # Sequence -> (segment, offset, length)
+        for path in sorted(journal._directory.glob(_SEGMENT_GLOB)):
+            offset = 0
+            for record_type, body in journal._read_segment(path):
+                start = offset + _RECORD_HEADER.size + _SEQUENCE.size
+                offset += _RECORD_HEADER.size + len(body)
+                if record_type != _EVENT_RECORD:
+                    continue
+                (sequence,) = _SEQUENCE.unpack_from(body)
+                # Keep the original; later copies were made by compaction
+                locations.setdefault(sequence, (path, start, len(body) - _SEQUENCE.size))
+        
+        files: Dict[Path, BinaryIO] = {}
+        try:
+            for sequence in sorted(locations):
+                path, start, length = locations[sequence]
+                try:
+                    handle = files.get(path)
+                    if handle is None:
+                        handle = files[path] = open(path, "rb")
+                    handle.seek(start)
+                    data = handle.read(length)
+                except OSError as e:
+                    # Compacted away since the scan; its events were acknowledged
+                    logger.warning("Skipping journaled event lost to compaction",
+                                   sequence=sequence, error=str(e))
+                    continue
+                try:
+                    event = journal._codec.decode(data)
+                except EventCodecError as e:
+                    logger.error("Skipping undecodable journaled event", sequence=sequence, error=str(e))
+                    continue
+                event.sequence = sequence
+                yield event
+        finally:
+            for handle in files.values():
+                handle.close()
+    
+    def pending_count(self) -> int:
+        """Number of journaled events not yet acknowledged."""
+        return len(self._locations)
+    
+    def _enqueue(self, record_type: int, body: bytes) -> int:
+        """Buffer a record for the committer; call with _cond held."""
+        record = _RECORD_HEADER.pack(len(body), _checksum(record_type, body), record_type) + body
+        if self._segment_bytes >= self._segment_size:
+            self._segment += 1
+            self._segment_bytes = 0
+            self._live[self._segment] = set()
+            self._totals[self._segment] = 0
+        self._segment_bytes += len(record)
+        self._buffer.append((self._segment, record))
+        self._appended += 1
+        self._cond.notify()
+        return self._segment
+    
+    def _commit_loop(self) -> None:
+        """Committer thread: write and sync whatever has accumulated, repeatedly."""
+        while True:
+            with self._cond:
+                while not self._buffer and not self._closing:
+                    self._cond.wait()
+                if not self._buffer:
+                    break
+                # Nobody is waiting on this commit; let more records gather
+                linger = self._commit_delay if not self._waiters and not self._closing else 0
+            if linger:
+                time.sleep(linger)
+            with self._cond:
+                batch, self._buffer = self._buffer, []
+                upto = self._appended
+            
+            error = None
+            try:
+                self._write(batch)
+            except OSError as e:
+                error = e
+                logger.error("Event journal write failed", directory=str(self._directory), error=str(e))
+            
+            with self._cond:
+                if error is not None:
+                    self._error = error
+                else:
+                    self._durable = upto
+                ready = [w for w in self._waiters if error is not None or w[0] <= upto]
+                self._waiters = [w for w in self._waiters if w not in ready]
+                self._cond.notify_all()
+            for _, loop, future in ready:
+                loop.call_soon_threadsafe(_settle, future, error)
+        
+        for fd in self._files.values():
+            os.close(fd)
+        self._files.clear()
+    
+    def _write(self, batch: List[Tuple[int, bytes]]) -> None:
+        """Append records to their segments, one write per segment."""
+        chunks: Dict[int, List[bytes]] = {}
+        for segment, record in batch:
+            chunks.setdefault(segment, []).append(record)
+        for segment, records in chunks.items():
+            fd = self._files.get(segment)
+            if fd is None:
+                # Earlier segments are sealed; close them
+                for old in [s for s in self._files if s < segment]:
+                    os.close(self._files.pop(old))
+                fd = self._files[segment] = os.open(self._segment_path(segment), self._open_flags, 0o644)
+                # The new file's directory entry must be durable too, or a
+                # power loss can drop the whole segment
+                self._sync_directory()
+            data = memoryview(b"".join(records))
+            while data:
+                data = data[os.write(fd, data):]
+    
+    def _compact_loop(self) -> None:
+        """Compaction thread: periodically reclaim acknowledged segments."""
+        while not self._stop_compaction.wait(self._compact_interval):
+            try:
+                self.compact()
+            except OSError as e:
+                logger.error("Event journal compaction failed", error=str(e))
+    
+    def compact(self) -> None:
+        """
+        Delete fully acknowledged sealed segments and rewrite sparse ones.
+        
+        Works from the oldest segment forward and stops at the first one
+        that is still too full to rewrite, so every segment removed is older
+        than any segment left on disk and its acks are no longer needed.
+        
+        Runs on the compaction thread; safe to call directly.
+        """
+        with self._cond:
+            head = self._segment
+            sealed = [
+                (segment, len(self._live[segment]), self._totals[segment])
+                for segment in sorted(self._live) if segment < head
+            ]
+        
+        removed = False
+        try:
+            for segment, live, total in sealed:
+                if live and total and live / total >= self._compact_ratio:
+                    break
+                if live:
+                    self._rewrite(segment)
+                with self._cond:
+                    if self._live[segment]:
+                        break  # Raced with a rewrite that found new live events
+                    del self._live[segment]
+                    del self._totals[segment]
+                self._segment_path(segment).unlink(missing_ok=True)
+                removed = True
+                logger.debug("Event journal segment compacted", segment=segment)
+        finally:
+            if removed:
+                self._sync_directory()
+    
+    def _rewrite(self, segment: int) -> None:
+        """Copy a sealed segment's live events to the head and wait until durable."""
+        with self._cond:
+            live = set(self._live[segment])
+        copies = []
+        for record_type, body in self._read_segment(self._segment_path(segment)):
+            if record_type == _EVENT_RECORD and _SEQUENCE.unpack_from(body)[0] in live:
+                copies.append(body)
+        
+        with self._cond:
+            for body in copies:
+                (sequence,) = _SEQUENCE.unpack_from(body)
+                if self._locations.get(sequence) != segment:
+                    continue  # Acknowledged meanwhile
+                head = self._enqueue(_EVENT_RECORD, body)
+                self._live[segment].discard(sequence)
+                self._live[head].add(sequence)
+                self._totals[head] += 1
+                self._locations[sequence] = head
+            target = self._appended
+            while self._durable < target and self._error is None:
+                self._cond.wait()
+            if self._error is not None:
+                raise self._error
+    
+    def _sync_directory(self) -> None:
+        """fsync the journal directory so created and removed segments persist."""
+        if not self._fsync or os.name == "nt":
+            return  # Windows cannot open a directory to fsync it
+        fd = os.open(self._directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    
+    def _read_segment(self, path: Path) -> Iterator[Tuple[int, bytes]]:
+        """Yield (type, body) records, stopping at a torn or corrupt tail."""
+        data = path.read_bytes()
+        offset = 0
+        while offset + _RECORD_HEADER.size <= len(data):
+            length, crc, record_type = _RECORD_HEADER.unpack_from(data, offset)
+            start = offset + _RECORD_HEADER.size
+            body = data[start:start + length]
+            if len(body) < length or _checksum(record_type, body) != crc:
+                break
+            yield record_type, body
+            offset = start + length
+        if offset != len(data):
+            logger.warning(
+                "Event journal segment has a torn or corrupt tail",
+                segment=path.name,
+                discarded_bytes=len(data) - offset
+            )
+    
+    def _segment_path(self, segment: int) -> Path:
+        return self._directory / f"segment-{segment:08d}.log"
+
+def _checksum(record_type: int, body: bytes) -> int:
+    """CRC32 over a record's type byte and body."""
+    return zlib.crc32(body, zlib.crc32(bytes((record_type,))))
+
+def _settle(future: asyncio.Future, error: Optional[BaseException]) -> None:
+    """Resolve a commit waiter on its own event loop."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(None)
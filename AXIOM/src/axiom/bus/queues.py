@@ -0,0 +1,507 @@
+"""
+Bounded, prioritised event queue with per-topic overflow policies.
+
+The queue is asyncio-native and owned by the bus's event loop. Each topic
+is assigned a priority lane; lanes are drained by a weighted round-robin
+scheduler, and a lane whose oldest event has waited longer than the
+starvation limit is served next regardless of weights. Events a
+dispatcher has dequeued but parked behind a busy ordering key keep their
+slot until they are dispatched, so parking cannot stretch the bound. When
+the queue, or a topic's own quota, is full the topic's overflow policy
+decides what happens to a new event:
+- BLOCK: wait for space, optionally up to a timeout
+- DROP_OLDEST: discard the oldest queued event of the same topic
+- DROP_NEWEST: discard the new event
+- COALESCE: replace a queued event with the same key instead of adding one;
+  a new key waits for space like BLOCK
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import Enum, IntEnum
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, Union
+
+from .events import Event
+from .exceptions import EventQueueFullError
+
+class OverflowPolicy(Enum):
+    """What a full queue does with a newly published event."""
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    COALESCE = "coalesce"
+
+class EventPriority(IntEnum):
+    """Priority lanes, most urgent first."""
+    CRITICAL = 0  # Safety-critical notifications and alerts
+    HIGH = 1
+    NORMAL = 2
+    LOW = 3       # Bulk logging and sensor traffic
+
+# Dequeues each lane gets per scheduling round while others are backlogged
+DEFAULT_LANE_WEIGHTS: Dict[EventPriority, int] = {
+    EventPriority.CRITICAL: 8,
+    EventPriority.HIGH: 4,
+    EventPriority.NORMAL: 2,
+    EventPriority.LOW: 1,
+}
+
+class PutResult(Enum):
+    """Outcome of offering an event to the queue."""
+    QUEUED = "queued"
+    COALESCED = "coalesced"
+    DROPPED = "dropped"
+
+@dataclass(frozen=True)
+class OverflowConfig:
+    """Overflow handling for one topic."""
+    policy: OverflowPolicy = OverflowPolicy.BLOCK
+    timeout: Optional[timedelta] = None  # BLOCK/COALESCE wait limit; None waits forever
+    coalesce_key: Union[str, Tuple[str, ...], None] = None  # Payload field(s) identifying COALESCE duplicates
+    max_queued: Optional[int] = None     # Per-topic quota within the shared queue
+    
+    def __post_init__(self):
+        """Validate overflow settings."""
+        if self.policy is OverflowPolicy.COALESCE and not self.coalesce_key:
+            raise ValueError("COALESCE overflow policy requires a coalesce_key")
+        if self.max_queued is not None and self.max_queued <= 0:
+            raise ValueError(f"max_queued must be positive, got {self.max_queued}")
+
+class _Entry:
+    """Queue slot; mutable so COALESCE can swap the event in place."""
+    __slots__ = ("event", "key", "enqueued_at")
+    
+    def __init__(self, event: Event, key: Optional[Tuple[str, Any]]):
+        self.event = event
+        self.key = key
+        self.enqueued_at = time.monotonic()
+
+class EventQueue:
+    """
+    Bounded multi-lane queue of events with per-topic overflow policies.
+    
+    Events are FIFO within a lane, and every topic maps to exactly one lane,
+    so per-topic order is preserved. Mirrors the ``asyncio.Queue`` interface
+    the bus relies on (``get``, ``task_done``, ``join``, ``qsize``,
+    ``maxsize``) so callers can treat it as a drop-in replacement.
+    """
+    
+    def __init__(self, maxsize: int, default: Optional[OverflowConfig] = None,
+                 lane_weights: Optional[Dict[EventPriority, int]] = None,
+                 max_lane_wait: Optional[timedelta] = timedelta(seconds=1),
+                 on_discard: Optional[Callable[[Event], None]] = None,
+                 on_dequeue: Optional[Callable[[Event, float], None]] = None):
+        """
+        Initialize the queue.
+        
+        Args:
+            maxsize: Maximum number of queued events across all topics
+            default: Overflow handling for topics without their own config
+            lane_weights: Dequeues per scheduling round for each priority lane
+            max_lane_wait: Age at which a lane's oldest event is served ahead
+                of weights (starvation protection); None disables it
+            on_discard: Called with each queued event that leaves the queue
+                without being dequeued (coalesced over or evicted)
+            on_dequeue: Called with each dequeued event and the seconds it
+                spent queued
+        """
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self._maxsize = maxsize
+        self._default = default or OverflowConfig()
+        self._configs: Dict[str, OverflowConfig] = {}
+        self._on_discard = on_discard
+        self._on_dequeue = on_dequeue
+        
+        weights = {**DEFAULT_LANE_WEIGHTS, **(lane_weights or {})}
+        if any(weight <= 0 for weight in weights.values()):
+            raise ValueError("Lane weights must be positive")
+        self._weights = weights
+        self._credits = dict(weights)
+        self._aged_this_round: set = set()
+        self._max_lane_wait = None if max_lane_wait is None else max_lane_wait.total_seconds()
+        self._priorities: Dict[str, EventPriority] = {}
+        self._lanes: Dict[EventPriority, Deque[_Entry]] = {
+            priority: deque() for priority in sorted(EventPriority)
+        }
+        self._size = 0
+        # Dequeued events parked by the dispatcher, still holding their slot
+        self._parked = 0
+        self._parked_by_type: Dict[str, int] = {}
+        
+        self._coalesce_index: Dict[Tuple[str, Any], _Entry] = {}
+        self._getters: Deque[asyncio.Future] = deque()
+        self._putters: Deque[asyncio.Future] = deque()
+        self._unfinished = 0
+        self._finished: Optional[asyncio.Event] = None
+        
+        # Gauges and counters, per topic
+        self._depths: Dict[str, int] = {}
+        self._dropped: Dict[str, int] = {}
+        self._coalesced: Dict[str, int] = {}
+        self._timeouts: Dict[str, int] = {}
+        self._aged: Dict[EventPriority, int] = {}  # Dequeues forced by starvation protection
+    
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of queued events."""
+        return self._maxsize
+    
+    def qsize(self) -> int:
+        """Number of events currently queued."""
+        return self._size
+    
+    def empty(self) -> bool:
+        """Whether no events are queued."""
+        return not self._size
+    
+    def full(self) -> bool:
+        """Whether the shared queue, counting parked events, is at capacity."""
+        return self._size + self._parked >= self._maxsize
+    
+    def set_config(self, event_type: str, config: OverflowConfig) -> None:
+        """Set the overflow handling for one topic."""
+        self._configs[event_type] = config
+    
+    def get_config(self, event_type: str) -> OverflowConfig:
+        """Get the overflow handling that applies to a topic."""
+        return self._configs.get(event_type, self._default)
+    
+    def set_priority(self, event_type: str, priority: EventPriority) -> None:
+        """
+        Assign a topic to a priority lane.
+        
+        Only affects events queued afterwards; events already waiting stay in
+        their lane, so a topic should be assigned before it is published.
+        """
+        self._priorities[event_type] = priority
+    
+    def get_priority(self, event_type: str) -> EventPriority:
+        """Get the priority lane a topic is queued in."""
+        return self._priorities.get(event_type, EventPriority.NORMAL)
+    
+    async def put(self, event: Event) -> PutResult:
+        """
+        Offer an event, applying its topic's overflow policy if there is no room.
+        
+        Args:
+            event: Event to queue
+            
+        Returns:
+            Whether the event was queued, merged into a queued event, or dropped
+            
+        Raises:
+            EventQueueFullError: If a BLOCK or COALESCE topic timed out waiting
+        """
+        config = self.get_config(event.event_type)
+        key = self._coalesce_key(event, config)
+        
+        if not self._has_room(event.event_type, config):
+            if config.policy is OverflowPolicy.DROP_NEWEST:
+                self._count(self._dropped, event.event_type)
+                return PutResult.DROPPED
+            if config.policy is OverflowPolicy.DROP_OLDEST:
+                if not self._evict_oldest(event.event_type):
+                    self._count(self._dropped, event.event_type)
+                    return PutResult.DROPPED
+            else:
+                if key is not None and key in self._coalesce_index:
+                    self._replace(self._coalesce_index[key], event)
+                    return PutResult.COALESCED
+                await self._wait_for_room(event.event_type, config)
+                if key is not None and key in self._coalesce_index:
+                    # A duplicate was queued while we waited; merge into it
+                    self._replace(self._coalesce_index[key], event)
+                    return PutResult.COALESCED
+        
+        self._append(event, key)
+        return PutResult.QUEUED
+    
+    async def get(self) -> Event:
+        """Remove and return the oldest event, waiting until one is available."""
+        while not self._size:
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                try:
+                    self._getters.remove(getter)
+                except ValueError:
+                    pass
+                if self._size and not getter.cancelled():
+                    self._wakeup_next(self._getters)
+                raise
+        return self.get_nowait()
+    
+    def get_nowait(self) -> Event:
+        """
+        Remove and return the oldest event without waiting.
+        
+        Raises:
+            asyncio.QueueEmpty: If no events are queued
+        """
+        if not self._size:
+            raise asyncio.QueueEmpty
+        entry = self._next_lane().popleft()
+        self._size -= 1
+        self._forget(entry)
+        self._wakeup_putters()
+        if self._on_dequeue is not None:
+            self._on_dequeue(entry.event, time.monotonic() - entry.enqueued_at)
+        return entry.event
+    
+    def park(self, event: Event) -> None:
+        """
+        Keep a dequeued event's slot while it waits outside the queue.
+        
+        The dispatcher parks events whose ordering key another worker is
+        delivering; until ``unpark`` they count against ``maxsize`` and
+        their topic's quota, so overflow policies still apply to publishers.
+        
+        Args:
+            event: Event returned by ``get`` and not yet dispatched
+        """
+        self._parked += 1
+        self._count(self._parked_by_type, event.event_type)
+    
+    def unpark(self, event: Event) -> None:
+        """
+        Free the slot of a parked event that is now being dispatched.
+        
+        Args:
+            event: Event previously passed to ``park``
+        """
+        self._release_parked(event)
+        self._wakeup_putters()
+    
+    def requeue(self, event: Event) -> None:
+        """
+        Put a parked event back at the head of its lane.
+        
+        Used when the dispatcher stops before reaching a parked event, so it
+        is not lost. Requeue a backlog newest first to keep its order. The
+        event still awaits its ``task_done``, so it is not counted again.
+        
+        Args:
+            event: Event previously passed to ``park``
+        """
+        self._release_parked(event)
+        self._lanes[self.get_priority(event.event_type)].appendleft(_Entry(event, None))
+        self._size += 1
+        self._depths[event.event_type] = self._depths.get(event.event_type, 0) + 1
+        self._wakeup_next(self._getters)
+    
+    def task_done(self) -> None:
+        """Mark a previously dequeued event as fully processed."""
+        if self._unfinished <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished -= 1
+        if self._unfinished == 0 and self._finished is not None:
+            self._finished.set()
+    
+    async def join(self) -> None:
+        """Wait until every queued event has been processed."""
+        if self._unfinished > 0:
+            if self._finished is None:
+                self._finished = asyncio.Event()
+            self._finished.clear()
+            await self._finished.wait()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get queue gauges and overflow counters.
+        
+        Returns:
+            Dictionary with overall depth, events parked by the dispatcher,
+            and per-topic depth, drop, coalesce and publish-timeout counts
+        """
+        return {
+            "depth": self._size,
+            "parked": self._parked,
+            "maxsize": self._maxsize,
+            "depth_by_type": dict(self._depths),
+            "depth_by_priority": {
+                priority.name.lower(): len(lane) for priority, lane in self._lanes.items()
+            },
+            "aged_by_priority": {
+                priority.name.lower(): count for priority, count in self._aged.items()
+            },
+            "dropped": sum(self._dropped.values()),
+            "dropped_by_type": dict(self._dropped),
+            "coalesced_by_type": dict(self._coalesced),
+            "timeouts_by_type": dict(self._timeouts),
+        }
+    
+    def _has_room(self, event_type: str, config: OverflowConfig) -> bool:
+        """Whether both the shared queue and the topic quota have space."""
+        if self._size + self._parked >= self._maxsize:
+            return False
+        if config.max_queued is not None and \
+                self._depths.get(event_type, 0) + self._parked_by_type.get(event_type, 0) >= config.max_queued:
+            return False
+        return True
+    
+    async def _wait_for_room(self, event_type: str, config: OverflowConfig) -> None:
+        """Park until the topic has room, honouring the topic's timeout."""
+        loop = asyncio.get_running_loop()
+        deadline = None if config.timeout is None else loop.time() + config.timeout.total_seconds()
+        
+        while not self._has_room(event_type, config):
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                self._count(self._timeouts, event_type)
+                raise EventQueueFullError(
+                    f"Timed out after {config.timeout.total_seconds()}s waiting to queue {event_type}"
+                )
+            
+            putter = loop.create_future()
+            self._putters.append(putter)
+            try:
+                await asyncio.wait_for(asyncio.shield(putter), remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                if not putter.done():
+                    putter.cancel()
+                try:
+                    self._putters.remove(putter)
+                except ValueError:
+                    pass
+        
+    
+    def _evict_oldest(self, event_type: str) -> bool:
+        """Drop the oldest queued event of a topic; False if none is queued."""
+        lane = self._lanes[self.get_priority(event_type)]
+        for entry in lane:
+            if entry.event.event_type == event_type:
+                lane.remove(entry)
+                self._size -= 1
+                self._forget(entry)
+                self._count(self._dropped, event_type)
+                self.task_done()
+                if self._on_discard is not None:
+                    self._on_discard(entry.event)
+                return True
+        return False
+    
+    def _replace(self, entry: _Entry, event: Event) -> None:
+        """Swap a newer duplicate into a queued entry (COALESCE)."""
+        superseded, entry.event = entry.event, event
+        self._count(self._coalesced, event.event_type)
+        if self._on_discard is not None:
+            self._on_discard(superseded)
+    
+    def _append(self, event: Event, key: Optional[Tuple[str, Any]]) -> None:
+        """Queue a new entry and wake one waiting consumer."""
+        entry = _Entry(event, key)
+        self._lanes[self.get_priority(event.event_type)].append(entry)
+        self._size += 1
+        if key is not None:
+            self._coalesce_index[key] = entry
+        self._depths[event.event_type] = self._depths.get(event.event_type, 0) + 1
+        self._unfinished += 1
+        if self._finished is not None:
+            self._finished.clear()
+        self._wakeup_next(self._getters)
+    
+    def _next_lane(self) -> Deque[_Entry]:
+        """
+        Pick the lane to dequeue from; at least one lane must be non-empty.
+        
+        The most urgent non-empty lane with credits left is served, and
+        credits are refilled from the weights once every backlogged lane has
+        spent its share, so each lane is guaranteed its weighted fraction.
+        On top of that, a lane whose head has waited past the starvation
+        limit may jump ahead once per round. Capping the jump at once per
+        round keeps a permanently backlogged low lane from turning the
+        scheduler back into plain FIFO.
+        """
+        if self._max_lane_wait is not None:
+            now = time.monotonic()
+            starved = None
+            for priority, lane in self._lanes.items():
+                if not lane or priority in self._aged_this_round:
+                    continue
+                if now - lane[0].enqueued_at > self._max_lane_wait:
+                    if starved is None or lane[0].enqueued_at < self._lanes[starved][0].enqueued_at:
+                        starved = priority
+            if starved is not None:
+                self._aged_this_round.add(starved)
+                self._aged[starved] = self._aged.get(starved, 0) + 1
+                return self._lanes[starved]
+        
+        for _ in range(2):
+            for priority, lane in self._lanes.items():
+                if lane and self._credits[priority] > 0:
+                    self._credits[priority] -= 1
+                    return lane
+            self._credits = dict(self._weights)
+            self._aged_this_round.clear()
+        raise asyncio.QueueEmpty
+    
+    def _forget(self, entry: _Entry) -> None:
+        """Remove an entry that left the queue from the index and gauges."""
+        if entry.key is not None and self._coalesce_index.get(entry.key) is entry:
+            del self._coalesce_index[entry.key]
+        event_type = entry.event.event_type
+        self._depths[event_type] -= 1
+        if not self._depths[event_type]:
+            del self._depths[event_type]
+    
+    def _release_parked(self, event: Event) -> None:
+        """Stop counting a parked event against the bound."""
+        self._parked -= 1
+        remaining = self._parked_by_type[event.event_type] - 1
+        if remaining:
+            self._parked_by_type[event.event_type] = remaining
+        else:
+            del self._parked_by_type[event.event_type]
+    
+    @staticmethod
+    def _coalesce_key(event: Event, config: OverflowConfig) -> Optional[Tuple[str, Any]]:
+        """Get the key identifying duplicates of an event, if its topic coalesces."""
+        if config.policy is not OverflowPolicy.COALESCE:
+            return None
+        if isinstance(config.coalesce_key, str):
+            value = event.payload.get(config.coalesce_key)
+        else:
+            value = tuple(event.payload.get(field) for field in config.coalesce_key)
+            if all(part is None for part in value):
+                value = None
+        if value is None:
+            return None
+        try:
+            hash(value)
+        except TypeError:
+            return None
+        return (event.event_type, value)
+    
+    @staticmethod
+    def _count(counter: Dict[str, int], event_type: str) -> None:
+        counter[event_type] = counter.get(event_type, 0) + 1
+    
+    def _wakeup_putters(self) -> None:
+        """
+        Wake every blocked publisher to re-check for room.
+        
+        Quotas are per topic, so the space one get() frees may only suit a
+        publisher further back in line. Putters exist only under overflow,
+        so waking them all is cheap.
+        """
+        while self._putters:
+            putter = self._putters.popleft()
+            if not putter.done():
+                putter.set_result(None)
+    
+    @staticmethod
+    def _wakeup_next(waiters: Deque[asyncio.Future]) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
@@ -0,0 +1,273 @@
+"""Replay persisted events through event bus subscribers to rebuild derived state."""
+
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from .codec import EventCodec
+from .event_bus import EventBus
+from .events import Event
+from .journal import EventJournal
+from axiom.state.store import StateStore
+from axiom.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+@dataclass
+class ReplayCheckpoint:
+    """How far a replay got, and the derived state at that point."""
+    source: str                                # What was being replayed
+    position: int                              # Row ID or journal sequence of the last event
+    replayed: int                              # Events delivered so far
+    event_time: Optional[datetime] = None      # Timestamp of the last event
+    state: Optional[Dict[str, Any]] = None     # Snapshot of derived state
+    saved_at: datetime = field(default_factory=datetime.now)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-compatible dictionary."""
+        return {
+            "source": self.source,
+            "position": self.position,
+            "replayed": self.replayed,
+            "event_time": self.event_time.isoformat() if self.event_time else None,
+            "state": self.state,
+            "saved_at": self.saved_at.isoformat()
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ReplayCheckpoint':
+        """Create instance from a dictionary made by ``to_dict``."""
+        return cls(
+            source=data["source"],
+            position=data["position"],
+            replayed=data["replayed"],
+            event_time=datetime.fromisoformat(data["event_time"]) if data["event_time"] else None,
+            state=data.get("state"),
+            saved_at=datetime.fromisoformat(data["saved_at"])
+        )
+
+class ReplayEngine:
+    """
+    Streams persisted events back through an ``EventBus``'s subscribers.
+    
+    Events are read from the state store's ``system_events`` table or from
+    an event journal one page or segment at a time, so memory stays
+    constant however long the history is. Each event is handed to the
+    bus's current subscribers with ``EventBus.redeliver`` and the next one
+    is read only once they have all run, so handlers see events in their
+    original order.
+    
+    With ``speed`` unset events are replayed as fast as handlers take them;
+    otherwise the original gaps between events are reproduced, divided by
+    ``speed`` (2.0 replays twice as fast as recorded).
+    
+    With a ``checkpoint_path`` the engine saves its position every
+    ``checkpoint_every`` events and at the end, together with a snapshot of
+    derived state from the ``snapshot`` callback. A later replay of the same
+    source resumes after the saved position, handing the snapshot to
+    ``restore`` first, instead of starting from the beginning.
+    """
+    
+    def __init__(self, bus: EventBus,
+                 speed: Optional[float] = None,
+                 subscribers: Optional[Iterable[str]] = None,
+                 checkpoint_path: Union[str, Path, None] = None,
+                 checkpoint_every: int = 10_000,
+                 snapshot: Optional[Callable[[], Dict[str, Any]]] = None,
+                 restore: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Initialize the replay engine.
+        
+        Args:
+            bus: Event bus whose subscribers receive the replayed events
+            speed: Multiple of recorded speed to replay at; None for as fast
+                as possible
+            subscribers: Only replay to subscribers with these names (module
+                and qualified name of the handler), e.g. the projections
+                being rebuilt; None replays to every subscriber
+            checkpoint_path: JSON file for checkpoints; None disables them
+            checkpoint_every: Events between checkpoints
+            snapshot: Returns JSON-compatible derived state to checkpoint
+            restore: Reloads derived state from a checkpoint when resuming
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError(f"speed must be positive, got {speed}")
+        if checkpoint_every <= 0:
+            raise ValueError(f"checkpoint_every must be positive, got {checkpoint_every}")
+        self._bus = bus
+        self._speed = speed
+        self._subscribers = set(subscribers) if subscribers is not None else None
+        self._checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self._checkpoint_every = checkpoint_every
+        self._snapshot = snapshot
+        self._restore = restore
+    
+    async def replay_store(self, store: StateStore,
+                           start: Optional[datetime] = None,
+                           end: Optional[datetime] = None,
+                           resume: bool = True,
+                           chunk_size: int = 500) -> int:
+        """
+        Replay events logged to the state store's ``system_events`` table.
+        
+        Args:
+            store: State store holding the events
+            start: Only replay events at or after this time
+            end: Only replay events before this time
+            resume: Continue from this source's checkpoint, if there is one
+            chunk_size: Rows read per query
+        
+        Returns:
+            Number of events replayed in this call
+        """
+        source = f"store:{store.db_path}"
+        checkpoint = self._resume_point(source) if resume else None
+        rows = store.iter_system_events(
+            start=start,
+            end=end,
+            after_id=checkpoint.position if checkpoint else 0,
+            chunk_size=chunk_size
+        )
+        
+        def events() -> Iterator[Tuple[int, Event]]:
+            for row_id, record in rows:
+                try:
+                    event = Event(
+                        event_type=record.event_type,
+                        payload=record.payload,
+                        source=record.source,
+                        timestamp=record.timestamp,
+                        correlation_id=record.correlation_id
+                    )
+                except (ValueError, TypeError) as e:
+                    logger.warning("Skipping unreplayable system event", row_id=row_id, error=str(e))
+                    continue
+                yield row_id, event
+        
+        return await self._replay(source, events(), checkpoint)
+    
+    async def replay_journal(self, directory: Union[str, Path],
+                             codec: Optional[EventCodec] = None,
+                             start: Optional[datetime] = None,
+                             end: Optional[datetime] = None,
+                             resume: bool = True) -> int:
+        """
+        Replay the events held in an event journal directory.
+        
+        Only events the journal has not compacted away are available.
+        
+        Args:
+            directory: Journal directory
+            codec: Codec the journal was written with
+            start: Only replay events at or after this time
+            end: Only replay events before this time
+            resume: Continue from this source's checkpoint, if there is one
+        
+        Returns:
+            Number of events replayed in this call
+        """
+        source = f"journal:{Path(directory)}"
+        checkpoint = self._resume_point(source) if resume else None
+        after = checkpoint.position if checkpoint else 0
+        
+        def events() -> Iterator[Tuple[int, Event]]:
+            for event in EventJournal.read(directory, codec):
+                sequence, event.sequence = event.sequence, None
+                if sequence <= after:
+                    continue
+                if (start and event.timestamp < start) or (end and event.timestamp >= end):
+                    continue
+                yield sequence, event
+        
+        return await self._replay(source, events(), checkpoint)
+    
+    def load_checkpoint(self) -> Optional[ReplayCheckpoint]:
+        """
+        Read the saved checkpoint.
+        
+        Returns:
+            The checkpoint, or None if there is none or it is unreadable
+        """
+        if self._checkpoint_path is None or not self._checkpoint_path.exists():
+            return None
+        try:
+            return ReplayCheckpoint.from_dict(json.loads(self._checkpoint_path.read_text()))
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Ignoring unreadable replay checkpoint",
+                           path=str(self._checkpoint_path), error=str(e))
+            return None
+    
+    def _resume_point(self, source: str) -> Optional[ReplayCheckpoint]:
+        """Load the checkpoint for a source and restore its derived state."""
+        checkpoint = self.load_checkpoint()
+        if checkpoint is None or checkpoint.source != source:
+            return None
+        if checkpoint.state is not None and self._restore is not None:
+            self._restore(checkpoint.state)
+        logger.info(
+            "Resuming replay from checkpoint",
+            source=source,
+            position=checkpoint.position,
+            replayed=checkpoint.replayed
+        )
+        return checkpoint
+    
+    async def _replay(self, source: str, events: Iterator[Tuple[int, Event]],
+                      checkpoint: Optional[ReplayCheckpoint]) -> int:
+        """
+        Deliver positioned events in order, pacing and checkpointing.
+        
+        Args:
+            source: Source name recorded in checkpoints
+            events: (position, event) pairs in ascending position order, so
+                resuming after the highest saved position skips nothing
+            checkpoint: Checkpoint being resumed from, if any
+        """
+        total = checkpoint.replayed if checkpoint else 0
+        position = checkpoint.position if checkpoint else 0
+        last_time = checkpoint.event_time if checkpoint else None
+        replayed = 0
+        first_ns = started = None
+        
+        for event_position, event in events:
+            if self._speed is not None:
+                if first_ns is None:
+                    first_ns, started = event.timestamp_ns, time.monotonic()
+                due = started + (event.timestamp_ns - first_ns) / 1e9 / self._speed
+                delay = due - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            
+            await self._bus.redeliver(event, self._subscribers)
+            replayed += 1
+            position = max(position, event_position)
+            last_time = event.timestamp
+            
+            if self._checkpoint_path is not None and replayed % self._checkpoint_every == 0:
+                self._save_checkpoint(source, position, total + replayed, last_time)
+        
+        if self._checkpoint_path is not None and replayed:
+            self._save_checkpoint(source, position, total + replayed, last_time)
+        logger.info("Replay finished", source=source, replayed=replayed, position=position)
+        return replayed
+    
+    def _save_checkpoint(self, source: str, position: int, replayed: int,
+                         event_time: Optional[datetime]) -> None:
+        """Write a checkpoint atomically, so a crash leaves the previous one."""
+        checkpoint = ReplayCheckpoint(
+            source=source,
+            position=position,
+            replayed=replayed,
+            event_time=event_time,
+            state=self._snapshot() if self._snapshot is not None else None
+        )
+        self._checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self._checkpoint_path.with_name(self._checkpoint_path.name + ".tmp")
+        temporary.write_text(json.dumps(checkpoint.to_dict()))
+        os.replace(temporary, self._checkpoint_path)
+        logger.debug("Replay checkpoint saved", source=source, position=position, replayed=replayed)
@@ -0,0 +1,188 @@
+"""Circuit breakers that stop delivering to subscribers that keep failing."""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import Enum
+from threading import Lock
+from typing import Any, Callable, Deque, Dict, List
+
+class CircuitState(Enum):
+    """Breaker state."""
+    CLOSED = "closed"        # Deliveries pass; outcomes are counted
+    OPEN = "open"            # Deliveries are shed until the open duration ends
+    HALF_OPEN = "half_open"  # One probe delivery decides whether to close
+
+@dataclass(frozen=True)
+class BreakerConfig:
+    """When a subscriber's circuit breaker opens and for how long."""
+    window: timedelta = timedelta(seconds=30)         # Rolling window outcomes are counted over
+    min_calls: int = 10                               # Calls in the window before it may open
+    failure_rate: float = 0.5                         # Failing fraction of calls that opens it
+    open_duration: timedelta = timedelta(seconds=30)  # Time shed before a probe is let through
+    
+    def __post_init__(self):
+        """Validate breaker options."""
+        if self.window.total_seconds() <= 0 or self.open_duration.total_seconds() <= 0:
+            raise ValueError("window and open_duration must be positive")
+        if self.min_calls <= 0:
+            raise ValueError(f"min_calls must be positive, got {self.min_calls}")
+        if not 0 < self.failure_rate <= 1:
+            raise ValueError(f"failure_rate must be in (0, 1], got {self.failure_rate}")
+
+class CircuitBreaker:
+    """
+    Rolling error-rate circuit breaker for one subscriber.
+    
+    While CLOSED every delivery is allowed and its outcome is counted in a
+    rolling window of ten buckets, so memory is constant whatever the event
+    rate. Once the window holds at least ``min_calls`` calls and the failing
+    fraction reaches ``failure_rate`` the breaker OPENs and ``allow``
+    refuses deliveries for ``open_duration``. The next delivery after that
+    is let through alone as a HALF_OPEN probe: success closes the breaker
+    with a fresh window, failure opens it again.
+    
+    Only failures the caller reports with ``record_failure`` count against
+    the subscriber; errors caused by one bad event rather than a broken
+    handler should be reported with ``record_ignored``, which neither
+    counts towards opening the breaker nor lets a probe close it.
+    """
+    
+    _BUCKETS = 10
+    
+    def __init__(self, config: BreakerConfig = BreakerConfig(),
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the breaker, closed.
+        
+        Args:
+            config: Thresholds and durations
+            clock: Monotonic time source in seconds
+        """
+        self._config = config
+        self._clock = clock
+        self._window = config.window.total_seconds()
+        self._bucket_width = self._window / self._BUCKETS
+        self._buckets: Deque[List[float]] = deque()  # [start, calls, failures]
+        self._calls = 0
+        self._failures = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self._shed = 0
+        self._times_opened = 0
+        self._lock = Lock()
+    
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+    
+    def allow(self) -> bool:
+        """
+        Check whether a delivery may go ahead, claiming the probe if one is due.
+        
+        Returns:
+            False if the delivery should be shed
+        """
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return True
+            if self._state is CircuitState.OPEN and \
+                    self._clock() - self._opened_at >= self._config.open_duration.total_seconds():
+                self._state = CircuitState.HALF_OPEN
+            if self._state is CircuitState.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self._shed += 1
+            return False
+    
+    def record_success(self) -> CircuitState:
+        """
+        Count a delivery the subscriber handled successfully.
+        
+        Returns:
+            State after the outcome
+        """
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                self._count(failed=False)
+            elif self._probing:
+                self._reset(CircuitState.CLOSED)
+            return self._state
+    
+    def record_failure(self) -> CircuitState:
+        """
+        Count a delivery the subscriber failed.
+        
+        Returns:
+            State after the outcome
+        """
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                self._count(failed=True)
+                if self._calls >= self._config.min_calls and \
+                        self._failures >= self._config.failure_rate * self._calls:
+                    self._open()
+            elif self._probing:
+                self._open()
+            return self._state
+    
+    def record_ignored(self) -> CircuitState:
+        """
+        Report a delivery whose outcome says nothing about the subscriber.
+        
+        It is left out of the rolling window. A HALF_OPEN probe that ends
+        this way is released without closing the breaker, so the next
+        delivery becomes the probe.
+        
+        Returns:
+            State after the outcome
+        """
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._probing = False
+            return self._state
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get the state, rolling-window counts and deliveries shed so far."""
+        with self._lock:
+            self._expire(self._clock())
+            return {
+                "state": self._state.value,
+                "calls": self._calls,
+                "failures": self._failures,
+                "shed": self._shed,
+                "times_opened": self._times_opened
+            }
+    
+    def _count(self, failed: bool) -> None:
+        """Add an outcome to the current bucket; call with the lock held."""
+        now = self._clock()
+        self._expire(now)
+        if not self._buckets or now - self._buckets[-1][0] >= self._bucket_width:
+            self._buckets.append([now, 0, 0])
+        bucket = self._buckets[-1]
+        bucket[1] += 1
+        self._calls += 1
+        if failed:
+            bucket[2] += 1
+            self._failures += 1
+    
+    def _expire(self, now: float) -> None:
+        """Drop buckets that have left the window; call with the lock held."""
+        while self._buckets and now - self._buckets[0][0] >= self._window:
+            _, calls, failures = self._buckets.popleft()
+            self._calls -= calls
+            self._failures -= failures
+    
+    def _open(self) -> None:
+        self._reset(CircuitState.OPEN)
+        self._opened_at = self._clock()
+        self._times_opened += 1
+    
+    def _reset(self, state: CircuitState) -> None:
+        self._state = state
+        self._probing = False
+        self._buckets.clear()
+        self._calls = self._failures = 0
@@ -0,0 +1,206 @@
+"""
+Topic routing for the event bus.
+
+Event types are dotted topics (``system.start``, ``conversation.turn``).
+Subscriptions may use wildcard segments:
+- ``*`` matches exactly one segment (``system.*`` matches ``system.start``)
+- ``#`` matches zero or more segments (``#`` matches every topic)
+
+Patterns are stored in a topic trie. The subscriptions resolved for each
+concrete event type are cached, so steady-state dispatch is a single dict
+lookup.
+"""
+
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .exceptions import InvalidEventTypeError
+from .subscription import Subscription
+
+SEGMENT_SEPARATOR = "."
+SINGLE_WILDCARD = "*"
+MULTI_WILDCARD = "#"
+
+
+def is_pattern(topic: str) -> bool:
+    """Check whether a topic contains wildcard segments."""
+    return SINGLE_WILDCARD in topic or MULTI_WILDCARD in topic
+
+
+def validate_pattern(pattern: str) -> None:
+    """
+    Validate the syntax of a subscription topic or pattern.
+    
+    Args:
+        pattern: Dotted topic, optionally containing wildcard segments
+        
+    Raises:
+        InvalidEventTypeError: If a segment is empty or mixes a wildcard
+            with other characters
+    """
+    for segment in pattern.split(SEGMENT_SEPARATOR):
+        if not segment:
+            raise InvalidEventTypeError(f"Empty segment in topic pattern: {pattern!r}")
+        if segment in (SINGLE_WILDCARD, MULTI_WILDCARD):
+            continue
+        if SINGLE_WILDCARD in segment or MULTI_WILDCARD in segment:
+            raise InvalidEventTypeError(
+                f"Wildcards must fill a whole segment in topic pattern: {pattern!r}"
+            )
+
+
+class _TrieNode:
+    """One segment of the topic trie."""
+    __slots__ = ("children", "subscriptions")
+    
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.subscriptions: Tuple[Subscription, ...] = ()
+
+
+class RoutingTable:
+    """
+    Routes concrete event types to an immutable tuple of subscriptions.
+    
+    Subscriptions are kept in a topic trie that is only touched under a lock.
+    Resolved subscription tuples are cached per concrete event type; any
+    subscription change swaps in a fresh, empty cache rather than mutating
+    one a reader may hold. Readers therefore take one dict lookup with no
+    locking, and only fall back to a locked trie walk, O(topic depth), on the
+    first event of each type after a change.
+    """
+    
+    def __init__(self):
+        self._root = _TrieNode()
+        self._patterns: Dict[str, Tuple[Subscription, ...]] = {}
+        self._resolved: Dict[str, Tuple[Subscription, ...]] = {}
+        self._lock = Lock()
+    
+    def add(self, subscription: Subscription) -> bool:
+        """
+        Add a subscription under its topic or pattern.
+        
+        Args:
+            subscription: Subscription to route
+            
+        Returns:
+            True if it was added, False if its handler was already routed
+            for the same pattern
+        """
+        with self._lock:
+            node = self._root
+            for segment in subscription.pattern.split(SEGMENT_SEPARATOR):
+                node = node.children.setdefault(segment, _TrieNode())
+            if any(s.handler == subscription.handler for s in node.subscriptions):
+                return False
+            
+            node.subscriptions = node.subscriptions + (subscription,)
+            self._patterns[subscription.pattern] = node.subscriptions
+            self._resolved = {}
+            return True
+    
+    def remove(self, pattern: str, handler: Callable) -> Optional[Subscription]:
+        """
+        Remove a handler's subscription to a topic or pattern.
+        
+        Args:
+            pattern: Topic or pattern the handler was added with
+            handler: Handler to remove
+            
+        Returns:
+            The removed subscription, or None if the handler was not routed
+        """
+        with self._lock:
+            path = [self._root]
+            for segment in pattern.split(SEGMENT_SEPARATOR):
+                node = path[-1].children.get(segment)
+                if node is None:
+                    return None
+                path.append(node)
+            
+            node = path[-1]
+            removed = next((s for s in node.subscriptions if s.handler == handler), None)
+            if removed is None:
+                return None
+            
+            node.subscriptions = tuple(s for s in node.subscriptions if s is not removed)
+            if node.subscriptions:
+                self._patterns[pattern] = node.subscriptions
+            else:
+                del self._patterns[pattern]
+                self._prune(path, pattern.split(SEGMENT_SEPARATOR))
+            self._resolved = {}
+            return removed
+    
+    def lookup(self, event_type: str) -> Tuple[Subscription, ...]:
+        """
+        Get the subscriptions routed for a concrete event type.
+        
+        Args:
+            event_type: Concrete event type being dispatched
+            
+        Returns:
+            Tuple of subscriptions (empty if there are none)
+        """
+        subscriptions = self._resolved.get(event_type)
+        if subscriptions is not None:
+            return subscriptions
+        
+        with self._lock:
+            matched: List[Subscription] = []
+            self._match(self._root, event_type.split(SEGMENT_SEPARATOR), 0, matched)
+            # Keep first-match order while dropping handlers matched twice
+            unique: Dict[Callable, Subscription] = {}
+            for subscription in matched:
+                unique.setdefault(subscription.handler, subscription)
+            subscriptions = tuple(unique.values())
+            self._resolved[event_type] = subscriptions
+            return subscriptions
+    
+    def pattern_count(self, pattern: str) -> int:
+        """Get the number of handlers subscribed with exactly this pattern."""
+        return len(self._patterns.get(pattern, ()))
+    
+    def subscriber_count(self) -> int:
+        """Get the total number of subscriptions across all patterns."""
+        return sum(len(subscriptions) for subscriptions in self._patterns.values())
+    
+    def subscriptions(self) -> List[Subscription]:
+        """Get every routed subscription."""
+        return [s for subscriptions in self._patterns.values() for s in subscriptions]
+    
+    def clear(self) -> None:
+        """Remove all routes."""
+        with self._lock:
+            self._root = _TrieNode()
+            self._patterns = {}
+            self._resolved = {}
+    
+    def _match(self, node: _TrieNode, segments: List[str], index: int,
+               matched: List[Subscription]) -> None:
+        """Collect subscriptions of every pattern under node matching segments[index:]."""
+        multi = node.children.get(MULTI_WILDCARD)
+        if multi is not None:
+            # '#' may swallow any number of the remaining segments
+            for next_index in range(index, len(segments) + 1):
+                self._match(multi, segments, next_index, matched)
+        
+        if index == len(segments):
+            matched.extend(node.subscriptions)
+            return
+        
+        literal = node.children.get(segments[index])
+        if literal is not None:
+            self._match(literal, segments, index + 1, matched)
+        single = node.children.get(SINGLE_WILDCARD)
+        if single is not None:
+            self._match(single, segments, index + 1, matched)
+    
+    @staticmethod
+    def _prune(path: List[_TrieNode], segments: List[str]) -> None:
+        """Drop trie nodes left with neither subscriptions nor children."""
+        for depth in range(len(segments), 0, -1):
+            node = path[depth]
+            if node.subscriptions or node.children:
+                break
+            del path[depth - 1].children[segments[depth - 1]]
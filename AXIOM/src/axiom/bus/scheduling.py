@@ -0,0 +1,122 @@
+"""Heap-based timer for delayed delivery retries."""
+
+import asyncio
+import heapq
+import itertools
+from typing import Awaitable, Callable, Generic, List, Optional, Tuple, TypeVar
+
+from axiom.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+class RetryScheduler(Generic[T]):
+    """
+    Fires delayed items from a min-heap on one background task.
+    
+    Scheduling is O(log n) and never awaits, so callers on the dispatch path
+    hand off a failed delivery and move straight on. The timer task sleeps
+    until the earliest due item (or until an earlier one is scheduled) and
+    runs each due item's ``fire`` coroutine as its own task, so one slow
+    retry cannot hold back the others.
+    """
+    
+    def __init__(self, fire: Callable[[T], Awaitable[None]]):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            fire: Coroutine function run with each item when it falls due
+        """
+        self._fire = fire
+        self._heap: List[Tuple[float, int, T]] = []
+        self._sequence = itertools.count()  # Tie-breaker; items need not be comparable
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._in_flight: set = set()
+        self._stopped = False
+    
+    def __len__(self) -> int:
+        """Number of items waiting to fall due."""
+        return len(self._heap)
+    
+    def schedule(self, delay: float, item: T) -> bool:
+        """
+        Schedule an item to fire after a delay.
+        
+        Must be called from the event loop; starts the timer task on first use.
+        
+        Args:
+            delay: Seconds from now
+            item: Item passed to ``fire`` when due
+        
+        Returns:
+            False if the scheduler is stopping or stopped; the item will not fire
+        """
+        if self._stopped:
+            return False
+        loop = asyncio.get_running_loop()
+        due = loop.time() + max(0.0, delay)
+        earliest = self._heap[0][0] if self._heap else None
+        heapq.heappush(self._heap, (due, next(self._sequence), item))
+        
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        elif earliest is None or due < earliest:
+            self._wakeup.set()
+        return True
+    
+    async def stop(self) -> List[T]:
+        """
+        Stop the timer and wait for retries already firing.
+        
+        Retries that fail again while this waits cannot be rescheduled;
+        ``schedule`` refuses them from the moment ``stop`` is called.
+        
+        Returns:
+            Items that were still waiting and will not be fired
+        """
+        self._stopped = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        
+        pending = [item for _, _, item in sorted(self._heap)]
+        self._heap.clear()
+        return pending
+    
+    async def _run(self) -> None:
+        """Timer loop: sleep until the next item is due, then fire it."""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+            
+            delay = self._heap[0][0] - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            _, _, item = heapq.heappop(self._heap)
+            task = asyncio.create_task(self._fire_safely(item))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+    
+    async def _fire_safely(self, item: T) -> None:
+        try:
+            await self._fire(item)
+        except Exception as e:
+            logger.error(f"Scheduled retry failed unexpectedly: {e}")
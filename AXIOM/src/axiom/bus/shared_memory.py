@@ -0,0 +1,311 @@
+"""Shared-memory ring of fixed-size slots for passing large buffers between processes."""
+
+import fcntl
+import os
+import struct
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from threading import Lock
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional; only needed for array views
+    np = None
+
+from .events import Event
+from .exceptions import RingBufferFullError, StaleSlotError
+
+# Ring header: magic, slot size, slot count, next slot to try
+_RING_HEADER = struct.Struct("=8sIIQ")
+# Per-slot header: generation, reference count, padding, payload length
+_SLOT_HEADER = struct.Struct("=QiiQ")
+_MAGIC = b"AXRING01"
+_DATA_ALIGNMENT = 64
+
+# Payload key under which buffer events carry their slot handle
+HANDLE_KEY = "shm"
+
+@dataclass(frozen=True)
+class SlotHandle:
+    """
+    Reference to one write into a ring slot.
+    
+    The generation changes every time the slot is reused, so a handle kept
+    after its slot was recycled is detected as stale rather than read.
+    """
+    ring: str
+    slot: int
+    generation: int
+    length: int
+    
+    def to_payload(self) -> Dict[str, Any]:
+        """Encode the handle as an event payload value."""
+        return {"ring": self.ring, "slot": self.slot, "generation": self.generation, "length": self.length}
+    
+    @classmethod
+    def from_event(cls, event: Event) -> 'SlotHandle':
+        """
+        Get the handle carried by a buffer event.
+        
+        Raises:
+            KeyError: If the event carries no slot handle
+        """
+        return cls(**event.payload[HANDLE_KEY])
+
+class SharedMemoryRing:
+    """
+    Fixed-size slots in a ``multiprocessing.shared_memory`` block.
+    
+    A producer writes a buffer into a free slot and publishes an event that
+    carries only the slot's ``SlotHandle``; consumers in any process attach
+    to the ring by name and read the slot in place as a ``memoryview`` or a
+    NumPy array, without copying or serializing it.
+    
+    Slots are reference counted. ``write`` sets the count to the number of
+    consumers expected to read the buffer, each of which calls ``release``
+    when finished (``acquire`` adds a reference for anyone keeping it
+    longer). A slot is reused only once its count drops to zero, unless
+    the ring is created with ``overwrite=True``, in which case a full ring
+    recycles its oldest slot; readers then check ``is_current`` after
+    reading to detect a buffer that was overwritten under them.
+    
+    Slot headers are updated under a thread lock plus an ``fcntl`` lock on
+    a file next to the ring, so producers and consumers in different
+    processes can share it.
+    """
+    
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool, overwrite: bool):
+        """Use ``create`` or ``attach`` instead."""
+        magic, self._slot_size, self._num_slots, _ = _RING_HEADER.unpack_from(shm.buf, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"Shared memory block {shm.name} is not an event ring")
+        self._shm = shm
+        self._owner = owner
+        self._overwrite = overwrite
+        self._data_offset = _data_offset(self._num_slots)
+        self._thread_lock = Lock()
+        self._lock_file = open(_lock_path(shm.name), "a+b")
+    
+    @classmethod
+    def create(cls, name: str, slot_size: int, num_slots: int,
+               overwrite: bool = False) -> 'SharedMemoryRing':
+        """
+        Create a ring; the creator unlinks it on ``close``.
+        
+        Args:
+            name: System-wide name consumers attach with
+            slot_size: Capacity of each slot in bytes
+            num_slots: Number of slots
+            overwrite: Recycle the oldest slot when none is free instead of
+                raising RingBufferFullError
+        """
+        if slot_size <= 0 or num_slots <= 0:
+            raise ValueError("slot_size and num_slots must be positive")
+        size = _data_offset(num_slots) + slot_size * num_slots
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _RING_HEADER.pack_into(shm.buf, 0, _MAGIC, slot_size, num_slots, 0)
+        for slot in range(num_slots):
+            _SLOT_HEADER.pack_into(shm.buf, _slot_header_offset(slot), 0, 0, 0, 0)
+        return cls(shm, owner=True, overwrite=overwrite)
+    
+    @classmethod
+    def attach(cls, name: str, overwrite: bool = False) -> 'SharedMemoryRing':
+        """
+        Attach to a ring created by another process.
+        
+        Args:
+            name: Name the ring was created with
+            overwrite: Whether writes from this process may recycle busy slots
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        # Before 3.13 attaching registers the block with this process's
+        # resource tracker, which would unlink it when this process exits.
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return cls(shm, owner=False, overwrite=overwrite)
+    
+    @property
+    def name(self) -> str:
+        return self._shm.name
+    
+    @property
+    def slot_size(self) -> int:
+        return self._slot_size
+    
+    @property
+    def num_slots(self) -> int:
+        return self._num_slots
+    
+    def reserve(self, length: int, refs: int = 1) -> Tuple[SlotHandle, memoryview]:
+        """
+        Claim a slot and get a writable view of it, to fill in place.
+        
+        Publish the handle only once the view has been filled.
+        
+        Args:
+            length: Number of bytes that will be written
+            refs: Number of consumers expected to release the slot
+        
+        Returns:
+            Handle for the slot and a writable view of ``length`` bytes
+        
+        Raises:
+            ValueError: If the length exceeds the slot size
+            RingBufferFullError: If every slot is still referenced and the
+                ring does not overwrite
+        """
+        if not 0 <= length <= self._slot_size:
+            raise ValueError(f"Buffer of {length} bytes does not fit {self._slot_size} byte slots")
+        if refs <= 0:
+            raise ValueError(f"refs must be positive, got {refs}")
+        
+        with self._locked():
+            _, _, _, cursor = _RING_HEADER.unpack_from(self._shm.buf, 0)
+            slot = None
+            for step in range(self._num_slots):
+                candidate = (cursor + step) % self._num_slots
+                if self._read_slot(candidate)[1] == 0:
+                    slot = candidate
+                    break
+            if slot is None:
+                if not self._overwrite:
+                    raise RingBufferFullError(f"All {self._num_slots} slots of ring {self.name} are in use")
+                slot = cursor % self._num_slots
+            
+            generation = self._read_slot(slot)[0] + 1
+            _SLOT_HEADER.pack_into(self._shm.buf, _slot_header_offset(slot), generation, refs, 0, length)
+            _RING_HEADER.pack_into(self._shm.buf, 0, _MAGIC, self._slot_size, self._num_slots, slot + 1)
+        
+        handle = SlotHandle(ring=self.name, slot=slot, generation=generation, length=length)
+        return handle, self._slot_view(slot, length)
+    
+    def write(self, data: Any, refs: int = 1) -> SlotHandle:
+        """
+        Copy a buffer into a free slot.
+        
+        Args:
+            data: Bytes-like object or C-contiguous array
+            refs: Number of consumers expected to release the slot
+        
+        Returns:
+            Handle to publish to consumers
+        """
+        source = memoryview(data).cast("B")
+        handle, view = self.reserve(source.nbytes, refs)
+        view[:] = source
+        return handle
+    
+    def view(self, handle: SlotHandle) -> memoryview:
+        """
+        Get a read view of a slot's buffer.
+        
+        Raises:
+            StaleSlotError: If the slot has been reused since the handle was made
+        """
+        if not self.is_current(handle):
+            raise StaleSlotError(f"Slot {handle.slot} of ring {handle.ring} was reused")
+        return self._slot_view(handle.slot, handle.length).toreadonly()
+    
+    def array(self, handle: SlotHandle, dtype: Any, shape: Tuple[int, ...]) -> Any:
+        """
+        Get a read-only NumPy array view of a slot's buffer.
+        
+        Drop the array before closing the ring; shared memory cannot be
+        unmapped while views of it exist.
+        
+        Raises:
+            RuntimeError: If NumPy is not installed
+            StaleSlotError: If the slot has been reused since the handle was made
+        """
+        if np is None:
+            raise RuntimeError("NumPy is required for array views")
+        return np.frombuffer(self.view(handle), dtype=dtype).reshape(shape)
+    
+    def acquire(self, handle: SlotHandle) -> bool:
+        """
+        Add a reference to a slot, to keep its buffer past the usual release.
+        
+        Returns:
+            False if the slot was already released or reused
+        """
+        with self._locked():
+            generation, refs, length = self._read_slot(handle.slot)
+            if generation != handle.generation or refs <= 0:
+                return False
+            _SLOT_HEADER.pack_into(self._shm.buf, _slot_header_offset(handle.slot), generation, refs + 1, 0, length)
+            return True
+    
+    def release(self, handle: SlotHandle) -> None:
+        """Drop a reference to a slot; at zero the slot may be reused."""
+        with self._locked():
+            generation, refs, length = self._read_slot(handle.slot)
+            if generation == handle.generation and refs > 0:
+                _SLOT_HEADER.pack_into(self._shm.buf, _slot_header_offset(handle.slot), generation, refs - 1, 0, length)
+    
+    def is_current(self, handle: SlotHandle) -> bool:
+        """Check that a slot still holds the buffer a handle was made for."""
+        return self._read_slot(handle.slot)[0] == handle.generation
+    
+    def stats(self) -> Dict[str, int]:
+        """Get the number of slots in use and free."""
+        with self._locked():
+            in_use = sum(1 for slot in range(self._num_slots) if self._read_slot(slot)[1] > 0)
+        return {"slots": self._num_slots, "in_use": in_use, "free": self._num_slots - in_use}
+    
+    def close(self) -> None:
+        """Unmap the ring, and remove it if this process created it."""
+        self._lock_file.close()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+            try:
+                os.unlink(_lock_path(self.name))
+            except FileNotFoundError:
+                pass
+    
+    def _read_slot(self, slot: int) -> Tuple[int, int, int]:
+        """Get a slot's generation, reference count and length."""
+        generation, refs, _, length = _SLOT_HEADER.unpack_from(self._shm.buf, _slot_header_offset(slot))
+        return generation, refs, length
+    
+    def _slot_view(self, slot: int, length: int) -> memoryview:
+        start = self._data_offset + slot * self._slot_size
+        return self._shm.buf[start:start + length]
+    
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the ring lock across threads and processes."""
+        with self._thread_lock:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+def buffer_event(event_type: str, source: str, handle: SlotHandle,
+                 correlation_id: Optional[str] = None, **metadata: Any) -> Event:
+    """
+    Build an event that refers to a buffer in a shared-memory ring.
+    
+    Args:
+        event_type: Event type to publish
+        source: Publisher name
+        handle: Slot handle returned by the ring
+        correlation_id: Optional correlation ID
+        **metadata: Small JSON-compatible fields to carry alongside the handle
+    """
+    payload = dict(metadata)
+    payload[HANDLE_KEY] = handle.to_payload()
+    return Event(event_type=event_type, payload=payload, source=source, correlation_id=correlation_id)
+
+def _slot_header_offset(slot: int) -> int:
+    return _RING_HEADER.size + slot * _SLOT_HEADER.size
+
+def _data_offset(num_slots: int) -> int:
+    end = _slot_header_offset(num_slots)
+    return -(-end // _DATA_ALIGNMENT) * _DATA_ALIGNMENT
+
+def _lock_path(name: str) -> str:
+    return os.path.join(tempfile.gettempdir(), f"{name.lstrip('/')}.lock")
@@ -0,0 +1,73 @@
+"""Subscription records held by the event bus routing table."""
+
+import inspect
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import Enum
+from typing import Callable, Optional
+
+# Default time a partial batch may wait for more events before delivery
+DEFAULT_BATCH_LINGER = timedelta(milliseconds=50)
+
+class ExecutionMode(Enum):
+    """Where a subscription's handler runs."""
+    AUTO = "auto"                            # Coroutines on the loop, others on shared threads
+    INLINE = "inline"                        # Called directly on the event loop thread
+    SHARED_THREADS = "shared_threads"        # The bus's shared worker thread pool
+    DEDICATED_THREADS = "dedicated_threads"  # A thread pool of its own
+    PROCESS_POOL = "process_pool"            # A process pool of its own, for CPU-bound work
+    ASYNC = "async"                          # Awaited on the loop; must be a coroutine function
+
+def handler_name(handler: Callable) -> str:
+    """
+    Get a stable, module-qualified name for a handler.
+    
+    Dead letters record this name, so it must identify the same handler
+    across restarts.
+    """
+    qualname = getattr(handler, "__qualname__", None) or type(handler).__qualname__
+    module = getattr(handler, "__module__", None)
+    return f"{module}.{qualname}" if module else qualname
+
+def is_coroutine_handler(handler: Callable) -> bool:
+    """Check whether a handler, or a callable object's __call__, is a coroutine function."""
+    return inspect.iscoroutinefunction(handler) or \
+        inspect.iscoroutinefunction(getattr(handler, "__call__", None))
+
+@dataclass(eq=False)
+class Subscription:
+    """
+    A handler's subscription to a topic pattern and its delivery options.
+    
+    Subscriptions compare by identity, so the same handler may hold separate
+    subscriptions to different patterns.
+    """
+    pattern: str
+    handler: Callable
+    batch_size: Optional[int] = None  # Deliver List[Event] batches of up to this size
+    batch_linger: timedelta = DEFAULT_BATCH_LINGER  # Max wait before a partial batch is sent
+    execution: ExecutionMode = ExecutionMode.AUTO
+    max_concurrency: Optional[int] = None  # Handler calls allowed in flight at once
+    
+    def __post_init__(self):
+        """Validate subscription options."""
+        if self.batch_size is not None and self.batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {self.batch_size}")
+        if self.batch_linger.total_seconds() < 0:
+            raise ValueError("batch_linger cannot be negative")
+        if self.max_concurrency is not None and self.max_concurrency <= 0:
+            raise ValueError(f"max_concurrency must be positive, got {self.max_concurrency}")
+        if self.execution is ExecutionMode.ASYNC and not is_coroutine_handler(self.handler):
+            raise ValueError(f"{handler_name(self.handler)} is not a coroutine function; ASYNC needs one")
+        if self.execution is ExecutionMode.PROCESS_POOL and is_coroutine_handler(self.handler):
+            raise ValueError(f"{handler_name(self.handler)} is a coroutine function; PROCESS_POOL needs a plain one")
+    
+    @property
+    def batched(self) -> bool:
+        """Whether the handler receives lists of events instead of single events."""
+        return self.batch_size is not None
+    
+    @property
+    def name(self) -> str:
+        """Module-qualified handler name for logs and dead letters."""
+        return handler_name(self.handler)
@@ -0,0 +1,179 @@
+"""Bounded tracking of in-flight and recently completed deliveries."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .events import Event
+from .subscription import Subscription, handler_name
+
+# (correlation_id, module-qualified subscriber name)
+DeliveryKey = Tuple[str, str]
+
+class DeliveryStatus(Enum):
+    """Lifecycle state of a delivery."""
+    IN_FLIGHT = "in_flight"          # Handler is being called
+    RETRY_PENDING = "retry_pending"  # Failed; waiting for a scheduled retry
+    DELIVERED = "delivered"
+    FAILED = "failed"                # Exhausted its attempts; dead-lettered
+
+@dataclass(slots=True)
+class DeliveryRecord:
+    """Record of event delivery attempt."""
+    event: Union[Event, List[Event]]  # A list for batched subscriptions
+    subscriber: Callable
+    attempts: int = 0
+    last_attempt: Optional[datetime] = None
+    error: Optional[Exception] = None
+    status: DeliveryStatus = DeliveryStatus.IN_FLIGHT
+    completed_at: Optional[float] = None  # time.monotonic() when finished
+    subscription: Optional[Subscription] = None  # Delivery options the handler was subscribed with
+    
+    @property
+    def keys(self) -> List[DeliveryKey]:
+        """Tracking keys: each delivered event's correlation ID with the subscriber."""
+        subscriber = handler_name(self.subscriber)
+        events = self.event if isinstance(self.event, list) else (self.event,)
+        return [(event.correlation_id, subscriber) for event in events]
+
+class DeliveryTracker:
+    """
+    Tracks deliveries per (correlation_id, subscriber) at bounded memory.
+    
+    A batch delivery is one record filed under the key of every event in
+    it, so each event of the batch can be looked up, and the size cap
+    counts it once per event.
+    
+    Unfinished deliveries are held until they finish, so that set is bounded
+    by the work actually in progress. Finished ones move to an LRU of recent
+    completions, capped at ``max_completed`` and expired after ``ttl``;
+    completions are appended in time order, so both limits evict from the
+    front of the same ordered dict.
+    """
+    
+    def __init__(self, max_completed: int = 1000, ttl: Optional[timedelta] = timedelta(minutes=5)):
+        """
+        Initialize the tracker.
+        
+        Args:
+            max_completed: Completed records kept for diagnostics
+            ttl: Age after which completed records are dropped; None keeps
+                them until pushed out by newer ones
+        """
+        if max_completed < 0:
+            raise ValueError(f"max_completed cannot be negative, got {max_completed}")
+        self._max_completed = max_completed
+        self._ttl = ttl.total_seconds() if ttl is not None else None
+        self._in_flight: Dict[DeliveryKey, DeliveryRecord] = {}
+        self._completed: 'OrderedDict[DeliveryKey, DeliveryRecord]' = OrderedDict()
+        self._lock = Lock()
+    
+    def start(self, record: DeliveryRecord) -> None:
+        """
+        Track a new delivery as in flight.
+        
+        Args:
+            record: Delivery record about to be attempted
+        """
+        with self._lock:
+            for key in record.keys:
+                self._in_flight[key] = record
+    
+    def finish(self, record: DeliveryRecord, status: DeliveryStatus) -> None:
+        """
+        Move a delivery to the recently completed set.
+        
+        Args:
+            record: Delivery record that has finished
+            status: DELIVERED or FAILED
+        """
+        record.status = status
+        record.completed_at = time.monotonic()
+        keys = record.keys
+        with self._lock:
+            for key in keys:
+                # A newer delivery under the same key may have replaced this one
+                if self._in_flight.get(key) is record:
+                    del self._in_flight[key]
+                if self._max_completed:
+                    self._completed.pop(key, None)
+                    self._completed[key] = record
+            self._evict(record.completed_at)
+    
+    def get(self, correlation_id: str) -> List[DeliveryRecord]:
+        """
+        Get the tracked deliveries of one event to each of its subscribers.
+        
+        Args:
+            correlation_id: Correlation ID of the event
+            
+        Returns:
+            In-flight and recently completed records for the event
+        """
+        with self._lock:
+            self._evict(time.monotonic())
+            return [
+                record
+                for records in (self._in_flight, self._completed)
+                for key, record in records.items()
+                if key[0] == correlation_id
+            ]
+    
+    def in_flight(self) -> List[DeliveryRecord]:
+        """Get deliveries that are being attempted or awaiting a retry."""
+        with self._lock:
+            return _unique(self._in_flight.values())
+    
+    def recent(self, limit: int = 100,
+               status: Optional[DeliveryStatus] = None) -> List[DeliveryRecord]:
+        """
+        Get recently completed deliveries, newest first.
+        
+        Args:
+            limit: Maximum number of records to return
+            status: Only records that finished with this status
+        """
+        with self._lock:
+            self._evict(time.monotonic())
+            matches = []
+            for record in _unique(reversed(self._completed.values())):
+                if len(matches) >= limit:
+                    break
+                if status is None or record.status is status:
+                    matches.append(record)
+            return matches
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get counts of tracked deliveries by status."""
+        with self._lock:
+            self._evict(time.monotonic())
+            counts = {status.value: 0 for status in DeliveryStatus}
+            for records in (self._in_flight, self._completed):
+                for record in _unique(records.values()):
+                    counts[record.status.value] += 1
+            return counts
+    
+    def clear(self) -> None:
+        """Forget every completed delivery."""
+        with self._lock:
+            self._completed.clear()
+    
+    def _evict(self, now: float) -> None:
+        """Drop completed records over the size cap or past the TTL."""
+        while len(self._completed) > self._max_completed:
+            self._completed.popitem(last=False)
+        if self._ttl is None:
+            return
+        while self._completed:
+            oldest = next(iter(self._completed.values()))
+            if now - oldest.completed_at < self._ttl:
+                break
+            self._completed.popitem(last=False)
+
+def _unique(records: Iterable[DeliveryRecord]) -> List[DeliveryRecord]:
+    """Drop repeats of batch records filed under several keys, keeping order."""
+    return list({id(record): record for record in records}.values())
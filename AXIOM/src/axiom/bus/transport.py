@@ -0,0 +1,344 @@
+"""Bridge event buses in separate processes over a Unix domain socket."""
+
+import asyncio
+import os
+import stat
+import struct
+from collections import deque
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Union
+
+from .codec import BinaryCodec, EventCodec
+from .event_bus import EventBus
+from .events import Event
+from .exceptions import BridgeAddressInUseError, EventCodecError
+from axiom.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Every frame is a 4-byte big-endian length followed by that many bytes
+_FRAME_HEADER = struct.Struct("!I")
+_MAX_FRAME_SIZE = 16 * 1024 * 1024
+# First frame each side sends: protocol tag and codec name
+_HELLO_PREFIX = b"AXIOM-BRIDGE/1 "
+
+class _Peer:
+    """Outbound buffer and learned state for one connection."""
+    
+    def __init__(self, name: str, max_pending: int):
+        self.name = name
+        self.sources: Set[str] = set()  # Sources whose events came from this peer
+        self.pending: Deque[bytes] = deque()
+        self.ready = asyncio.Event()
+        self.max_pending = max_pending
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.sent = 0
+        self.received = 0
+        self.dropped = 0
+        self.connected = False
+    
+    def enqueue(self, frame: bytes) -> None:
+        """Buffer an encoded event, dropping the oldest if the buffer is full."""
+        if len(self.pending) >= self.max_pending:
+            self.pending.popleft()
+            self.dropped += 1
+        self.pending.append(frame)
+        self.ready.set()
+    
+    def take_batch(self, max_batch: int) -> List[bytes]:
+        """Remove up to ``max_batch`` buffered events."""
+        batch = []
+        while self.pending and len(batch) < max_batch:
+            batch.append(self.pending.popleft())
+        if not self.pending:
+            self.ready.clear()
+        return batch
+
+class EventBridge:
+    """
+    Forwards events between ``EventBus`` instances in different processes.
+    
+    One process calls ``serve()`` to listen on a Unix domain socket and the
+    others ``connect()`` to it. Events published on any bus that match
+    ``topics`` are sent to the other side, where they are published on the
+    local bus as if by their original source; remote sources are registered
+    as publishers automatically. A serving bridge relays between its
+    clients, so every connected process sees every matching event once.
+    
+    Events are length-prefixed frames encoded with the bridge's codec, and
+    are written in batches of up to ``max_batch`` per socket write. A
+    received event that cannot be decoded or published is logged and
+    skipped. A client reconnects with exponential backoff whatever ended
+    the connection; while it is disconnected, up to ``max_pending``
+    outbound events are buffered and the oldest are dropped beyond that.
+    
+    An event is never sent back to the peer its source was learned from, so
+    forwarded events do not loop. Each source name must therefore be used
+    by one process only.
+    """
+    
+    def __init__(self, bus: EventBus, socket_path: Union[str, Path],
+                 topics: str = "#",
+                 codec: Optional[EventCodec] = None,
+                 max_batch: int = 64,
+                 max_pending: int = 10_000,
+                 reconnect_delay: timedelta = timedelta(milliseconds=100),
+                 max_reconnect_delay: timedelta = timedelta(seconds=5)):
+        """
+        Initialize the bridge.
+        
+        Args:
+            bus: Local event bus
+            socket_path: Filesystem path of the Unix domain socket
+            topics: Event type or pattern to forward to other processes
+            codec: Wire codec; both ends must use the same one. Defaults
+                to a binary codec that refuses marshal payloads, since any
+                process that can open the socket can send frames
+            max_batch: Maximum events written per socket write
+            max_pending: Outbound events buffered per peer
+            reconnect_delay: Wait before the first reconnect attempt
+            max_reconnect_delay: Cap on the exponential reconnect backoff
+        """
+        if max_batch <= 0 or max_pending <= 0:
+            raise ValueError("max_batch and max_pending must be positive")
+        self._bus = bus
+        self._path = str(socket_path)
+        self._topics = topics
+        self._codec = codec or BinaryCodec(trusted=False)
+        self._max_batch = max_batch
+        self._max_pending = max_pending
+        self._reconnect_delay = reconnect_delay.total_seconds()
+        self._max_reconnect_delay = max_reconnect_delay.total_seconds()
+        
+        self._peers: List[_Peer] = []
+        self._registered: Set[Tuple[str, str]] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._connections: Set[asyncio.Task] = set()  # Serving accepted clients
+        self._closing = False
+    
+    async def serve(self) -> None:
+        """
+        Listen for other processes' bridges and start forwarding.
+        
+        A stale socket file left by a previous run is replaced. The socket
+        is created accessible to the owning user only.
+        
+        Raises:
+            BridgeAddressInUseError: If another bridge is serving on the path,
+                or something other than a socket is there
+        """
+        if os.path.exists(self._path):
+            if not stat.S_ISSOCK(os.stat(self._path).st_mode):
+                # Most likely a mistyped path; never delete someone's file
+                raise BridgeAddressInUseError(f"{self._path} exists and is not a socket")
+            try:
+                _, writer = await asyncio.open_unix_connection(self._path)
+            except OSError:
+                # Nobody is listening; the file is left over from a crash
+                os.unlink(self._path)
+            else:
+                writer.close()
+                raise BridgeAddressInUseError(f"An event bridge is already serving on {self._path}")
+        Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+        # Create the socket as 0600 rather than chmod it once bound, so it is
+        # never open to other users, even briefly
+        umask = os.umask(0o177)
+        try:
+            self._server = await asyncio.start_unix_server(self._accept, path=self._path)
+        finally:
+            os.umask(umask)
+        self._bus.subscribe(self._topics, self._forward)
+        logger.info("Event bridge listening", socket_path=self._path, topics=self._topics)
+    
+    async def connect(self) -> None:
+        """Connect to a serving bridge, reconnecting whenever the link drops."""
+        peer = _Peer(self._path, self._max_pending)
+        self._peers.append(peer)
+        self._bus.subscribe(self._topics, self._forward)
+        self._spawn(self._connect_loop(peer))
+    
+    async def close(self) -> None:
+        """Stop forwarding and close every connection."""
+        self._closing = True
+        self._bus.unsubscribe(self._topics, self._forward)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in list(self._tasks):
+            task.cancel()
+        # Accepted connections end cleanly once their sockets are closed
+        for peer in self._peers:
+            if peer.writer is not None:
+                peer.writer.close()
+        await asyncio.gather(*self._tasks, *self._connections, return_exceptions=True)
+        if self._server is not None and os.path.exists(self._path):
+            os.unlink(self._path)
+        logger.info("Event bridge closed", socket_path=self._path)
+    
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get per-peer forwarding counters.
+        
+        Returns:
+            One entry per peer with its connection state, events sent,
+            received, dropped and currently buffered
+        """
+        return [
+            {
+                "peer": peer.name,
+                "connected": peer.connected,
+                "sent": peer.sent,
+                "received": peer.received,
+                "dropped": peer.dropped,
+                "pending": len(peer.pending)
+            }
+            for peer in self._peers
+        ]
+    
+    async def _forward(self, event: Event) -> None:
+        """Local subscriber: buffer the event for every peer it did not come from."""
+        frame = None
+        for peer in self._peers:
+            if event.source in peer.sources:
+                continue
+            if frame is None:
+                try:
+                    frame = self._codec.encode(event)
+                except EventCodecError as e:
+                    logger.warning(
+                        "Event not forwarded: cannot encode",
+                        event_type=event.event_type,
+                        correlation_id=event.correlation_id,
+                        error=str(e)
+                    )
+                    return
+            peer.enqueue(frame)
+    
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one client connection until it closes."""
+        peer = _Peer(f"client-{len(self._peers) + 1}", self._max_pending)
+        self._peers.append(peer)
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            await self._run_peer(peer, reader, writer)
+        finally:
+            self._peers.remove(peer)
+            self._connections.discard(task)
+    
+    async def _connect_loop(self, peer: _Peer) -> None:
+        """Keep a client connection up, backing off between failed attempts."""
+        attempt = 0
+        while not self._closing:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self._path)
+            except OSError as e:
+                attempt += 1
+                delay = min(self._reconnect_delay * 2 ** (attempt - 1), self._max_reconnect_delay)
+                logger.debug("Event bridge connect failed", socket_path=self._path,
+                             attempt=attempt, retry_in_seconds=delay, error=str(e))
+                await asyncio.sleep(delay)
+                continue
+            
+            attempt = 0
+            try:
+                await self._run_peer(peer, reader, writer)
+            except Exception as e:
+                # Whatever broke the link, keep reconnecting
+                logger.error("Event bridge connection failed", peer=peer.name, error=str(e))
+            if not self._closing:
+                await asyncio.sleep(self._reconnect_delay)
+    
+    async def _run_peer(self, peer: _Peer, reader: asyncio.StreamReader,
+                        writer: asyncio.StreamWriter) -> None:
+        """Exchange events with one connected peer until the link drops."""
+        sender = None
+        peer.writer = writer
+        try:
+            writer.write(self._frame(_HELLO_PREFIX + self._codec.name.encode()))
+            await writer.drain()
+            hello = await self._read_frame(reader)
+            if hello != _HELLO_PREFIX + self._codec.name.encode():
+                logger.error("Event bridge handshake failed", peer=peer.name, hello=hello[:64])
+                return
+            
+            peer.connected = True
+            logger.info("Event bridge connected", peer=peer.name, socket_path=self._path)
+            sender = asyncio.create_task(self._send_loop(peer, writer))
+            while True:
+                frame = await self._read_frame(reader)
+                # Frames are length-prefixed, so one bad event does not
+                # desynchronise the stream; skip it and keep reading
+                try:
+                    event = self._codec.decode(frame)
+                except Exception as e:
+                    logger.error("Event bridge received an undecodable frame", peer=peer.name, error=str(e))
+                    continue
+                peer.received += 1
+                try:
+                    await self._publish_remote(peer, event)
+                except Exception as e:
+                    logger.error(
+                        "Event bridge could not publish a received event",
+                        peer=peer.name,
+                        event_type=event.event_type,
+                        correlation_id=event.correlation_id,
+                        error=str(e)
+                    )
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            if sender is not None:
+                sender.cancel()
+                await asyncio.gather(sender, return_exceptions=True)
+            writer.close()
+            peer.writer = None
+            if peer.connected:
+                peer.connected = False
+                logger.warning("Event bridge disconnected", peer=peer.name, pending=len(peer.pending))
+    
+    async def _send_loop(self, peer: _Peer, writer: asyncio.StreamWriter) -> None:
+        """Write buffered events to a peer in batches."""
+        while True:
+            await peer.ready.wait()
+            batch = peer.take_batch(self._max_batch)
+            try:
+                writer.write(b"".join(self._frame(frame) for frame in batch))
+                await writer.drain()
+            except (ConnectionError, asyncio.CancelledError):
+                # Resend after reconnecting; the peer may see some twice
+                peer.pending.extendleft(reversed(batch))
+                peer.ready.set()
+                raise
+            peer.sent += len(batch)
+    
+    async def _publish_remote(self, peer: _Peer, event: Event) -> None:
+        """Publish an event received from a peer on the local bus."""
+        if event.source not in peer.sources:
+            peer.sources.add(event.source)
+        key = (event.source, event.event_type)
+        if key not in self._registered:
+            self._bus.register_publisher(event.source, [event.event_type])
+            self._registered.add(key)
+        await self._bus.publish(event)
+    
+    @staticmethod
+    def _frame(data: bytes) -> bytes:
+        """Prefix data with its length."""
+        return _FRAME_HEADER.pack(len(data)) + data
+    
+    @staticmethod
+    async def _read_frame(reader: asyncio.StreamReader) -> bytes:
+        """Read one length-prefixed frame."""
+        (length,) = _FRAME_HEADER.unpack(await reader.readexactly(_FRAME_HEADER.size))
+        if length > _MAX_FRAME_SIZE:
+            raise ConnectionError(f"Frame of {length} bytes exceeds the {_MAX_FRAME_SIZE} byte limit")
+        return await reader.readexactly(length)
+    
+    def _spawn(self, coro) -> None:
+        """Run a background task owned by the bridge."""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
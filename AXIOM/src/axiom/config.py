@@ -23,7 +23,7 @@ import argparse
 import json
 import logging
 import os
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -39,6 +39,12 @@ logger = logging.getLogger(__name__)
 ROOT_DIR = Path(__file__).resolve().parents[2] # -> AXIOM/
 logger.debug(f"ROOT_DIR set to: {ROOT_DIR}")
 
+# SQLite PRAGMA values accepted by DatabaseConfig
+SQLITE_JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+SQLITE_SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+# State writer durability modes (axiom.state.writer.DurabilityMode values)
+WRITE_DURABILITY_MODES = ("buffered", "committed", "synced")
+
 # ----------------------
 # Exceptions
 # ----------------------
@@ -105,12 +111,56 @@ class DatabaseConfig:
     path: Path = field(default_factory=lambda: ROOT_DIR / "data" / "axiom.db")
     backup_enabled: bool = True
     backup_interval: str = "24h"
-    max_connections: int = 2
+    max_connections: int = 2  # Connections checked out of the pool at once, including the state writer's
+    pool_timeout_ms: int = 5000  # Wait for a free connection before failing
+    connection_max_lifetime_s: int = 3600  # Age at which connections are replaced; 0 never
+    # SQLite connection settings; WAL lets readers run alongside the writer
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size_kb: int = 8192
+    mmap_size: int = 64 * 1024 * 1024  # bytes; 0 disables memory-mapped I/O
+    busy_timeout_ms: int = 5000
+    # Write-behind writer for conversation, event and sensor rows
+    write_durability: str = "buffered"
+    write_flush_interval_ms: int = 50
+    write_queue_size: int = 10_000
 
     def __post_init__(self):
         if isinstance(self.path, str):
             self.path = Path(self.path)
         _ensure_directory_exists(self.path.parent)
+        _validate_positive_int(self.max_connections, "max_connections")
+        _validate_positive_int(self.cache_size_kb, "cache_size_kb")
+        self.journal_mode = self.journal_mode.upper()
+        self.synchronous = self.synchronous.upper()
+        if self.journal_mode not in SQLITE_JOURNAL_MODES:
+            raise ConfigurationError(
+                f"journal_mode must be one of {', '.join(SQLITE_JOURNAL_MODES)}, got {self.journal_mode}"
+            )
+        if self.synchronous not in SQLITE_SYNCHRONOUS_LEVELS:
+            raise ConfigurationError(
+                f"synchronous must be one of {', '.join(SQLITE_SYNCHRONOUS_LEVELS)}, got {self.synchronous}"
+            )
+        if self.mmap_size < 0 or self.busy_timeout_ms < 0:
+            raise ConfigurationError("mmap_size and busy_timeout_ms cannot be negative")
+        _validate_positive_int(self.pool_timeout_ms, "pool_timeout_ms")
+        if self.connection_max_lifetime_s < 0:
+            raise ConfigurationError("connection_max_lifetime_s cannot be negative")
+        self.write_durability = self.write_durability.lower()
+        if self.write_durability not in WRITE_DURABILITY_MODES:
+            raise ConfigurationError(
+                f"write_durability must be one of {', '.join(WRITE_DURABILITY_MODES)}, got {self.write_durability}"
+            )
+        _validate_positive_int(self.write_flush_interval_ms, "write_flush_interval_ms")
+        _validate_positive_int(self.write_queue_size, "write_queue_size")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DatabaseConfig":
+        known = {f.name for f in fields(cls)}
+        unknown = sorted(set(data) - known)
+        if unknown:
+            raise ConfigurationError(f"Unknown database setting(s): {', '.join(unknown)}")
+        return cls(**data)
 
     @classmethod
     def from_env(cls, prefix="DB_") -> "DatabaseConfig":
@@ -120,6 +170,16 @@ class DatabaseConfig:
             f"{prefix}BACKUP_ENABLED": ("backup_enabled", _convert_env_bool),
             f"{prefix}BACKUP_INTERVAL": ("backup_interval", str),
             f"{prefix}MAX_CONNECTIONS": ("max_connections", int),
+            f"{prefix}POOL_TIMEOUT_MS": ("pool_timeout_ms", int),
+            f"{prefix}CONNECTION_MAX_LIFETIME_S": ("connection_max_lifetime_s", int),
+            f"{prefix}JOURNAL_MODE": ("journal_mode", str),
+            f"{prefix}SYNCHRONOUS": ("synchronous", str),
+            f"{prefix}CACHE_SIZE_KB": ("cache_size_kb", int),
+            f"{prefix}MMAP_SIZE": ("mmap_size", int),
+            f"{prefix}BUSY_TIMEOUT_MS": ("busy_timeout_ms", int),
+            f"{prefix}WRITE_DURABILITY": ("write_durability", str),
+            f"{prefix}WRITE_FLUSH_INTERVAL_MS": ("write_flush_interval_ms", int),
+            f"{prefix}WRITE_QUEUE_SIZE": ("write_queue_size", int),
         }
         for env_var, (field_name, conv) in env_map.items():
             val = os.getenv(env_var)
@@ -194,7 +254,7 @@ class AxiomConfig:
     def from_dict(cls, data: Dict[str, Any]) -> "AxiomConfig":
         return cls(
             system=SystemConfig(**data.get("system", {})),
-            database=DatabaseConfig(**data.get("database", {})),
+            database=DatabaseConfig.from_dict(data.get("database", {})),
             virtual_assistant=VirtualAssistantConfig(**data.get("virtual_assistant", {})),
             policy=PolicyConfig(**data.get("policy", {})),
         )
@@ -1,6 +1,7 @@
 """Read-Eval-Print Loop for AXIOM Console."""
 
 
+import signal
 import sys
 from typing import List
 from ..va.pipeline import Pipeline
@@ -8,7 +9,7 @@ from ..bus.event_bus import EventBus
 from ..config import AxiomConfig, ROOT_DIR
 from ..utils.logging import get_logger, setup_logging
 from ..utils.health import HealthChecker
-from ..utils.shutdown import register_shutdown_handler
+from ..utils.shutdown import register_shutdown_handler, initiate_shutdown
 import asyncio
 import json
 
@@ -52,6 +53,18 @@ class REPL:
         self._buffer = []  # For multi-line input
     
     async def run(self):
+        # Components register with the shutdown handler, which takes over
+        # SIGINT; while the console runs, Ctrl-C should just leave the loop,
+        # after which the components are shut down
+        previous_handler = signal.signal(signal.SIGINT, signal.default_int_handler)
+        try:
+            await self._loop()
+            # Flush queued conversation turns and close registered components
+            await initiate_shutdown()
+        finally:
+            signal.signal(signal.SIGINT, previous_handler)
+
+    async def _loop(self):
         print("AXIOM Virtual Assistant Console (type 'help' for commands)")
         print("Multi-line input: End with a blank line. Tab completion enabled for commands.")
         while self._running:
@@ -128,6 +141,23 @@ class REPL:
     
     def _cmd_status(self):
         print("System status: Running")
+        metrics = self._event_bus.get_metrics()
+        
+        print("Event bus:")
+        for name, value in metrics["gauges"].items():
+            print(f"  {name}: {value:g}")
+        for name, value in metrics["counters"].items():
+            print(f"  {name}: {value}")
+        for name, summary in metrics["histograms"].items():
+            if not summary["count"]:
+                continue
+            # Latencies are recorded in seconds; show milliseconds
+            print(
+                f"  {name}: n={summary['count']} "
+                f"p50={summary['p50'] * 1000:.3f}ms "
+                f"p99={summary['p99'] * 1000:.3f}ms "
+                f"max={summary['max'] * 1000:.3f}ms"
+            )
     
     def _cmd_health(self):
         """Run health check on all AXIOM components."""
@@ -18,4 +18,8 @@ class InvalidSchemaVersionError(StateStoreException):
 
 class QueryExecutionError(StateStoreException):
     """Raised when a database query fails."""
+    pass
+
+class WriteQueueFullError(StateStoreException):
+    """Raised when the write-behind queue stays full past its timeout."""
     pass
\ No newline at end of file
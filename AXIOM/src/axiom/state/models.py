@@ -78,6 +78,39 @@ class SystemEvent:
             correlation_id=row['correlation_id']
         )
 
+@dataclass
+class SensorReading:
+    """Represents a single sensor measurement."""
+    sensor_id: str
+    sensor_type: str
+    value: float
+    timestamp: datetime
+    unit: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = None
+
+    def to_db_tuple(self) -> tuple:
+        """Convert to database tuple format."""
+        return (
+            self.sensor_id,
+            self.sensor_type,
+            self.value,
+            self.unit,
+            self.timestamp.isoformat(),
+            str(self.metadata) if self.metadata else None
+        )
+
+    @classmethod
+    def from_db_row(cls, row: Dict[str, Any]) -> 'SensorReading':
+        """Create instance from database row."""
+        return cls(
+            sensor_id=row['sensor_id'],
+            sensor_type=row['sensor_type'],
+            value=row['value'],
+            timestamp=datetime.fromisoformat(row['timestamp']),
+            unit=row['unit'],
+            metadata=eval(row['metadata']) if row['metadata'] else None
+        )
+
 @dataclass
 class Alert:
     """Represents a system alert."""
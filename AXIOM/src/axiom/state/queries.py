@@ -99,6 +99,22 @@ ORDER BY timestamp DESC
 LIMIT ?;
 """
 
+# Keyset page of events in insertion order, optionally within [start, end)
+GET_SYSTEM_EVENTS_AFTER = """
+SELECT * FROM system_events 
+WHERE id > ? 
+AND (? IS NULL OR timestamp >= ?) 
+AND (? IS NULL OR timestamp < ?) 
+ORDER BY id 
+LIMIT ?;
+"""
+
+INSERT_SENSOR_DATA = """
+INSERT INTO sensor_data (
+    sensor_id, sensor_type, value, unit, timestamp, metadata
+) VALUES (?, ?, ?, ?, ?, ?);
+"""
+
 # Cleanup queries
 CLEANUP_OLD_CONVERSATIONS = """
 DELETE FROM conversations 
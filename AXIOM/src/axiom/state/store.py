@@ -3,11 +3,13 @@
 import sqlite3
 import logging
 import json
+import threading
+import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
 from datetime import datetime
 from contextlib import contextmanager
-from threading import Lock
+from threading import BoundedSemaphore, Lock
 
 from .models import ConversationTurn, SystemEvent, Alert
 from .exceptions import (
@@ -16,27 +18,99 @@ from .exceptions import (
     QueryExecutionError
 )
 from .queries import *
+from ..config import DatabaseConfig, SQLITE_JOURNAL_MODES, SQLITE_SYNCHRONOUS_LEVELS
+from ..utils.metrics import Histogram
 
 logger = logging.getLogger(__name__)
 
+class _PooledConnection:
+    """A pooled connection and when it was opened and last used."""
+    __slots__ = ("connection", "created_at", "owner")
+    
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self.created_at = time.monotonic()
+        self.owner: Optional[int] = None  # Thread that last checked it out
+
 class StateStore:
     """
     SQLite-based persistent state store for the AXIOM system.
     Provides ACID-compliant storage with connection pooling.
+    
+    Connections use write-ahead logging by default, so history queries and
+    health checks read a consistent snapshot without blocking the writer,
+    and with ``synchronous=NORMAL`` a commit no longer waits for an fsync
+    (a power loss may roll back the last few commits, but never corrupts
+    the database).
+    
+    At most ``pool_size`` connections are checked out at once; further
+    callers wait up to ``pool_timeout`` for one to be returned. Idle
+    connections are checked with ``SELECT 1`` before reuse and replaced
+    once older than ``max_lifetime``. Connections may move between threads
+    (one user at a time), but a thread gets back the connection it used
+    last when that one is free, keeping its page cache warm.
+    
+    A long-lived user such as a write-behind writer can hold a connection
+    of its own with ``dedicated_connection``; it takes one of the
+    ``pool_size`` slots for as long as it is held.
     """
     
-    def __init__(self, db_path: Union[str, Path], pool_size: int = 5):
+    def __init__(self, db_path: Union[str, Path], pool_size: int = 5,
+                 journal_mode: str = "WAL",
+                 synchronous: str = "NORMAL",
+                 cache_size_kb: int = 8192,
+                 mmap_size: int = 64 * 1024 * 1024,
+                 busy_timeout_ms: int = 5000,
+                 pool_timeout: float = 5.0,
+                 max_lifetime: Optional[float] = 3600.0):
         """
         Initialize the state store.
         
         Args:
             db_path: Path to SQLite database file
             pool_size: Maximum number of concurrent database connections
+            journal_mode: SQLite journal mode (``PRAGMA journal_mode``)
+            synchronous: When SQLite fsyncs (``PRAGMA synchronous``)
+            cache_size_kb: Page cache size per connection, in KiB
+            mmap_size: Bytes of the database file to memory-map; 0 disables it
+            busy_timeout_ms: Time to wait for a lock held by another
+                connection before failing with "database is locked"
+            pool_timeout: Seconds to wait for a free connection
+            max_lifetime: Seconds after which a connection is closed and
+                replaced instead of reused; None keeps connections open
+            
+        Raises:
+            ValueError: If the journal mode or synchronous level is unknown,
+                or the pool size is not positive
         """
+        if pool_size <= 0:
+            raise ValueError(f"pool_size must be positive, got {pool_size}")
+        if journal_mode.upper() not in SQLITE_JOURNAL_MODES:
+            raise ValueError(f"Unknown SQLite journal mode: {journal_mode}")
+        if synchronous.upper() not in SQLITE_SYNCHRONOUS_LEVELS:
+            raise ValueError(f"Unknown SQLite synchronous level: {synchronous}")
         self._db_path = Path(db_path)
         self._pool_size = pool_size
+        self._journal_mode = journal_mode.upper()
+        self._pragmas = (
+            f"PRAGMA synchronous = {synchronous.upper()}",
+            f"PRAGMA cache_size = {-int(cache_size_kb)}",  # Negative sizes are in KiB
+            f"PRAGMA mmap_size = {int(mmap_size)}",
+            f"PRAGMA busy_timeout = {int(busy_timeout_ms)}"
+        )
         self._lock = Lock()
-        self._connections: List[sqlite3.Connection] = []
+        self._connections: List[_PooledConnection] = []  # Idle, most recently returned last
+        self._slots = BoundedSemaphore(pool_size)
+        self._pool_timeout = pool_timeout
+        self._max_lifetime = max_lifetime
+        
+        # Pool metrics
+        self._wait_times = Histogram()
+        self._in_use = 0
+        self._timeouts = 0
+        self._opened = 0
+        self._recycled = 0
+        self._invalidated = 0
         
         # Ensure database directory exists
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -44,10 +118,47 @@ class StateStore:
         # Initialize database
         self._initialize_database()
     
+    @classmethod
+    def from_config(cls, config: DatabaseConfig) -> 'StateStore':
+        """
+        Create a state store from the database section of the AXIOM config.
+        
+        Args:
+            config: Database configuration
+            
+        Returns:
+            State store using the configured path, pool size and settings
+        """
+        return cls(
+            config.path,
+            pool_size=config.max_connections,
+            journal_mode=config.journal_mode,
+            synchronous=config.synchronous,
+            cache_size_kb=config.cache_size_kb,
+            mmap_size=config.mmap_size,
+            busy_timeout_ms=config.busy_timeout_ms,
+            pool_timeout=config.pool_timeout_ms / 1000,
+            max_lifetime=config.connection_max_lifetime_s or None
+        )
+    
+    @property
+    def db_path(self) -> Path:
+        """Path of the SQLite database file."""
+        return self._db_path
+    
     def _initialize_database(self) -> None:
         """Initialize database schema if not exists."""
         try:
             with self._get_connection() as conn:
+                # The journal mode is stored in the database file, so it is
+                # set once here rather than on every connection
+                mode = conn.execute(f"PRAGMA journal_mode = {self._journal_mode}").fetchone()[0]
+                if mode.upper() != self._journal_mode:
+                    logger.warning(
+                        f"SQLite journal mode {self._journal_mode} unavailable for "
+                        f"{self._db_path}; using {mode}"
+                    )
+                
                 cursor = conn.cursor()
                 
                 # Create schema version table
@@ -68,48 +179,192 @@ class StateStore:
         except sqlite3.Error as e:
             raise DatabaseMigrationError(f"Failed to initialize database: {e}")
     
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection with the store's settings applied.
+        
+        Returns:
+            New connection; it may be handed between threads, but must only
+            be used by one at a time
+        """
+        connection = sqlite3.connect(
+            self._db_path,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False
+        )
+        connection.row_factory = sqlite3.Row
+        for pragma in self._pragmas:
+            connection.execute(pragma)
+        return connection
+    
     @contextmanager
     def _get_connection(self):  # Type hint removed as it's a context manager
         """
         Get a database connection from the pool.
         
+        Waits for a free slot if ``pool_size`` connections are checked out.
+        A connection returned with a transaction still open is rolled back.
+        
         Yields:
             sqlite3.Connection: A database connection from the pool
             
         Raises:
             DatabaseConnectionError: If no connection could be obtained
         """
-        connection = None
+        self._acquire_slot()
+        pooled = None
+        try:
+            pooled = self._checkout()
+            yield pooled.connection
+        except sqlite3.Error as e:
+            if pooled is None:
+                raise DatabaseConnectionError(f"Failed to open database connection: {e}")
+            raise
+        finally:
+            if pooled is not None:
+                self._checkin(pooled)
+            self._release_slot()
+    
+    @contextmanager
+    def dedicated_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Hold a connection outside the idle pool for as long as the context lasts.
         
+        The connection is newly opened with the store's settings and closed
+        on exit rather than pooled, so its holder may change per-connection
+        pragmas. It counts against ``pool_size`` and shows as in use in
+        ``pool_stats`` while held; keep ``pool_size`` above the number of
+        dedicated connections, or other callers will time out.
+        
+        Yields:
+            sqlite3.Connection: A connection for the holder's use only
+            
+        Raises:
+            DatabaseConnectionError: If no slot is free within ``pool_timeout``
+                or the connection cannot be opened
+        """
+        self._acquire_slot()
         try:
+            try:
+                connection = self._connect()
+            except sqlite3.Error as e:
+                raise DatabaseConnectionError(f"Failed to open database connection: {e}")
+            with self._lock:
+                self._opened += 1
+            try:
+                yield connection
+            finally:
+                connection.close()
+        finally:
+            self._release_slot()
+    
+    def _acquire_slot(self) -> None:
+        """Take one of the ``pool_size`` slots, waiting up to the pool timeout."""
+        started = time.monotonic()
+        if not self._slots.acquire(timeout=self._pool_timeout):
             with self._lock:
-                # Try to get an existing connection
+                self._timeouts += 1
+            raise DatabaseConnectionError(
+                f"No database connection free within {self._pool_timeout}s "
+                f"(pool size {self._pool_size})"
+            )
+        self._wait_times.record(time.monotonic() - started)
+        with self._lock:
+            self._in_use += 1
+    
+    def _release_slot(self) -> None:
+        """Give back a slot taken by ``_acquire_slot``."""
+        with self._lock:
+            self._in_use -= 1
+        self._slots.release()
+    
+    def _checkout(self) -> _PooledConnection:
+        """Take an idle connection, preferring this thread's last one, or open one."""
+        thread = threading.get_ident()
+        pooled = None
+        with self._lock:
+            for index in range(len(self._connections) - 1, -1, -1):
+                if self._connections[index].owner == thread:
+                    pooled = self._connections.pop(index)
+                    break
+            else:
                 if self._connections:
-                    connection = self._connections.pop()
-                
-                # Create new connection if needed
-                if connection is None:
-                    if len(self._connections) >= self._pool_size:
-                        raise DatabaseConnectionError("Connection pool exhausted")
-                    
-                    connection = sqlite3.connect(
-                        self._db_path,
-                        detect_types=sqlite3.PARSE_DECLTYPES
-                    )
-                    connection.row_factory = sqlite3.Row
-            
-            yield connection
-            
-            # Return connection to pool
+                    pooled = self._connections.pop()
+        
+        if pooled is not None:
+            if self._max_lifetime is not None and \
+                    time.monotonic() - pooled.created_at > self._max_lifetime:
+                self._discard(pooled, "recycled")
+                pooled = None
+            elif not self._is_healthy(pooled.connection):
+                self._discard(pooled, "invalidated")
+                pooled = None
+        
+        if pooled is None:
+            pooled = _PooledConnection(self._connect())
             with self._lock:
-                if len(self._connections) < self._pool_size:
-                    self._connections.append(connection)
-                    connection = None
-                
-        finally:
-            # Close connection if not returned to pool
-            if connection is not None:
-                connection.close()
+                self._opened += 1
+        pooled.owner = thread
+        return pooled
+    
+    def _checkin(self, pooled: _PooledConnection) -> None:
+        """Return a connection to the idle list, or close it if it is unusable."""
+        connection = pooled.connection
+        if connection.in_transaction:
+            try:
+                connection.rollback()
+            except sqlite3.Error:
+                self._discard(pooled, "invalidated")
+                return
+        with self._lock:
+            self._connections.append(pooled)
+    
+    @staticmethod
+    def _is_healthy(connection: sqlite3.Connection) -> bool:
+        """Check an idle connection still answers a trivial query."""
+        try:
+            connection.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+    
+    def _discard(self, pooled: _PooledConnection, reason: str) -> None:
+        """Close a connection that is not going back into the pool."""
+        with self._lock:
+            if reason == "recycled":
+                self._recycled += 1
+            else:
+                self._invalidated += 1
+        try:
+            pooled.connection.close()
+        except sqlite3.Error:
+            pass
+        logger.debug(f"Database connection {reason}")
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool gauges, counters and checkout wait times.
+        
+        Returns:
+            Dictionary with pool size, connections in use and idle,
+            connections opened, recycled and invalidated, checkout timeouts,
+            and checkout wait percentiles in seconds
+        """
+        wait = self._wait_times.snapshot((50.0, 99.0))
+        with self._lock:
+            return {
+                "size": self._pool_size,
+                "in_use": self._in_use,
+                "idle": len(self._connections),
+                "opened": self._opened,
+                "recycled": self._recycled,
+                "invalidated": self._invalidated,
+                "timeouts": self._timeouts,
+                "checkouts": wait["count"],
+                "wait_p50": wait["p50"],
+                "wait_p99": wait["p99"],
+                "wait_max": wait["max"]
+            }
     
     def log_conversation_turn(self, turn: ConversationTurn) -> None:
         """
@@ -195,6 +450,53 @@ class StateStore:
         except sqlite3.Error as e:
             raise QueryExecutionError(f"Failed to get system events: {e}")
     
+    def iter_system_events(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        after_id: int = 0,
+        chunk_size: int = 500
+    ) -> Iterator[Tuple[int, SystemEvent]]:
+        """
+        Stream system events in the order they were logged.
+        
+        Events are fetched ``chunk_size`` rows at a time, each page a
+        separate query that resumes after the last row ID, so memory stays
+        constant and no connection is held between pages.
+        
+        Args:
+            start: Only events at or after this time
+            end: Only events before this time
+            after_id: Only events with a row ID above this one (to resume)
+            chunk_size: Rows fetched per query
+        
+        Yields:
+            (row ID, system event) pairs in ascending row ID order
+        
+        Raises:
+            QueryExecutionError: If a query fails
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        start_text = start.isoformat() if start else None
+        end_text = end.isoformat() if end else None
+        
+        while True:
+            try:
+                with self._get_connection() as conn:
+                    rows = conn.execute(
+                        GET_SYSTEM_EVENTS_AFTER,
+                        (after_id, start_text, start_text, end_text, end_text, chunk_size)
+                    ).fetchall()
+            except sqlite3.Error as e:
+                raise QueryExecutionError(f"Failed to read system events: {e}")
+            
+            for row in rows:
+                yield row['id'], SystemEvent.from_db_row(row)
+            if len(rows) < chunk_size:
+                return
+            after_id = rows[-1]['id']
+    
     def cleanup_old_data(
         self, 
         conversation_days: int = 30, 
@@ -265,6 +567,6 @@ class StateStore:
     def close(self) -> None:
         """Close all database connections."""
         with self._lock:
-            for conn in self._connections:
-                conn.close()
+            for pooled in self._connections:
+                pooled.connection.close()
             self._connections.clear()
\ No newline at end of file
@@ -0,0 +1,376 @@
+"""Write-behind writer that batches state store inserts off the caller's thread."""
+
+import asyncio
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .models import ConversationTurn, SystemEvent, SensorReading
+from .exceptions import QueryExecutionError, WriteQueueFullError
+from .queries import INSERT_CONVERSATION, INSERT_SYSTEM_EVENT, INSERT_SENSOR_DATA
+from .store import StateStore
+from ..config import DatabaseConfig
+
+logger = logging.getLogger(__name__)
+
+Record = Union[ConversationTurn, SystemEvent, SensorReading]
+
+# Insert statement for each record type the writer accepts
+INSERTS = {
+    ConversationTurn: INSERT_CONVERSATION,
+    SystemEvent: INSERT_SYSTEM_EVENT,
+    SensorReading: INSERT_SENSOR_DATA
+}
+
+class DurabilityMode(Enum):
+    """What a write has survived by the time it returns."""
+    BUFFERED = "buffered"    # Queued only; a crash loses writes not yet flushed
+    COMMITTED = "committed"  # Committed; survives a process crash, not always power loss
+    SYNCED = "synced"        # Committed and fsynced (synchronous=FULL); survives power loss
+
+class WriteBehindWriter:
+    """
+    Batches conversation turns, system events and sensor readings into
+    group commits on a dedicated writer thread.
+    
+    Records are queued and a background thread writes whatever has
+    arrived within ``flush_interval`` (or ``max_batch`` records, if
+    sooner) with one ``executemany`` per table in a single transaction, so
+    callers pay for a queue put instead of an insert and a commit.
+    
+    ``durability`` decides what a write waits for: BUFFERED returns once
+    the record is queued; COMMITTED and SYNCED wait until its batch is
+    committed, sharing the commit with every other record in the batch.
+    If a batch fails, its records are retried one at a time so a single
+    bad row (e.g. a duplicate key) only fails itself; a record that cannot
+    be converted to a row fails without holding up the rest of its batch.
+    
+    The queue holds at most ``max_pending`` records; writers wait up to
+    ``enqueue_timeout`` for room and then get ``WriteQueueFullError``.
+    ``close`` writes everything still queued before returning.
+    
+    The writer thread holds one of the store's ``pool_size`` connections
+    (see ``StateStore.dedicated_connection``) from ``start`` until ``close``.
+    """
+    
+    def __init__(self, store: StateStore,
+                 durability: DurabilityMode = DurabilityMode.BUFFERED,
+                 flush_interval: float = 0.05,
+                 max_batch: int = 500,
+                 max_pending: int = 10_000,
+                 enqueue_timeout: Optional[float] = 1.0):
+        """
+        Initialize the writer; call ``start`` to begin writing.
+        
+        Args:
+            store: State store whose database is written to
+            durability: What each write waits for
+            flush_interval: Longest a record waits to be batched, in seconds
+            max_batch: Records written per transaction at most
+            max_pending: Records queued before writers have to wait
+            enqueue_timeout: Seconds a writer waits for queue room; None
+                waits indefinitely
+        """
+        if flush_interval <= 0:
+            raise ValueError(f"flush_interval must be positive, got {flush_interval}")
+        if max_batch <= 0 or max_pending <= 0:
+            raise ValueError("max_batch and max_pending must be positive")
+        self._store = store
+        self._durability = durability
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._enqueue_timeout = enqueue_timeout
+        self._queue: "queue.Queue[Optional[Tuple[Record, Optional[Future]]]]" = queue.Queue(max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._lock = threading.Lock()
+        
+        # Counters
+        self._written = 0
+        self._failed = 0
+        self._batches = 0
+        self._last_flush_seconds = 0.0
+    
+    @classmethod
+    def from_config(cls, store: StateStore, config: DatabaseConfig) -> 'WriteBehindWriter':
+        """
+        Create a writer from the database section of the AXIOM config.
+        
+        Args:
+            store: State store whose database is written to
+            config: Database configuration
+        
+        Returns:
+            Writer using the configured durability, flush interval and queue size
+        """
+        return cls(
+            store,
+            durability=DurabilityMode(config.write_durability),
+            flush_interval=config.write_flush_interval_ms / 1000,
+            max_pending=config.write_queue_size
+        )
+    
+    @property
+    def durability(self) -> DurabilityMode:
+        return self._durability
+    
+    def start(self, register_shutdown: bool = True) -> None:
+        """
+        Start the writer thread.
+        
+        Args:
+            register_shutdown: Register ``close`` with the graceful shutdown
+                handler so queued records are written before exit
+        """
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="axiom-state-writer", daemon=True)
+            self._thread.start()
+        if register_shutdown:
+            from ..utils.shutdown import register_shutdown_handler
+            register_shutdown_handler("state_writer", self.close)
+        logger.info(
+            f"State writer started ({self._durability.value}, "
+            f"flush every {self._flush_interval * 1000:.0f}ms)"
+        )
+    
+    def submit(self, record: Record) -> Future:
+        """
+        Queue a record, waiting for room if the queue is full.
+        
+        Args:
+            record: Conversation turn, system event or sensor reading
+        
+        Returns:
+            Future that completes once the record is committed, or fails
+            with QueryExecutionError; already complete in BUFFERED mode
+        
+        Raises:
+            WriteQueueFullError: If the queue stayed full past the timeout
+            QueryExecutionError: If the writer is closed
+            TypeError: If the record is of an unsupported type
+        """
+        item, future = self._prepare(record)
+        self._put(item)
+        return future
+    
+    def write(self, record: Record) -> None:
+        """
+        Queue a record and wait as long as the durability mode requires.
+        
+        Args:
+            record: Conversation turn, system event or sensor reading
+        
+        Raises:
+            WriteQueueFullError: If the queue stayed full past the timeout
+            QueryExecutionError: If the record could not be written
+        """
+        self.submit(record).result()
+    
+    async def write_async(self, record: Record) -> None:
+        """
+        Queue a record from the event loop without blocking it.
+        
+        Waits for the commit only in COMMITTED and SYNCED modes; waiting for
+        queue room, if the queue is full, happens on a worker thread.
+        
+        Args:
+            record: Conversation turn, system event or sensor reading
+        
+        Raises:
+            WriteQueueFullError: If the queue stayed full past the timeout
+            QueryExecutionError: If the record could not be written
+        """
+        item, future = self._prepare(record)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            await asyncio.get_running_loop().run_in_executor(None, self._put, item)
+        if not future.done():
+            await asyncio.wrap_future(future)
+        else:
+            future.result()
+    
+    def flush(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Wait until every record queued so far is written.
+        
+        Args:
+            timeout: Seconds to wait; None waits indefinitely
+        
+        Raises:
+            WriteQueueFullError: If the queue stayed full past the timeout
+            TimeoutError: If the records were not written within the timeout
+            QueryExecutionError: If the writer thread has stopped
+        """
+        if self._thread is None or self._closed:
+            return
+        self._check_running()
+        future: Future = Future()
+        try:
+            self._queue.put((None, future), timeout=timeout)
+        except queue.Full:
+            raise WriteQueueFullError(
+                f"State writer queue full ({self._queue.maxsize} records) for {timeout}s"
+            )
+        future.result(timeout=timeout)
+    
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Write everything still queued and stop the writer thread.
+        
+        Args:
+            timeout: Seconds to wait for the thread; None waits indefinitely
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is None:
+            return
+        if not thread.is_alive():
+            logger.error(f"State writer thread had stopped; {self._queue.qsize()} records unwritten")
+            return
+        self._queue.put(None)
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.error(f"State writer did not finish within {timeout}s; {self._queue.qsize()} records unwritten")
+        else:
+            logger.info(f"State writer closed after writing {self._written} records")
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get queue depth, records written and failed, batches and last flush time."""
+        return {
+            "durability": self._durability.value,
+            "pending": self._queue.qsize(),
+            "written": self._written,
+            "failed": self._failed,
+            "batches": self._batches,
+            "last_flush_seconds": self._last_flush_seconds
+        }
+    
+    def _put(self, item: Tuple[Record, Optional[Future]]) -> None:
+        """Queue an item, waiting up to the enqueue timeout for room."""
+        try:
+            self._queue.put(item, timeout=self._enqueue_timeout)
+        except queue.Full:
+            raise WriteQueueFullError(
+                f"State writer queue full ({self._queue.maxsize} records) "
+                f"for {self._enqueue_timeout}s"
+            )
+    
+    def _check_running(self) -> None:
+        """Refuse work a stopped writer thread would never complete."""
+        thread = self._thread
+        if thread is not None and not thread.is_alive():
+            raise QueryExecutionError("State writer thread has stopped")
+    
+    def _prepare(self, record: Record) -> Tuple[Tuple[Record, Optional[Future]], Future]:
+        """Check a record and pair it with the future its writer gets back."""
+        if type(record) not in INSERTS:
+            raise TypeError(f"Cannot write {type(record).__name__} records")
+        if self._closed:
+            raise QueryExecutionError("State writer is closed")
+        self._check_running()
+        future: Future = Future()
+        if self._durability is DurabilityMode.BUFFERED:
+            future.set_result(None)
+            return (record, None), future
+        return (record, future), future
+    
+    def _run(self) -> None:
+        """Writer thread: collect a batch, write it, repeat until closed."""
+        with self._store.dedicated_connection() as connection:
+            if self._durability is DurabilityMode.SYNCED:
+                connection.execute("PRAGMA synchronous = FULL")
+            closing = False
+            while not closing:
+                item = self._queue.get()
+                batch = []
+                deadline = time.monotonic() + self._flush_interval
+                while item is not None:
+                    batch.append(item)
+                    if len(batch) >= self._max_batch:
+                        break
+                    try:
+                        item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                else:
+                    # Close sentinel; everything queued before it is in this batch
+                    closing = True
+                try:
+                    self._write_batch(connection, batch)
+                except Exception as e:
+                    # Keep writing; fail whatever this batch left unresolved
+                    logger.exception("State writer batch failed")
+                    for record, future in batch:
+                        if record is not None:
+                            self._fail(record, future, e)
+                        elif not future.done():
+                            future.set_result(None)
+    
+    def _write_batch(self, connection: sqlite3.Connection,
+                     batch: List[Tuple[Optional[Record], Optional[Future]]]) -> None:
+        """Insert a batch in one transaction, falling back to row by row."""
+        records = [(record, future) for record, future in batch if record is not None]
+        markers = [future for record, future in batch if record is None]
+        if records:
+            started = time.perf_counter()
+            by_query: Dict[str, List[tuple]] = {}
+            rows_ok = []
+            for record, future in records:
+                try:
+                    row = record.to_db_tuple()
+                except Exception as e:
+                    self._fail(record, future, e)
+                    continue
+                by_query.setdefault(INSERTS[type(record)], []).append(row)
+                rows_ok.append((record, future))
+            records = rows_ok
+            try:
+                with connection:
+                    for query, rows in by_query.items():
+                        connection.executemany(query, rows)
+            except sqlite3.Error as e:
+                logger.warning(f"Batch of {len(records)} records failed ({e}); writing them one at a time")
+                for record, future in records:
+                    self._write_one(connection, record, future)
+            else:
+                self._written += len(records)
+                for _, future in records:
+                    if future is not None:
+                        future.set_result(None)
+            self._batches += 1
+            self._last_flush_seconds = time.perf_counter() - started
+        for future in markers:
+            future.set_result(None)
+    
+    def _write_one(self, connection: sqlite3.Connection, record: Record,
+                   future: Optional[Future]) -> None:
+        """Insert a single record in its own transaction."""
+        try:
+            with connection:
+                connection.execute(INSERTS[type(record)], record.to_db_tuple())
+        except Exception as e:
+            self._fail(record, future, e)
+            return
+        self._written += 1
+        if future is not None:
+            future.set_result(None)
+    
+    def _fail(self, record: Record, future: Optional[Future], error: Exception) -> None:
+        """Count a record that could not be written and fail its future."""
+        if future is not None and future.done():
+            return
+        self._failed += 1
+        logger.error(f"Failed to write {type(record).__name__}: {error}")
+        if future is not None:
+            future.set_exception(QueryExecutionError(f"Failed to write {type(record).__name__}: {error}"))
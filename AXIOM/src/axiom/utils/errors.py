@@ -26,6 +26,7 @@ class ErrorCode(Enum):
     BUS_QUEUE_FULL = "BUS-004"
     BUS_SUBSCRIBER_ERROR = "BUS-005"
     BUS_INITIALIZATION_FAILED = "BUS-006"
+    BUS_CIRCUIT_OPEN = "BUS-007"
     
     # State Management Errors (STATE-XXX)
     STATE_DATABASE_CONNECTION_FAILED = "STATE-001"
@@ -184,6 +185,18 @@ class RetryConfig:
         ErrorCode.SYSTEM_RESOURCE_EXHAUSTED
     }
     
+    # Error codes that mean a subscriber, or something it depends on, is
+    # unhealthy, so they count towards opening its circuit breaker. Other
+    # AXIOM errors are about a single event and do not.
+    BREAKER_ERRORS = {
+        ErrorCode.BUS_SUBSCRIBER_ERROR,
+        ErrorCode.STATE_DATABASE_CONNECTION_FAILED,
+        ErrorCode.STATE_QUERY_FAILED,
+        ErrorCode.VA_PIPELINE_ERROR,
+        ErrorCode.SYSTEM_TIMEOUT,
+        ErrorCode.SYSTEM_RESOURCE_EXHAUSTED
+    }
+    
     @classmethod
     def is_retryable(cls, error_code: str) -> bool:
         """Check if an error code allows retry."""
@@ -193,6 +206,21 @@ class RetryConfig:
         except ValueError:
             return False
     
+    @classmethod
+    def trips_breaker(cls, error: BaseException) -> bool:
+        """
+        Check if a subscriber's error counts towards opening its circuit breaker.
+        
+        AXIOM errors count only if their code is in BREAKER_ERRORS; any other
+        exception is unexpected and counts.
+        """
+        if isinstance(error, AxiomError):
+            try:
+                return ErrorCode(error.error_code) in cls.BREAKER_ERRORS
+            except ValueError:
+                return True
+        return True
+    
     @classmethod
     def get_backoff_time(cls, attempt: int) -> float:
         """Calculate backoff time for given attempt (1-indexed)."""
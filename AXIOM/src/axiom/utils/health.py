@@ -125,7 +125,7 @@ class HealthChecker:
                 # Try a simple query
                 with state_store._get_connection() as conn:
                     cursor = conn.cursor()
-                    cursor.execute("SELECT COUNT(*) FROM conversation_turns")
+                    cursor.execute("SELECT COUNT(*) FROM conversations")
                     count = cursor.fetchone()[0]
                 
                 result = HealthCheckResult(
@@ -134,7 +134,8 @@ class HealthChecker:
                     message="Database connection successful",
                     details={
                         "path": str(state_store.db_path),
-                        "conversation_turns": count
+                        "conversation_turns": count,
+                        "pool": state_store.pool_stats()
                     },
                     critical=True
                 )
@@ -165,14 +166,15 @@ class HealthChecker:
         """Check event bus operational status."""
         try:
             publisher_count = len(event_bus._publishers)
-            subscriber_count = sum(len(subs) for subs in event_bus._subscribers.values())
-            queue_size = event_bus._event_queue.qsize()
+            subscriber_count = event_bus._routes.subscriber_count()
+            queue_stats = event_bus.get_queue_stats()
+            queue_size = queue_stats["depth"]
             
             status = HealthStatus.HEALTHY
             message = "Event bus operational"
             
             # Check for potential issues
-            if queue_size > event_bus._event_queue.maxsize * 0.8:
+            if queue_size > queue_stats["maxsize"] * 0.8:
                 status = HealthStatus.DEGRADED
                 message = "Event queue near capacity"
             
@@ -184,7 +186,8 @@ class HealthChecker:
                     "publishers": publisher_count,
                     "subscribers": subscriber_count,
                     "queue_size": queue_size,
-                    "queue_max": event_bus._event_queue.maxsize
+                    "queue_max": queue_stats["maxsize"],
+                    "events_dropped": queue_stats["dropped"]
                 },
                 critical=False
             )
@@ -0,0 +1,260 @@
+"""
+In-process metrics for AXIOM.
+
+Provides:
+- Counters for totals that only grow (events published, retries)
+- Gauges for levels sampled at a point in time (queue depth)
+- Log-linear histograms for latencies, with bounded memory and error
+- A registry keyed by metric name and labels, with a snapshot API
+"""
+
+import math
+from threading import Lock
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+class Counter:
+    """Monotonically increasing count."""
+    
+    __slots__ = ("_value", "_lock")
+    
+    def __init__(self):
+        self._value = 0
+        self._lock = Lock()
+    
+    def inc(self, amount: int = 1) -> None:
+        """Add to the count."""
+        if amount < 0:
+            raise ValueError(f"Counters cannot decrease, got {amount}")
+        with self._lock:
+            self._value += amount
+    
+    @property
+    def value(self) -> int:
+        return self._value
+
+class Gauge:
+    """Value that can go up and down."""
+    
+    __slots__ = ("_value", "_lock")
+    
+    def __init__(self):
+        self._value = 0.0
+        self._lock = Lock()
+    
+    def set(self, value: float) -> None:
+        """Replace the value."""
+        self._value = value
+    
+    def inc(self, amount: float = 1.0) -> None:
+        """Raise the value."""
+        with self._lock:
+            self._value += amount
+    
+    def dec(self, amount: float = 1.0) -> None:
+        """Lower the value."""
+        with self._lock:
+            self._value -= amount
+    
+    @property
+    def value(self) -> float:
+        return self._value
+
+class Histogram:
+    """
+    Distribution of positive values in log-linear buckets, HDR-style.
+    
+    Each power of two is split into ``sub_buckets`` equal-width buckets, so
+    a recorded value lands in a bucket at most 1/``sub_buckets`` of its own
+    size wide (about 1.6% with the default 64) whatever its magnitude.
+    Buckets are only created once a value lands in them, so memory grows
+    with the spread of the values rather than their number, and recording
+    is a ``frexp`` and a dictionary update.
+    
+    Percentiles are reported as the midpoint of the bucket holding them,
+    clamped to the exact minimum and maximum. Zero and negative values are
+    counted in a bucket of their own.
+    """
+    
+    __slots__ = ("_sub_buckets", "_buckets", "_count", "_sum", "_min", "_max", "_lock")
+    
+    def __init__(self, sub_buckets: int = 64):
+        """
+        Initialize an empty histogram.
+        
+        Args:
+            sub_buckets: Linear buckets per power of two; higher is more precise
+        """
+        if sub_buckets <= 0:
+            raise ValueError(f"sub_buckets must be positive, got {sub_buckets}")
+        self._sub_buckets = sub_buckets
+        self._buckets: Dict[int, int] = {}
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        self._lock = Lock()
+    
+    def record(self, value: float) -> None:
+        """Add one observation."""
+        index = self._index(value)
+        with self._lock:
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+            self._count += 1
+            self._sum += value
+            if value < self._min:
+                self._min = value
+            if value > self._max:
+                self._max = value
+    
+    @property
+    def count(self) -> int:
+        return self._count
+    
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Get the value below which ``percent`` of observations fall.
+        
+        Args:
+            percent: Percentile between 0 and 100
+        
+        Returns:
+            Estimated value, or None if nothing has been recorded
+        """
+        return self.percentiles((percent,))[percent]
+    
+    def percentiles(self, percents: Iterable[float]) -> Dict[float, Optional[float]]:
+        """
+        Get several percentiles in one pass over the buckets.
+        
+        Args:
+            percents: Percentiles between 0 and 100
+        
+        Returns:
+            Estimated value for each percentile, None if nothing was recorded
+        """
+        percents = sorted(percents)
+        with self._lock:
+            buckets = sorted(self._buckets.items())
+            count, low, high = self._count, self._min, self._max
+        if not count:
+            return {percent: None for percent in percents}
+        
+        result: Dict[float, Optional[float]] = {}
+        seen = 0
+        position = 0
+        for percent in percents:
+            if not 0 <= percent <= 100:
+                raise ValueError(f"Percentile must be between 0 and 100, got {percent}")
+            rank = max(1, math.ceil(percent / 100 * count))
+            while seen < rank:
+                seen += buckets[position][1]
+                position += 1
+            result[percent] = min(max(self._midpoint(buckets[position - 1][0]), low), high)
+        return result
+    
+    def snapshot(self, percents: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+        """Get count, sum, min, max, mean and percentiles as a dictionary."""
+        values = self.percentiles(percents)
+        with self._lock:
+            count, total, low, high = self._count, self._sum, self._min, self._max
+        summary: Dict[str, Any] = {
+            "count": count,
+            "sum": total,
+            "min": low if count else None,
+            "max": high if count else None,
+            "mean": total / count if count else None
+        }
+        for percent, value in values.items():
+            summary[f"p{percent:g}"] = value
+        return summary
+    
+    def _index(self, value: float) -> int:
+        """Get the bucket for a value."""
+        if value <= 0:
+            return -(1 << 62)
+        mantissa, exponent = math.frexp(value)  # value = mantissa * 2**exponent, 0.5 <= mantissa < 1
+        return exponent * self._sub_buckets + int((mantissa - 0.5) * 2 * self._sub_buckets)
+    
+    def _midpoint(self, index: int) -> float:
+        """Get the value in the middle of a bucket."""
+        if index == -(1 << 62):
+            return 0.0
+        exponent, sub = divmod(index, self._sub_buckets)
+        return math.ldexp(0.5 + (sub + 0.5) / (2 * self._sub_buckets), exponent)
+
+class MetricsRegistry:
+    """
+    Named, labelled metrics shared by the components that update them.
+    
+    ``counter``, ``gauge`` and ``histogram`` return the metric for a name and
+    set of labels, creating it on first use; later calls with the same
+    arguments return the same object, so hot paths can look a metric up
+    once and keep it. Lookups of existing metrics take no lock.
+    """
+    
+    def __init__(self):
+        self._counters: Dict[Tuple[str, LabelKey], Counter] = {}
+        self._gauges: Dict[Tuple[str, LabelKey], Gauge] = {}
+        self._histograms: Dict[Tuple[str, LabelKey], Histogram] = {}
+        self._lock = Lock()
+    
+    def counter(self, name: str, **labels: Any) -> Counter:
+        """Get or create a counter."""
+        return self._get(self._counters, Counter, name, labels)
+    
+    def gauge(self, name: str, **labels: Any) -> Gauge:
+        """Get or create a gauge."""
+        return self._get(self._gauges, Gauge, name, labels)
+    
+    def histogram(self, name: str, **labels: Any) -> Histogram:
+        """Get or create a histogram."""
+        return self._get(self._histograms, Histogram, name, labels)
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the current value of every metric.
+        
+        Metrics are keyed Prometheus-style, ``name{label=value,...}``.
+        
+        Returns:
+            Dictionary with ``counters``, ``gauges`` and ``histograms``
+            sections; histograms are summarized by ``Histogram.snapshot``
+        """
+        with self._lock:
+            counters = list(self._counters.items())
+            gauges = list(self._gauges.items())
+            histograms = list(self._histograms.items())
+        return {
+            "counters": {_format_key(key): metric.value for key, metric in sorted(counters)},
+            "gauges": {_format_key(key): metric.value for key, metric in sorted(gauges)},
+            "histograms": {_format_key(key): metric.snapshot() for key, metric in sorted(histograms)}
+        }
+    
+    def clear(self) -> None:
+        """Forget every metric."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+    
+    def _get(self, metrics: Dict, factory: type, name: str, labels: Dict[str, Any]):
+        """Look a metric up, creating it under the lock if it is missing."""
+        key = (name, tuple(sorted((label, str(value)) for label, value in labels.items())))
+        metric = metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = metrics.get(key)
+                if metric is None:
+                    metric = metrics[key] = factory()
+        return metric
+
+def _format_key(key: Tuple[str, LabelKey]) -> str:
+    """Render a metric key as ``name{label=value,...}``."""
+    name, labels = key
+    if not labels:
+        return name
+    return name + "{" + ",".join(f"{label}={value}" for label, value in labels) + "}"
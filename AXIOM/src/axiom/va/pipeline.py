@@ -38,7 +38,9 @@ class Pipeline:
         self._performance_stats = []
         # Import and initialize state store
         from ..state.store import StateStore
+        from ..state.writer import WriteBehindWriter
         from ..state.models import ConversationTurn
+        from ..config import DatabaseConfig
         db_path = None
         if config and "database" in config and "path" in config["database"]:
             db_path = config["database"]["path"]
@@ -46,7 +48,13 @@ class Pipeline:
             # Fallback to default path
             from ..config import ROOT_DIR
             db_path = ROOT_DIR / "data" / "axiom.db"
-        self._state_store = StateStore(db_path)
+        db_settings = dict(config["database"]) if config and "database" in config else {}
+        db_settings["path"] = db_path
+        db_config = DatabaseConfig.from_dict(db_settings)
+        self._state_store = StateStore.from_config(db_config)
+        # Turns are written in batches on a writer thread, off the request path
+        self._state_writer = WriteBehindWriter.from_config(self._state_store, db_config)
+        self._state_writer.start()
         self._ConversationTurn = ConversationTurn
     def set_config(self, config: dict) -> None:
         """Update pipeline configuration."""
@@ -121,7 +129,7 @@ class Pipeline:
                 )
                 import datetime
                 turn.timestamp = datetime.datetime.now()
-                self._state_store.log_conversation_turn(turn)
+                await self._state_writer.write_async(turn)
             except Exception as log_exc:
                 logger.error(f"Failed to log conversation turn: {log_exc}")
             if not response_result.passed:
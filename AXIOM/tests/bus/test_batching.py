@@ -0,0 +1,106 @@
+"""Tests for batch publishing and batched delivery."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from axiom.bus.event_bus import EventBus
+from axiom.bus.events import Event, EventType
+from axiom.bus.exceptions import UnregisteredPublisherError
+from axiom.bus.queues import OverflowPolicy
+
+TOPIC = EventType.STATE_UPDATED.value
+
+
+def make_bus(**kwargs) -> EventBus:
+    bus = EventBus(circuit_breaker=None, **kwargs)
+    bus.register_publisher("test", [TOPIC])
+    return bus
+
+
+def events(count: int, source: str = "test"):
+    return [Event(TOPIC, {"i": i}, source) for i in range(count)]
+
+
+def test_publish_many_delivers_in_order():
+    async def scenario():
+        bus = make_bus()
+        received = []
+
+        async def handler(event):
+            received.append(event.payload["i"])
+
+        bus.subscribe(TOPIC, handler)
+        runner = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)
+        assert await bus.publish_many(events(50)) == 50
+        await bus._event_queue.join()
+        assert received == list(range(50))
+        await bus.stop()
+        await runner
+
+    asyncio.run(scenario())
+
+
+def test_publish_many_rejects_whole_batch_for_unregistered_publisher():
+    async def scenario():
+        bus = make_bus()
+        batch = events(3) + events(1, source="stranger")
+        with pytest.raises(UnregisteredPublisherError):
+            await bus.publish_many(batch)
+        assert bus.get_queue_stats()["depth"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_publish_many_counts_dropped_events():
+    async def scenario():
+        bus = make_bus(max_events=5, overflow_policy=OverflowPolicy.DROP_NEWEST)
+        assert await bus.publish_many(events(8)) == 5
+
+    asyncio.run(scenario())
+
+
+def test_batched_subscriber_gets_full_batches_then_lingering_rest():
+    async def scenario():
+        bus = make_bus()
+        batches = []
+
+        async def handler(batch):
+            batches.append([event.payload["i"] for event in batch])
+
+        bus.subscribe(TOPIC, handler, batch_size=4, batch_linger=timedelta(milliseconds=20))
+        runner = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)
+        await bus.publish_many(events(10))
+        await bus._event_queue.join()
+        assert batches == [[0, 1, 2, 3], [4, 5, 6, 7]]
+
+        await asyncio.sleep(0.1)  # The partial batch goes once it has lingered
+        assert batches[-1] == [8, 9]
+        await bus.stop()
+        await runner
+
+    asyncio.run(scenario())
+
+
+def test_partial_batch_flushed_on_stop():
+    async def scenario():
+        bus = make_bus()
+        batches = []
+
+        async def handler(batch):
+            batches.append(len(batch))
+
+        bus.subscribe(TOPIC, handler, batch_size=100, batch_linger=timedelta(seconds=60))
+        runner = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)
+        await bus.publish_many(events(3))
+        await bus._event_queue.join()
+        assert batches == []
+        await bus.stop()
+        await runner
+        assert batches == [3]
+
+    asyncio.run(scenario())
@@ -0,0 +1,106 @@
+"""Tests for debouncing bursts of per-entity updates."""
+
+import asyncio
+from datetime import timedelta
+
+from axiom.bus.coalescing import CoalesceConfig, EventCoalescer
+from axiom.bus.event_bus import EventBus
+from axiom.bus.events import Event, EventType
+
+TOPIC = EventType.STATE_UPDATED.value
+WINDOW = timedelta(milliseconds=30)
+
+
+def update(entity: str, **changes) -> Event:
+    return Event(TOPIC, {"entity_type": "light", "entity_id": entity, "changes": changes}, "test")
+
+
+def make_coalescer(released, **config):
+    async def on_release(event):
+        released.append(event)
+
+    coalescer = EventCoalescer(on_release)
+    coalescer.configure(TOPIC, CoalesceConfig(window=WINDOW, **config))
+    return coalescer
+
+
+def test_burst_collapses_to_latest_event_per_entity():
+    async def scenario():
+        released = []
+        coalescer = make_coalescer(released)
+        lamp = [update("lamp", on=True), update("lamp", level=3), update("lamp", level=7)]
+        for event in lamp + [update("fan", speed=1)]:
+            assert coalescer.add(event)
+        assert released == []
+
+        await asyncio.sleep(WINDOW.total_seconds() * 3)
+        by_entity = {event.payload["entity_id"]: event for event in released}
+        assert len(released) == 2
+        merged = by_entity["lamp"]
+        assert merged.payload["changes"] == {"on": True, "level": 7}
+        assert merged.payload["coalesced_count"] == 3
+        assert merged.correlation_id == lamp[-1].correlation_id
+        # A lone update is released untouched
+        assert "coalesced_count" not in by_entity["fan"].payload
+
+    asyncio.run(scenario())
+
+
+def test_max_delay_releases_a_constant_stream():
+    async def scenario():
+        released = []
+        coalescer = make_coalescer(released, max_delay=timedelta(milliseconds=60))
+        for i in range(20):
+            coalescer.add(update("lamp", level=i))
+            await asyncio.sleep(0.01)  # Always inside the window
+        assert released
+        assert coalescer.stats()["received"] == 20
+
+    asyncio.run(scenario())
+
+
+def test_unconfigured_or_keyless_events_are_not_held():
+    async def scenario():
+        coalescer = make_coalescer([])
+        assert not coalescer.add(Event(TOPIC, {"entity_id": "lamp", "changes": {}}, "test"))
+        assert not coalescer.add(Event(TOPIC, {"entity_type": "light", "entity_id": "lamp"}, "test"))
+        assert not coalescer.add(Event(EventType.VISION_FRAME.value, {}, "test"))
+
+    asyncio.run(scenario())
+
+
+def test_drain_releases_held_bursts_at_once():
+    async def scenario():
+        released = []
+        coalescer = make_coalescer(released)
+        coalescer.add(update("lamp", on=True))
+        coalescer.add(update("lamp", on=False))
+        merged = coalescer.drain()
+        assert [event.payload["changes"] for event in merged] == [{"on": False}]
+        assert coalescer.stats()["held"] == 0
+        # The cancelled timer never releases it a second time
+        await asyncio.sleep(WINDOW.total_seconds() * 2)
+        assert released == []
+
+    asyncio.run(scenario())
+
+
+def test_stopping_the_bus_queues_held_updates():
+    async def scenario():
+        bus = EventBus(circuit_breaker=None)
+        bus.register_publisher("test", [TOPIC])
+        bus.set_coalescing(TOPIC, timedelta(seconds=60))
+        runner = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)
+        await bus.publish(update("lamp", level=1))
+        await bus.publish(update("lamp", level=2))
+        assert bus.get_queue_stats()["depth"] == 0
+
+        await bus.stop()
+        await runner
+        assert bus.get_queue_stats()["depth"] == 1
+        merged = bus._event_queue.get_nowait()
+        assert merged.payload["changes"] == {"level": 2}
+        assert merged.payload["coalesced_count"] == 2
+
+    asyncio.run(scenario())
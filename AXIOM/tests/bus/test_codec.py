@@ -0,0 +1,108 @@
+"""Tests for the JSON and binary event codecs."""
+
+import struct
+
+import pytest
+
+from axiom.bus import codec as codec_module
+from axiom.bus.codec import BinaryCodec, EventCodec, JsonCodec, get_codec
+from axiom.bus.events import Event, EventType
+from axiom.bus.exceptions import EventCodecError
+
+TOPIC = EventType.STATE_UPDATED.value
+
+
+def sample() -> Event:
+    return Event(TOPIC, {"entity_id": "lamp", "changes": {"on": True}, "n": [1, 2.5]}, "vision")
+
+
+def test_event_codec_is_abstract():
+    with pytest.raises(TypeError):
+        EventCodec()
+
+
+@pytest.mark.parametrize("codec", [
+    JsonCodec(), BinaryCodec("json"), BinaryCodec("marshal"), get_codec("binary")
+])
+def test_round_trip(codec):
+    event = sample()
+    decoded = codec.decode(codec.encode(event))
+    assert decoded == event
+    assert decoded.correlation_id == event.correlation_id
+    assert decoded.timestamp == event.timestamp
+
+
+def test_binary_decode_from_memoryview():
+    codec = BinaryCodec("json")
+    event = sample()
+    assert codec.decode(memoryview(codec.encode(event))) == event
+
+
+def frame(source: bytes, correlation_id: bytes, payload: bytes = b"{}") -> bytes:
+    header = codec_module._HEADER.pack(
+        codec_module._MAGIC, codec_module._FORMAT_VERSION, codec_module._PAYLOAD_JSON,
+        codec_module._SCHEMAS_BY_TYPE[TOPIC].type_id, 1, 0, len(source), len(correlation_id)
+    )
+    return header + source + correlation_id + payload
+
+
+@pytest.mark.parametrize("data", [
+    b"\xae\x01",                                  # Truncated header
+    b"\x00" * 32,                                 # Wrong magic
+    frame(b"\xff\xfe", b"id"),                    # Source is not UTF-8
+    frame(b"vision", b"\xc3\x28"),                # Correlation ID is not UTF-8
+    frame(b"vision", b"id", b"[1, 2]"),           # Payload is not a dict
+    frame(b"vision", b"id", b"{not json"),        # Payload is not valid JSON
+    frame(b"vision", b"id")[:-4],                 # Body shorter than the header says
+])
+def test_malformed_binary_frames_raise_codec_error(data):
+    with pytest.raises(EventCodecError):
+        BinaryCodec().decode(data)
+
+
+def test_unknown_type_id_raises_codec_error():
+    data = bytearray(frame(b"vision", b"id"))
+    data[3] = 250
+    with pytest.raises(EventCodecError):
+        BinaryCodec().decode(bytes(data))
+
+
+def test_invalid_json_event_raises_codec_error():
+    with pytest.raises(EventCodecError):
+        JsonCodec().decode(b"\xff")
+
+
+def test_older_payload_versions_are_upgraded(monkeypatch):
+    schema = codec_module._SCHEMAS_BY_TYPE[TOPIC]
+    data = BinaryCodec("json").encode(Event(TOPIC, {"old": 1}, "vision"))
+    monkeypatch.setitem(codec_module._SCHEMAS_BY_TYPE, TOPIC,
+                        codec_module.EventSchema(schema.type_id, TOPIC, 2))
+    monkeypatch.setitem(codec_module._SCHEMAS_BY_ID, schema.type_id,
+                        codec_module.EventSchema(schema.type_id, TOPIC, 2))
+    monkeypatch.setitem(codec_module._UPGRADERS, (TOPIC, 1), lambda p: {"new": p["old"]})
+    assert BinaryCodec().decode(data).payload == {"new": 1}
+
+
+def test_unencodable_payload_raises_codec_error():
+    with pytest.raises(EventCodecError):
+        BinaryCodec("json").encode(Event(TOPIC, {"value": object()}, "vision"))
+
+
+@pytest.mark.parametrize("event_type, type_id", [
+    (EventType.SYSTEM_START, 1),
+    (EventType.STATE_UPDATED, 4),
+    (EventType.VISION_FRAME, 5),
+])
+def test_builtin_wire_ids_are_pinned(event_type, type_id):
+    event = Event(event_type.value, {}, "test")
+    assert BinaryCodec("json").encode(event)[3] == type_id
+
+
+def test_untrusted_codec_refuses_marshal_payloads():
+    data = BinaryCodec("marshal").encode(sample())
+    with pytest.raises(EventCodecError):
+        BinaryCodec(trusted=False).decode(data)
+    with pytest.raises(ValueError):
+        BinaryCodec("marshal", trusted=False)
+    event = sample()
+    assert BinaryCodec(trusted=False).decode(BinaryCodec("json").encode(event)) == event
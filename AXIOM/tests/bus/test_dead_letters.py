@@ -0,0 +1,134 @@
+"""Tests for dead-lettering failed deliveries and replaying them."""
+
+import asyncio
+import threading
+from datetime import timedelta
+
+import pytest
+
+from axiom.bus.event_bus import EventBus
+from axiom.bus.events import Event, EventType
+
+TOPIC = EventType.STATE_UPDATED.value
+
+
+class Flaky:
+    """Handler that fails until told to recover."""
+
+    def __init__(self):
+        self.healthy = False
+        self.received = []
+
+    async def __call__(self, event):
+        if not self.healthy:
+            raise RuntimeError("down")
+        self.received.append(event)
+
+
+async def bus_with_dead_letter(tmp_path, handler, **subscribe):
+    bus = EventBus(circuit_breaker=None, max_retry_attempts=1,
+                   dead_letter_path=tmp_path / "dead_letters.db")
+    bus.register_publisher("test", [TOPIC])
+    bus.subscribe(TOPIC, handler, **subscribe)
+    runner = asyncio.create_task(bus.start())
+    await asyncio.sleep(0)
+    await bus.publish(Event(TOPIC, {"i": 1}, "test"))
+    await bus._event_queue.join()
+    # Batched deliveries linger before they are made and dead-lettered
+    for _ in range(100):
+        if bus.get_failed_deliveries():
+            break
+        await asyncio.sleep(0.005)
+    return bus, runner
+
+
+async def stop(bus, runner):
+    await bus.stop()
+    await runner
+
+
+def test_failed_delivery_is_dead_lettered_and_replayed(tmp_path):
+    async def scenario():
+        handler = Flaky()
+        bus, runner = await bus_with_dead_letter(tmp_path, handler)
+        (letter,) = bus.get_failed_deliveries()
+        assert letter.error.startswith("RuntimeError")
+
+        handler.healthy = True
+        assert await bus.replay_dead_letters(rate=1000) == 1
+        assert [event.payload["i"] for event in handler.received] == [1]
+        assert bus.get_failed_deliveries() == []
+        await stop(bus, runner)
+
+    asyncio.run(scenario())
+
+
+def test_replay_keeps_letters_without_a_subscriber(tmp_path):
+    async def scenario():
+        handler = Flaky()
+        bus, runner = await bus_with_dead_letter(tmp_path, handler)
+        bus.unsubscribe(TOPIC, handler)
+        assert await bus.replay_dead_letters(rate=1000) == 0
+        assert len(bus.get_failed_deliveries()) == 1
+        await stop(bus, runner)
+
+    asyncio.run(scenario())
+
+
+def test_replay_failing_again_is_dead_lettered_anew(tmp_path):
+    async def scenario():
+        bus, runner = await bus_with_dead_letter(tmp_path, Flaky())
+        (before,) = bus.get_failed_deliveries()
+        assert await bus.replay_dead_letters(rate=1000) == 1
+        (after,) = bus.get_failed_deliveries()
+        assert after.id != before.id
+        await stop(bus, runner)
+
+    asyncio.run(scenario())
+
+
+def test_batched_letter_replayed_as_a_batch(tmp_path):
+    async def scenario():
+        handler = Flaky()
+        bus, runner = await bus_with_dead_letter(tmp_path, handler, batch_size=10,
+                                         batch_linger=timedelta(milliseconds=1))
+        (letter,) = bus.get_failed_deliveries()
+        assert letter.batched
+
+        handler.healthy = True
+        assert await bus.replay_dead_letters(rate=1000) == 1
+        (batch,) = handler.received
+        assert [event.payload["i"] for event in batch] == [1]
+        await stop(bus, runner)
+
+    asyncio.run(scenario())
+
+
+def test_replay_does_not_touch_the_store_on_the_loop_thread(tmp_path, monkeypatch):
+    async def scenario():
+        handler = Flaky()
+        bus, runner = await bus_with_dead_letter(tmp_path, handler)
+        handler.healthy = True
+        store = bus._dead_letters
+        threads = []
+        delete = store.delete
+
+        def recording_delete(letter_id):
+            threads.append(threading.current_thread())
+            delete(letter_id)
+
+        monkeypatch.setattr(store, "delete", recording_delete)
+        assert await bus.replay_dead_letters(rate=1000) == 1
+        assert threads and threading.main_thread() not in threads
+        await stop(bus, runner)
+
+    asyncio.run(scenario())
+
+
+def test_replay_rate_must_be_positive(tmp_path):
+    async def scenario():
+        bus = EventBus(circuit_breaker=None)
+        with pytest.raises(ValueError):
+            await bus.replay_dead_letters(rate=0)
+
+    asyncio.run(scenario())
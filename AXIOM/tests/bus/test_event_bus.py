@@ -0,0 +1,221 @@
+"""Tests for EventBus dispatch, ordering backlogs and retries."""
+
+import asyncio
+from datetime import timedelta
+
+from axiom.bus.event_bus import EventBus
+from axiom.bus.events import Event, EventType
+from axiom.bus.queues import OverflowPolicy
+from axiom.bus.resilience import BreakerConfig, CircuitState
+from axiom.bus.tracking import DeliveryStatus
+
+TOPIC = EventType.STATE_UPDATED.value
+
+
+def make_bus(**kwargs) -> EventBus:
+    bus = EventBus(circuit_breaker=None, **kwargs)
+    bus.register_publisher("test", [TOPIC])
+    return bus
+
+
+async def wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.005)
+
+
+def test_parked_events_count_against_queue_bound():
+    async def scenario():
+        bus = make_bus(max_events=10, overflow_policy=OverflowPolicy.DROP_NEWEST)
+        gate = asyncio.Event()
+        received = []
+
+        async def slow(event):
+            await gate.wait()
+            received.append(event.payload["i"])
+
+        bus.subscribe(TOPIC, slow)
+        runner = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)
+
+        accepted = 0
+        for i in range(1000):
+            if await bus.publish(Event(TOPIC, {"i": i}, "test")):
+                accepted += 1
+            await asyncio.sleep(0)
+
+        stats = bus.get_queue_stats()
+        assert stats["depth"] + stats["parked"] <= 10
+        # Ten slots, plus the one event being delivered
+        assert accepted <= 11
+
+        gate.set()
+        await wait_for(lambda: len(received) == accepted)
+        assert received == sorted(received)
+        await bus.stop()
+        await runner
+
+    asyncio.run(scenario())
+
+
+def test_stop_finishes_in_flight_delivery_and_requeues_parked_events():
+    async def scenario():
+        bus = make_bus(max_events=100)
+        gate = asyncio.Event()
+        received = []
+
+        async def stuck(event):
+            await gate.wait()
+            received.append(event.payload["i"])
+
+        bus.subscribe(TOPIC, stuck)
+        runner = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)
+        for i in range(20):
+            await bus.publish(Event(TOPIC, {"i": i}, "test"))
+        await wait_for(lambda: bus.get_queue_stats()["depth"] == 0)
+        assert bus.get_queue_stats()["parked"] == 19
+
+        stopping = asyncio.create_task(bus.stop())
+        await asyncio.sleep(0.05)
+        # stop() waits for the delivery in flight rather than cancelling it
+        assert not stopping.done()
+        gate.set()
+        await stopping
+        await runner
+        assert received == [0]
+        stats = bus.get_queue_stats()
+        assert stats["parked"] == 0
+        assert stats["depth"] == 19
+        # Requeued in their original order
+        queued = [bus._event_queue.get_nowait().payload["i"] for _ in range(19)]
+        assert queued == list(range(1, 20))
+
+    asyncio.run(scenario())
+
+
+def test_stop_cancels_deliveries_still_running_after_timeout():
+    async def scenario():
+        bus = make_bus(stop_timeout=timedelta(milliseconds=50))
+        started = asyncio.Event()
+
+        async def hangs(event):
+            started.set()
+            await asyncio.Event().wait()
+
+        bus.subscribe(TOPIC, hangs)
+        runner = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)
+        await bus.publish(Event(TOPIC, {}, "test"))
+        await started.wait()
+
+        await asyncio.wait_for(bus.stop(), timeout=5)
+        await runner
+
+    asyncio.run(scenario())
+
+
+def test_per_type_order_kept_across_dispatchers():
+    async def scenario():
+        bus = make_bus(num_dispatchers=4)
+        received = []
+
+        async def handler(event):
+            await asyncio.sleep(0)
+            received.append(event.payload["i"])
+
+        bus.subscribe(TOPIC, handler)
+        runner = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)
+        await bus.publish_many(Event(TOPIC, {"i": i}, "test") for i in range(200))
+        await wait_for(lambda: len(received) == 200)
+        assert received == list(range(200))
+        await bus.stop()
+        await runner
+
+    asyncio.run(scenario())
+
+
+def test_pending_retries_dead_lettered_on_stop():
+    async def scenario():
+        bus = make_bus(retry_delay=timedelta(seconds=10))
+
+        async def failing(event):
+            raise RuntimeError("down")
+
+        bus.subscribe(TOPIC, failing)
+        runner = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)
+        event = Event(TOPIC, {}, "test")
+        await bus.publish(event)
+        await wait_for(lambda: bus.get_queue_stats()["pending_retries"] == 1)
+
+        await bus.stop()
+        await runner
+        letters = bus.get_failed_deliveries(correlation_id=event.correlation_id)
+        assert len(letters) == 1
+        assert letters[0].attempts == 1
+
+    asyncio.run(scenario())
+
+
+def test_failed_batch_recorded_for_every_event():
+    async def scenario():
+        bus = make_bus(max_retry_attempts=1)
+
+        async def failing(batch):
+            raise RuntimeError("down")
+
+        bus.subscribe(TOPIC, failing, batch_size=3)
+        runner = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)
+        batch = [Event(TOPIC, {"i": i}, "test") for i in range(3)]
+        await bus.publish_many(batch)
+        await wait_for(lambda: len(bus.get_failed_deliveries()) == 1)
+
+        for event in batch:
+            records = bus.get_delivery_status(event.correlation_id)
+            assert [record.status for record in records] == [DeliveryStatus.FAILED]
+            assert len(bus.get_failed_deliveries(correlation_id=event.correlation_id)) == 1
+        await bus.stop()
+        await runner
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_probe_releases_half_open_breaker():
+    async def scenario():
+        bus = EventBus(
+            max_retry_attempts=1,
+            circuit_breaker=BreakerConfig(min_calls=1, failure_rate=1.0,
+                                          open_duration=timedelta(milliseconds=10)),
+            stop_timeout=timedelta(milliseconds=50)
+        )
+        bus.register_publisher("test", [TOPIC])
+        probing = asyncio.Event()
+
+        async def handler(event):
+            if event.payload["i"] == 0:
+                raise RuntimeError("boom")
+            probing.set()
+            await asyncio.Event().wait()
+
+        bus.subscribe(TOPIC, handler)
+        (breaker,) = bus._breakers.values()
+        runner = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)
+        await bus.publish(Event(TOPIC, {"i": 0}, "test"))
+        await wait_for(lambda: breaker.state is CircuitState.OPEN)
+        await asyncio.sleep(0.02)
+
+        await bus.publish(Event(TOPIC, {"i": 1}, "test"))
+        await probing.wait()
+        assert breaker.state is CircuitState.HALF_OPEN
+        # The probe is cancelled when stop() times out waiting for it
+        await bus.stop()
+        await runner
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow()
+
+    asyncio.run(scenario())
@@ -0,0 +1,70 @@
+"""Tests for event construction and correlation IDs."""
+
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from axiom.bus import events
+from axiom.bus.events import Event, EventType, new_correlation_id
+
+
+def test_correlation_ids_are_unique_within_a_process():
+    ids = {new_correlation_id() for _ in range(1000)}
+    assert len(ids) == 1000
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_does_not_repeat_parent_correlation_ids():
+    new_correlation_id()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read_fd)
+            os.write(write_fd, new_correlation_id().encode())
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as reader:
+        child_id = reader.read().decode()
+    os.waitpid(pid, 0)
+    parent_id = new_correlation_id()
+
+    assert child_id
+    assert child_id != parent_id
+    assert child_id.split("-")[0] != parent_id.split("-")[0]
+
+
+def test_timestamps_follow_the_wall_clock(monkeypatch):
+    wall = [time.time_ns() + 3600 * 1_000_000_000]
+    monkeypatch.setattr(events.time, "time_ns", lambda: wall[0])
+
+    assert Event(EventType.SYSTEM_START.value, {}, "test").timestamp_ns == wall[0]
+
+
+def test_timestamps_do_not_go_backwards_when_the_clock_steps_back(monkeypatch):
+    wall = [time.time_ns() + 7200 * 1_000_000_000]
+    monkeypatch.setattr(events.time, "time_ns", lambda: wall[0])
+    before = Event(EventType.SYSTEM_START.value, {}, "test").timestamp_ns
+
+    wall[0] -= 60 * 1_000_000_000
+    after = Event(EventType.SYSTEM_START.value, {}, "test").timestamp_ns
+
+    assert after > before
+
+
+@pytest.mark.parametrize("value", [
+    datetime(1969, 12, 31, 23, 59, 59, 500000, tzinfo=timezone.utc),
+    datetime(1950, 6, 1, 12, 0, 0, 250, tzinfo=timezone.utc),
+    datetime(2024, 3, 1, 8, 30, 15, 999999, tzinfo=timezone.utc),
+])
+def test_datetime_conversion_is_exact_before_and_after_1970(value):
+    expected = (value - datetime(1970, 1, 1, tzinfo=timezone.utc)) // timedelta(microseconds=1) * 1000
+
+    event = Event(EventType.SYSTEM_START.value, {}, "test", timestamp=value)
+
+    assert event.timestamp_ns == expected
+    decoded = Event._from_parts(event.event_type, {}, "test", event.correlation_id, expected)
+    assert decoded.timestamp == value.astimezone().replace(tzinfo=None)
@@ -0,0 +1,163 @@
+"""Tests for per-subscription execution modes and concurrency limits."""
+
+import asyncio
+import multiprocessing
+import threading
+from datetime import timedelta
+
+import pytest
+
+from axiom.bus.event_bus import DeliveryOrdering, EventBus
+from axiom.bus.events import Event, EventType
+from axiom.bus.subscription import ExecutionMode
+
+TOPIC = EventType.STATE_UPDATED.value
+
+
+def process_handler(event):
+    """Module-level, so a spawned worker process can unpickle it."""
+    if multiprocessing.parent_process() is None:
+        raise RuntimeError("Ran in the bus process")
+
+
+async def run_bus(bus, events):
+    """Publish events on a running bus and wait until they are delivered."""
+    runner = asyncio.create_task(bus.start())
+    await asyncio.sleep(0)
+    for event in events:
+        await bus.publish(event)
+    await bus._event_queue.join()
+    await bus.stop()
+    await runner
+
+
+def make_bus(**kwargs) -> EventBus:
+    bus = EventBus(circuit_breaker=None, retry_delay=timedelta(milliseconds=1), **kwargs)
+    bus.register_publisher("test", [TOPIC])
+    return bus
+
+
+def event(i: int = 0) -> Event:
+    return Event(TOPIC, {"i": i}, "test")
+
+
+@pytest.mark.parametrize("mode, on_loop_thread", [
+    (ExecutionMode.AUTO, False),
+    (ExecutionMode.INLINE, True),
+    (ExecutionMode.SHARED_THREADS, False),
+    (ExecutionMode.DEDICATED_THREADS, False),
+])
+def test_plain_handler_runs_where_its_mode_says(mode, on_loop_thread):
+    async def scenario():
+        bus = make_bus()
+        threads = []
+
+        def handler(e):
+            threads.append(threading.current_thread())
+
+        bus.subscribe(TOPIC, handler, execution=mode)
+        await run_bus(bus, [event()])
+        assert len(threads) == 1
+        assert (threads[0] is threading.main_thread()) is on_loop_thread
+        if mode is ExecutionMode.DEDICATED_THREADS:
+            assert threads[0].name.startswith("axiom-")
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("mode", [ExecutionMode.AUTO, ExecutionMode.ASYNC])
+def test_coroutine_handler_awaited_on_the_loop(mode):
+    async def scenario():
+        bus = make_bus()
+        threads = []
+
+        async def handler(e):
+            threads.append(threading.current_thread())
+
+        bus.subscribe(TOPIC, handler, execution=mode)
+        await run_bus(bus, [event()])
+        assert threads == [threading.main_thread()]
+
+    asyncio.run(scenario())
+
+
+def test_mode_and_handler_mismatch_rejected():
+    bus = make_bus()
+
+    async def coroutine_handler(e):
+        pass
+
+    with pytest.raises(ValueError):
+        bus.subscribe(TOPIC, process_handler, execution=ExecutionMode.ASYNC)
+    with pytest.raises(ValueError):
+        bus.subscribe(TOPIC, coroutine_handler, execution=ExecutionMode.PROCESS_POOL)
+
+
+def test_process_pool_handler_runs_in_another_process():
+    async def scenario():
+        bus = make_bus()
+        bus.subscribe(TOPIC, process_handler, execution=ExecutionMode.PROCESS_POOL, max_concurrency=1)
+        await run_bus(bus, [event()])
+        (record,) = bus.get_recent_deliveries()
+        assert record.error is None
+        assert bus.get_failed_deliveries() == []
+
+    asyncio.run(scenario())
+
+
+def test_unpicklable_process_pool_handler_is_dead_lettered():
+    async def scenario():
+        bus = make_bus(max_retry_attempts=2)
+        received = []
+
+        def closure(e):  # Local function: cannot be pickled to a worker
+            return e
+
+        async def healthy(e):
+            received.append(e.payload["i"])
+
+        bus.subscribe(TOPIC, closure, execution=ExecutionMode.PROCESS_POOL, max_concurrency=1)
+        bus.subscribe(TOPIC, healthy)
+        await run_bus(bus, [event(1)])
+        assert received == [1]
+        failed = bus.get_failed_deliveries()
+        assert len(failed) == 1
+        assert "closure" in failed[0].subscriber
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("mode", [ExecutionMode.ASYNC, ExecutionMode.DEDICATED_THREADS])
+def test_max_concurrency_bounds_calls_in_flight(mode):
+    async def scenario():
+        bus = make_bus(num_dispatchers=4, ordering=DeliveryOrdering.UNORDERED)
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0, "calls": 0}
+
+        def enter():
+            with lock:
+                state["running"] += 1
+                state["calls"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+
+        def leave():
+            with lock:
+                state["running"] -= 1
+
+        if mode is ExecutionMode.ASYNC:
+            async def handler(e):
+                enter()
+                await asyncio.sleep(0.01)
+                leave()
+        else:
+            def handler(e):
+                enter()
+                threading.Event().wait(0.01)
+                leave()
+
+        bus.subscribe(TOPIC, handler, execution=mode, max_concurrency=2)
+        await run_bus(bus, [event(i) for i in range(12)])
+        assert state["calls"] == 12
+        assert state["peak"] == 2
+
+    asyncio.run(scenario())
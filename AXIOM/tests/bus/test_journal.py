@@ -0,0 +1,194 @@
+"""Tests for the event journal's recovery, compaction and publish integration."""
+
+import asyncio
+import os
+import stat
+from datetime import timedelta
+
+import pytest
+
+from axiom.bus.event_bus import EventBus
+from axiom.bus.events import Event, EventType
+from axiom.bus.exceptions import EventQueueFullError
+from axiom.bus.journal import EventJournal
+from axiom.bus.queues import OverflowPolicy
+
+TOPIC = EventType.STATE_UPDATED.value
+
+
+def make_journal(directory, segment_size: int = 1024 * 1024) -> EventJournal:
+    # Compaction is driven by the tests
+    return EventJournal(directory, segment_size=segment_size, fsync=False,
+                        compact_interval=timedelta(hours=1))
+
+
+def event(i: int) -> Event:
+    return Event(TOPIC, {"i": i}, "test")
+
+
+async def reopen(directory):
+    journal = make_journal(directory)
+    recovered = journal.open()
+    await journal.close()
+    return [e.payload["i"] for e in recovered]
+
+
+def segments(directory):
+    return sorted(path.name for path in directory.glob("segment-*.log"))
+
+
+def test_unacknowledged_events_recovered(tmp_path):
+    async def scenario():
+        journal = make_journal(tmp_path)
+        assert journal.open() == []
+        first, second, third = event(1), event(2), event(3)
+        for e in (first, second, third):
+            journal.append(e)
+        journal.ack(second.sequence)
+        await journal.commit()
+        assert journal.pending_count() == 2
+        await journal.close()
+
+        journal = make_journal(tmp_path)
+        recovered = journal.open()
+        assert [e.payload["i"] for e in recovered] == [1, 3]
+        assert [e.sequence for e in recovered] == [first.sequence, third.sequence]
+        await journal.close()
+
+    asyncio.run(scenario())
+
+
+def test_compaction_keeps_acks_for_events_still_on_disk(tmp_path):
+    async def scenario():
+        journal = make_journal(tmp_path)
+        journal.open()
+        first, second = event(1), event(2)
+        journal.append(first)
+        journal.append(second)
+        # Every following record starts a new segment
+        journal._segment_size = 1
+        journal.ack(first.sequence)   # Alone in its segment, which has no live events
+        journal.append(event(3))
+        await journal.commit()
+
+        # The first segment is still half live, so nothing after it may go
+        journal.compact()
+        assert len(segments(tmp_path)) == 3
+        await journal.close()
+
+        assert await reopen(tmp_path) == [2, 3]
+
+    asyncio.run(scenario())
+
+
+def test_compaction_rewrites_sparse_segments_oldest_first(tmp_path):
+    async def scenario():
+        journal = make_journal(tmp_path)
+        journal.open()
+        events = [event(i) for i in range(5)]
+        for e in events:
+            journal.append(e)
+        journal._segment_size = 1
+        for e in events[:4]:
+            journal.ack(e.sequence)
+        journal.append(event(5))
+        await journal.commit()
+        before = segments(tmp_path)
+
+        journal.compact()
+        after = segments(tmp_path)
+        # The sparse first segment and the ack-only segments are gone
+        assert before[0] not in after
+        assert len(after) < len(before)
+        assert journal.pending_count() == 2
+        await journal.close()
+
+        assert await reopen(tmp_path) == [4, 5]
+
+    asyncio.run(scenario())
+
+
+def test_failed_publish_is_not_recovered(tmp_path):
+    async def scenario():
+        journal = make_journal(tmp_path)
+        journal.open()
+        bus = EventBus(circuit_breaker=None, max_events=1, journal=journal)
+        bus.register_publisher("test", [TOPIC])
+        bus.set_overflow_policy(TOPIC, OverflowPolicy.BLOCK, timeout=timedelta(milliseconds=10))
+
+        assert await bus.publish(event(1))
+        with pytest.raises(EventQueueFullError):
+            await bus.publish(event(2))
+        with pytest.raises(EventQueueFullError):
+            await bus.publish_many([event(3), event(4)])
+        assert journal.pending_count() == 1
+        await journal.close()
+
+        assert await reopen(tmp_path) == [1]
+
+    asyncio.run(scenario())
+
+
+def test_directory_synced_when_segments_are_created_and_removed(tmp_path, monkeypatch):
+    synced = []
+    real_fsync = os.fsync
+
+    def fsync(fd):
+        if stat.S_ISDIR(os.fstat(fd).st_mode):
+            synced.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", fsync)
+
+    async def scenario():
+        journal = EventJournal(tmp_path, compact_interval=timedelta(hours=1))
+        journal.open()
+        first = event(1)
+        journal.append(first)
+        await journal.commit()
+        assert len(synced) == 1  # The first segment's directory entry
+
+        journal._segment_size = 1
+        journal.ack(first.sequence)
+        journal.append(event(2))
+        await journal.commit()
+        created = len(synced)
+        assert created > 1
+
+        journal.compact()
+        assert len(synced) == created + 1  # The removed segments
+        await journal.close()
+
+    asyncio.run(scenario())
+
+
+def test_journaled_event_republished_on_unjournaled_bus(tmp_path):
+    async def scenario():
+        journal = make_journal(tmp_path)
+        journal.open()
+        orphan, delivered = event(1), event(2)
+        journal.append(orphan)
+        journal.append(delivered)
+        await journal.close()
+
+        bus = EventBus(circuit_breaker=None)
+        bus.register_publisher("test", [TOPIC])
+        received = []
+
+        async def handler(e):
+            received.append(e.payload["i"])
+
+        runner = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)
+        # No subscribers yet: nothing to acknowledge, and no journal to do it with
+        await bus.publish(orphan)
+        await bus._event_queue.join()
+        bus.subscribe(TOPIC, handler)
+        await bus.publish(delivered)
+        await bus._event_queue.join()
+        assert received == [2]
+        assert bus._journal_outstanding == {}
+        await bus.stop()
+        await runner
+
+    asyncio.run(scenario())
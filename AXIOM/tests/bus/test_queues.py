@@ -0,0 +1,157 @@
+"""Tests for EventQueue overflow policies, quotas and priority lanes."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from axiom.bus.events import Event, EventType
+from axiom.bus.exceptions import EventQueueFullError
+from axiom.bus.queues import (
+    EventPriority, EventQueue, OverflowConfig, OverflowPolicy, PutResult
+)
+
+STATE = EventType.STATE_UPDATED.value
+SHUTDOWN = EventType.SYSTEM_SHUTDOWN.value
+
+
+def state(entity: str, i: int) -> Event:
+    return Event(STATE, {"entity_id": entity, "i": i}, "test")
+
+
+def drain(queue: EventQueue):
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    return events
+
+
+def test_drop_newest_rejects_when_full():
+    async def scenario():
+        queue = EventQueue(2, OverflowConfig(policy=OverflowPolicy.DROP_NEWEST))
+        results = [await queue.put(state("a", i)) for i in range(3)]
+        assert results == [PutResult.QUEUED, PutResult.QUEUED, PutResult.DROPPED]
+        assert [e.payload["i"] for e in drain(queue)] == [0, 1]
+        assert queue.stats()["dropped_by_type"] == {STATE: 1}
+
+    asyncio.run(scenario())
+
+
+def test_drop_oldest_evicts_and_reports_discard():
+    async def scenario():
+        discarded = []
+        queue = EventQueue(2, OverflowConfig(policy=OverflowPolicy.DROP_OLDEST),
+                           on_discard=discarded.append)
+        for i in range(3):
+            assert await queue.put(state("a", i)) is PutResult.QUEUED
+        assert [e.payload["i"] for e in drain(queue)] == [1, 2]
+        assert [e.payload["i"] for e in discarded] == [0]
+
+    asyncio.run(scenario())
+
+
+def test_coalesce_merges_only_when_full():
+    async def scenario():
+        discarded = []
+        queue = EventQueue(
+            3, OverflowConfig(policy=OverflowPolicy.COALESCE, coalesce_key="entity_id"),
+            on_discard=discarded.append
+        )
+        # Room left: duplicates are queued like any other event
+        assert await queue.put(state("a", 0)) is PutResult.QUEUED
+        assert await queue.put(state("a", 1)) is PutResult.QUEUED
+        assert await queue.put(state("b", 2)) is PutResult.QUEUED
+        # Full: a duplicate replaces the newest queued event for its key
+        assert await queue.put(state("a", 3)) is PutResult.COALESCED
+        assert [e.payload["i"] for e in drain(queue)] == [0, 3, 2]
+        assert [e.payload["i"] for e in discarded] == [1]
+
+    asyncio.run(scenario())
+
+
+def test_coalesce_new_key_times_out_when_full():
+    async def scenario():
+        queue = EventQueue(1, OverflowConfig(
+            policy=OverflowPolicy.COALESCE, coalesce_key="entity_id",
+            timeout=timedelta(milliseconds=20)
+        ))
+        await queue.put(state("a", 0))
+        with pytest.raises(EventQueueFullError):
+            await queue.put(state("b", 1))
+
+    asyncio.run(scenario())
+
+
+def test_block_waits_for_room():
+    async def scenario():
+        queue = EventQueue(1)
+        await queue.put(state("a", 0))
+        blocked = asyncio.create_task(queue.put(state("a", 1)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        queue.get_nowait()
+        assert await blocked is PutResult.QUEUED
+
+    asyncio.run(scenario())
+
+
+def test_block_times_out():
+    async def scenario():
+        queue = EventQueue(1, OverflowConfig(timeout=timedelta(milliseconds=20)))
+        await queue.put(state("a", 0))
+        with pytest.raises(EventQueueFullError):
+            await queue.put(state("a", 1))
+        assert queue.stats()["timeouts_by_type"] == {STATE: 1}
+
+    asyncio.run(scenario())
+
+
+def test_topic_quota_leaves_room_for_others():
+    async def scenario():
+        queue = EventQueue(10, OverflowConfig(policy=OverflowPolicy.DROP_NEWEST))
+        queue.set_config(STATE, OverflowConfig(policy=OverflowPolicy.DROP_NEWEST, max_queued=2))
+        results = [await queue.put(state("a", i)) for i in range(3)]
+        assert results[-1] is PutResult.DROPPED
+        assert await queue.put(Event(SHUTDOWN, {}, "test")) is PutResult.QUEUED
+
+    asyncio.run(scenario())
+
+
+def test_parked_events_hold_their_slot():
+    async def scenario():
+        queue = EventQueue(2, OverflowConfig(policy=OverflowPolicy.DROP_NEWEST))
+        await queue.put(state("a", 0))
+        await queue.put(state("a", 1))
+        parked = queue.get_nowait()
+        queue.park(parked)
+        assert queue.full()
+        assert await queue.put(state("a", 2)) is PutResult.DROPPED
+        queue.unpark(parked)
+        assert await queue.put(state("a", 3)) is PutResult.QUEUED
+
+    asyncio.run(scenario())
+
+
+def test_requeue_returns_parked_event_to_lane_head():
+    async def scenario():
+        queue = EventQueue(3)
+        for i in range(3):
+            await queue.put(state("a", i))
+        first = queue.get_nowait()
+        queue.park(first)
+        queue.requeue(first)
+        assert queue.stats()["parked"] == 0
+        assert [e.payload["i"] for e in drain(queue)] == [0, 1, 2]
+
+    asyncio.run(scenario())
+
+
+def test_critical_lane_served_first():
+    async def scenario():
+        queue = EventQueue(10)
+        queue.set_priority(SHUTDOWN, EventPriority.CRITICAL)
+        await queue.put(state("a", 0))
+        await queue.put(Event(SHUTDOWN, {}, "test"))
+        assert queue.get_nowait().event_type == SHUTDOWN
+
+    asyncio.run(scenario())
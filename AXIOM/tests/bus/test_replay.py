@@ -0,0 +1,71 @@
+"""Tests for replaying journaled events and resuming from checkpoints."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from axiom.bus.event_bus import EventBus
+from axiom.bus.events import Event, EventType
+from axiom.bus.journal import EventJournal
+from axiom.bus.replay import ReplayEngine
+
+TOPIC = EventType.STATE_UPDATED.value
+
+
+class Interrupted(BaseException):
+    """Stands in for a crash partway through a replay."""
+
+
+async def write_compacted_journal(directory) -> None:
+    # Events 0-4 share the first segment; every later record gets its own
+    journal = EventJournal(directory, fsync=False, compact_interval=timedelta(hours=1))
+    journal.open()
+    events = [Event(TOPIC, {"i": i}, "test") for i in range(5)]
+    for event in events:
+        journal.append(event)
+    journal._segment_size = 1
+    for event in events[:4]:
+        journal.ack(event.sequence)
+    journal.append(Event(TOPIC, {"i": 5}, "test"))
+    journal.append(Event(TOPIC, {"i": 6}, "test"))
+    await journal.commit()
+    # Copies event 4 into a segment after events 5 and 6
+    journal.compact()
+    await journal.close()
+
+
+def test_journal_read_yields_sequence_order_after_compaction(tmp_path):
+    asyncio.run(write_compacted_journal(tmp_path))
+    events = list(EventJournal.read(tmp_path))
+    assert [event.payload["i"] for event in events] == [4, 5, 6]
+    assert [event.sequence for event in events] == sorted(event.sequence for event in events)
+
+
+def test_resumed_replay_delivers_events_compaction_moved(tmp_path):
+    journal_dir = tmp_path / "journal"
+    asyncio.run(write_compacted_journal(journal_dir))
+
+    async def scenario():
+        bus = EventBus(circuit_breaker=None)
+        received = []
+        interrupt_at = [3]
+
+        async def projection(event):
+            if len(received) + 1 == interrupt_at[0]:
+                raise Interrupted()
+            received.append(event.payload["i"])
+
+        bus.subscribe(TOPIC, projection)
+        engine = ReplayEngine(bus, checkpoint_path=tmp_path / "checkpoint.json", checkpoint_every=1)
+        with pytest.raises(Interrupted):
+            await engine.replay_journal(journal_dir)
+        assert received == [4, 5]
+        assert engine.load_checkpoint().replayed == 2
+
+        interrupt_at[0] = None
+        assert await engine.replay_journal(journal_dir) == 1
+        assert received == [4, 5, 6]
+        assert engine.load_checkpoint().replayed == 3
+
+    asyncio.run(scenario())
@@ -0,0 +1,82 @@
+"""Tests for request/reply over the event bus."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from axiom.bus.event_bus import EventBus
+from axiom.bus.events import Event, EventType
+from axiom.bus.exceptions import RequestTimeoutError
+
+REQUEST = EventType.CONVERSATION_TURN.value
+REPLY = EventType.STATE_UPDATED.value
+
+
+async def started_bus():
+    bus = EventBus(circuit_breaker=None)
+    bus.register_publisher("client", [REQUEST])
+    bus.register_publisher("server", [REPLY])
+    runner = asyncio.create_task(bus.start())
+    await asyncio.sleep(0)
+    return bus, runner
+
+
+def test_reply_resolves_the_request():
+    async def scenario():
+        bus, runner = await started_bus()
+
+        async def responder(request):
+            await bus.reply(request, {"answer": request.payload["q"] * 2}, "server", REPLY)
+
+        bus.subscribe(REQUEST, responder)
+        request = Event(REQUEST, {"q": 21}, "client")
+        reply = await bus.request(request, timeout=timedelta(seconds=5), reply_type=REPLY)
+        assert reply.payload == {"answer": 42}
+        assert reply.correlation_id == request.correlation_id
+        assert bus._pending_requests == {}
+        await bus.stop()
+        await runner
+
+    asyncio.run(scenario())
+
+
+def test_timeout_removes_the_pending_request():
+    async def scenario():
+        bus, runner = await started_bus()
+        request = Event(REQUEST, {}, "client")
+        with pytest.raises(RequestTimeoutError):
+            await bus.request(request, timeout=timedelta(milliseconds=20))
+        assert bus._pending_requests == {}
+        await bus.stop()
+        await runner
+
+    asyncio.run(scenario())
+
+
+def test_late_reply_after_timeout_is_ignored():
+    async def scenario():
+        bus, runner = await started_bus()
+        replies = []
+
+        async def record(event):
+            replies.append(event)
+
+        bus.subscribe(REPLY, record)
+        request = Event(REQUEST, {}, "client")
+        with pytest.raises(RequestTimeoutError):
+            await bus.request(request, timeout=timedelta(milliseconds=20), reply_type=REPLY)
+
+        # Nobody is waiting any more; the reply is an ordinary event
+        assert await bus.reply(request, {"late": True}, "server", REPLY)
+        await bus._event_queue.join()
+        assert [event.payload for event in replies] == [{"late": True}]
+        assert bus._pending_requests == {}
+
+        # The correlation ID is free for a new request
+        with pytest.raises(RequestTimeoutError):
+            await bus.request(request, timeout=timedelta(milliseconds=20))
+        await bus.stop()
+        await runner
+
+    asyncio.run(scenario())
@@ -0,0 +1,78 @@
+"""Tests for the subscriber circuit breaker."""
+
+from datetime import timedelta
+
+import pytest
+
+from axiom.bus.resilience import BreakerConfig, CircuitBreaker, CircuitState
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_breaker(clock: Clock) -> CircuitBreaker:
+    config = BreakerConfig(window=timedelta(seconds=10), min_calls=4, failure_rate=0.5,
+                           open_duration=timedelta(seconds=5))
+    return CircuitBreaker(config, clock=clock)
+
+
+def open_breaker(breaker: CircuitBreaker, clock: Clock) -> None:
+    for _ in range(4):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    clock.now += 5
+
+
+def test_opens_once_failure_rate_reached():
+    clock = Clock()
+    breaker = make_breaker(clock)
+    for _ in range(3):
+        assert breaker.record_failure() is CircuitState.CLOSED
+    assert breaker.record_success() is CircuitState.CLOSED
+    assert breaker.record_failure() is CircuitState.OPEN
+    assert not breaker.allow()
+    assert breaker.stats()["shed"] == 1
+
+
+def test_failures_expire_with_the_window():
+    clock = Clock()
+    breaker = make_breaker(clock)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 10
+    assert breaker.record_failure() is CircuitState.CLOSED
+    assert breaker.stats()["failures"] == 1
+
+
+@pytest.mark.parametrize("outcome, state", [
+    ("record_success", CircuitState.CLOSED),
+    ("record_failure", CircuitState.OPEN),
+])
+def test_probe_outcome_decides_state(outcome, state):
+    clock = Clock()
+    breaker = make_breaker(clock)
+    open_breaker(breaker, clock)
+    assert breaker.allow()
+    assert not breaker.allow()  # Only one probe at a time
+    assert getattr(breaker, outcome)() is state
+
+
+def test_ignored_outcome_neither_counts_nor_closes():
+    clock = Clock()
+    breaker = make_breaker(clock)
+    for _ in range(4):
+        assert breaker.record_ignored() is CircuitState.CLOSED
+    assert breaker.stats()["calls"] == 0
+
+    open_breaker(breaker, clock)
+    assert breaker.allow()
+    assert breaker.record_ignored() is CircuitState.HALF_OPEN
+    # The probe was released; the next delivery decides
+    assert breaker.allow()
+    assert breaker.record_failure() is CircuitState.OPEN
@@ -0,0 +1,122 @@
+"""Tests for the topic routing table and its wildcard matching."""
+
+import asyncio
+
+import pytest
+
+from axiom.bus.event_bus import EventBus
+from axiom.bus.events import Event, EventType
+from axiom.bus.exceptions import InvalidEventTypeError
+from axiom.bus.routing import RoutingTable, validate_pattern
+from axiom.bus.subscription import Subscription
+
+
+def handler_a(event):
+    pass
+
+
+def handler_b(event):
+    pass
+
+
+def routed(table: RoutingTable, event_type: str):
+    return [subscription.pattern for subscription in table.lookup(event_type)]
+
+
+@pytest.mark.parametrize("pattern, event_type, matches", [
+    ("system.*", "system.start", True),
+    ("system.*", "system", False),
+    ("system.*", "system.start.early", False),
+    ("system.#", "system.start", True),
+    ("system.#", "system.start.early", True),
+    ("*.start", "system.start", True),
+    ("*.start", "vision.frame", False),
+    ("#.frame", "vision.frame", True),
+    ("state.updated", "state.updated", True),
+    ("state.updated", "state.updated.more", False),
+])
+def test_single_and_multi_segment_wildcards(pattern, event_type, matches):
+    table = RoutingTable()
+    table.add(Subscription(pattern, handler_a))
+    assert bool(table.lookup(event_type)) is matches
+
+
+def test_multi_wildcard_matches_zero_segments():
+    table = RoutingTable()
+    table.add(Subscription("system.#", handler_a))
+    table.add(Subscription("#", handler_b))
+    assert sorted(routed(table, "system")) == ["#", "system.#"]
+    assert routed(table, "vision.frame") == ["#"]
+
+
+def test_overlapping_patterns_route_a_handler_once():
+    table = RoutingTable()
+    for pattern in ("system.start", "system.*", "system.#", "#"):
+        table.add(Subscription(pattern, handler_a))
+    table.add(Subscription("*.start", handler_b))
+
+    subscriptions = table.lookup("system.start")
+    assert [s.handler for s in subscriptions] == [handler_a, handler_b]
+    assert table.subscriber_count() == 5
+
+
+def test_overlapping_patterns_deliver_once():
+    async def scenario():
+        bus = EventBus(circuit_breaker=None)
+        bus.register_publisher("test", [EventType.SYSTEM_START.value])
+        received = []
+
+        async def handler(event):
+            received.append(event.event_type)
+
+        for pattern in ("system.start", "system.*", "#"):
+            bus.subscribe(pattern, handler)
+        runner = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)
+        await bus.publish(Event(EventType.SYSTEM_START.value, {}, "test"))
+        await bus._event_queue.join()
+        assert received == [EventType.SYSTEM_START.value]
+        await bus.stop()
+        await runner
+
+    asyncio.run(scenario())
+
+
+def test_unsubscribing_a_wildcard_route():
+    table = RoutingTable()
+    table.add(Subscription("system.*", handler_a))
+    table.add(Subscription("system.start", handler_b))
+    assert len(table.lookup("system.start")) == 2  # Cached now
+
+    removed = table.remove("system.*", handler_a)
+    assert removed is not None and removed.handler is handler_a
+    assert routed(table, "system.start") == ["system.start"]
+    assert table.lookup("system.shutdown") == ()
+    assert table.remove("system.*", handler_a) is None
+    assert table.pattern_count("system.*") == 0
+
+
+def test_duplicate_route_is_not_added():
+    table = RoutingTable()
+    assert table.add(Subscription("system.*", handler_a))
+    assert not table.add(Subscription("system.*", handler_a))
+    assert table.pattern_count("system.*") == 1
+
+
+@pytest.mark.parametrize("pattern", ["system..start", "system.st*", "#rest", ""])
+def test_invalid_patterns_rejected(pattern):
+    with pytest.raises(InvalidEventTypeError):
+        validate_pattern(pattern)
+
+
+def test_resubscribing_keeps_the_original_options():
+    bus = EventBus(circuit_breaker=None)
+
+    async def handler(events):
+        pass
+
+    bus.subscribe(EventType.STATE_UPDATED.value, handler, batch_size=10)
+    bus.subscribe(EventType.STATE_UPDATED.value, handler)
+    (subscription,) = bus._routes.lookup(EventType.STATE_UPDATED.value)
+    assert subscription.batch_size == 10
+    assert len(bus._batchers) == 1
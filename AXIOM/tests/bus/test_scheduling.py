@@ -0,0 +1,66 @@
+"""Tests for the retry scheduler's timer and shutdown."""
+
+import asyncio
+
+from axiom.bus.scheduling import RetryScheduler
+
+
+def test_items_fire_in_due_order():
+    async def scenario():
+        fired = []
+        done = asyncio.Event()
+
+        async def fire(item):
+            fired.append(item)
+            if len(fired) == 3:
+                done.set()
+
+        scheduler = RetryScheduler(fire)
+        scheduler.schedule(0.03, "c")
+        scheduler.schedule(0.01, "a")
+        scheduler.schedule(0.02, "b")
+        await asyncio.wait_for(done.wait(), 1)
+        assert fired == ["a", "b", "c"]
+        assert await scheduler.stop() == []
+
+    asyncio.run(scenario())
+
+
+def test_stop_returns_items_not_yet_due():
+    async def scenario():
+        async def fire(item):
+            raise AssertionError("should not fire")
+
+        scheduler = RetryScheduler(fire)
+        scheduler.schedule(10, "later")
+        scheduler.schedule(5, "sooner")
+        assert await scheduler.stop() == ["sooner", "later"]
+        assert len(scheduler) == 0
+
+    asyncio.run(scenario())
+
+
+def test_reschedule_while_stopping_is_refused():
+    async def scenario():
+        started = asyncio.Event()
+        release = asyncio.Event()
+        results = []
+
+        async def fire(item):
+            started.set()
+            await release.wait()
+            # A retry that fails again tries to schedule its next attempt
+            results.append(scheduler.schedule(0, item))
+
+        scheduler = RetryScheduler(fire)
+        scheduler.schedule(0, "retry")
+        await started.wait()
+        stopping = asyncio.create_task(scheduler.stop())
+        await asyncio.sleep(0)
+        release.set()
+        assert await stopping == []
+        assert results == [False]
+        assert scheduler._task is None
+        assert not scheduler.schedule(0, "late")
+
+    asyncio.run(scenario())
@@ -0,0 +1,57 @@
+"""Tests for the shared-memory ring used for large event payloads."""
+
+import uuid
+
+import pytest
+
+from axiom.bus.events import EventType
+from axiom.bus.exceptions import RingBufferFullError, StaleSlotError
+from axiom.bus.shared_memory import SharedMemoryRing, SlotHandle, buffer_event
+
+
+@pytest.fixture
+def ring():
+    ring = SharedMemoryRing.create(f"axiom-test-{uuid.uuid4().hex[:8]}", slot_size=16, num_slots=2)
+    yield ring
+    ring.close()
+
+
+def test_write_and_read_through_an_event(ring):
+    handle = ring.write(b"frame-bytes")
+    event = buffer_event(EventType.VISION_FRAME.value, "camera", handle, frame_id=1)
+    assert bytes(ring.view(SlotHandle.from_event(event))) == b"frame-bytes"
+    assert event.payload["frame_id"] == 1
+
+
+def test_attached_ring_sees_writes(ring):
+    other = SharedMemoryRing.attach(ring.name)
+    handle = ring.write(b"abc")
+    assert bytes(other.view(handle)) == b"abc"
+    other.release(handle)
+    assert ring.stats()["in_use"] == 0
+    other.close()
+
+
+def test_full_ring_raises_until_released(ring):
+    first = ring.write(b"1")
+    ring.write(b"2")
+    with pytest.raises(RingBufferFullError):
+        ring.write(b"3")
+    ring.release(first)
+    ring.write(b"3")
+
+
+def test_reused_slot_makes_old_handle_stale():
+    ring = SharedMemoryRing.create(f"axiom-test-{uuid.uuid4().hex[:8]}", slot_size=4,
+                                   num_slots=1, overwrite=True)
+    first = ring.write(b"old")
+    ring.write(b"new")
+    assert not ring.is_current(first)
+    with pytest.raises(StaleSlotError):
+        ring.view(first)
+    ring.close()
+
+
+def test_oversized_buffer_rejected(ring):
+    with pytest.raises(ValueError):
+        ring.write(b"x" * 17)
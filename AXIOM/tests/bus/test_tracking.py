@@ -0,0 +1,72 @@
+"""Tests for delivery tracking and the dead-letter store."""
+
+from datetime import timedelta
+
+from axiom.bus.dead_letters import DeadLetterStore
+from axiom.bus.events import Event, EventType
+from axiom.bus.tracking import DeliveryRecord, DeliveryStatus, DeliveryTracker
+
+TOPIC = EventType.STATE_UPDATED.value
+
+
+def handler(event):
+    pass
+
+
+def events(count: int):
+    return [Event(TOPIC, {"i": i}, "test") for i in range(count)]
+
+
+def test_batch_tracked_under_every_event():
+    tracker = DeliveryTracker()
+    batch = events(3)
+    record = DeliveryRecord(event=batch, subscriber=handler)
+    tracker.start(record)
+    for event in batch:
+        assert tracker.get(event.correlation_id) == [record]
+    assert tracker.in_flight() == [record]
+
+    tracker.finish(record, DeliveryStatus.FAILED)
+    assert tracker.in_flight() == []
+    for event in batch:
+        assert tracker.get(event.correlation_id) == [record]
+    assert tracker.recent() == [record]
+    assert tracker.stats()["failed"] == 1
+
+
+def test_completed_records_bounded_and_expire():
+    tracker = DeliveryTracker(max_completed=2, ttl=timedelta(seconds=60))
+    records = [DeliveryRecord(event=event, subscriber=handler) for event in events(3)]
+    for record in records:
+        tracker.start(record)
+        tracker.finish(record, DeliveryStatus.DELIVERED)
+    assert tracker.recent() == [records[2], records[1]]
+
+    expiring = DeliveryTracker(ttl=timedelta(0))
+    expiring.start(records[0])
+    expiring.finish(records[0], DeliveryStatus.DELIVERED)
+    assert expiring.recent() == []
+
+
+def test_dead_letter_batch_found_by_any_member():
+    store = DeadLetterStore()
+    batch = events(3)
+    store.append(batch, "handler", attempts=2, error=RuntimeError("down"))
+    for event in batch:
+        letters = store.query(correlation_id=event.correlation_id)
+        assert len(letters) == 1
+        assert letters[0].batched
+        assert letters[0].events == batch
+    assert len(list(store.iter_letters(correlation_id=batch[0].correlation_id))) == 1
+
+
+def test_dead_letters_trimmed_with_their_index():
+    store = DeadLetterStore(max_records=1)
+    first, second = events(2), events(2)
+    store.append(first, "handler", attempts=1)
+    store.append(second, "handler", attempts=1)
+    assert store.count() == 1
+    assert store.query(correlation_id=first[0].correlation_id) == []
+    assert len(store.query(correlation_id=second[0].correlation_id)) == 1
+    remaining = store._conn.execute("SELECT COUNT(*) FROM dead_letter_events").fetchone()[0]
+    assert remaining == 2
@@ -0,0 +1,186 @@
+"""Tests for bridging event buses over a Unix domain socket."""
+
+import asyncio
+import os
+import socket
+import stat
+from datetime import timedelta
+
+import pytest
+
+from axiom.bus.codec import BinaryCodec
+from axiom.bus.event_bus import EventBus
+from axiom.bus.events import Event, EventType
+from axiom.bus.exceptions import BridgeAddressInUseError, EventCodecError, EventQueueFullError
+from axiom.bus.transport import EventBridge, _HELLO_PREFIX
+
+TOPIC = EventType.STATE_UPDATED.value
+
+
+async def wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.005)
+
+
+class Node:
+    """A bus with a recording subscriber and a bridge."""
+
+    def __init__(self, path, name: str):
+        self.name = name
+        self.bus = EventBus(circuit_breaker=None)
+        self.bus.register_publisher(name, [TOPIC])
+        self.received = []
+        self.bus.subscribe(TOPIC, self._record)
+        self.bridge = EventBridge(self.bus, path, reconnect_delay=timedelta(milliseconds=10))
+        self.runner = None
+
+    async def _record(self, event):
+        self.received.append(event)
+
+    async def start(self):
+        self.runner = asyncio.create_task(self.bus.start())
+        await asyncio.sleep(0)
+
+    async def stop(self):
+        await self.bridge.close()
+        await self.bus.stop()
+        await self.runner
+
+
+def remote_payloads(node):
+    return [event.payload["i"] for event in node.received if event.source != node.name]
+
+
+def test_events_forwarded_to_server(tmp_path):
+    async def scenario():
+        path = tmp_path / "bridge.sock"
+        server, client = Node(path, "server"), Node(path, "client")
+        await server.start()
+        await client.start()
+        await server.bridge.serve()
+        await client.bridge.connect()
+        await wait_for(lambda: client.bridge.get_stats()[0]["connected"])
+
+        await client.bus.publish(Event(TOPIC, {"i": 1}, "client"))
+        await wait_for(lambda: remote_payloads(server) == [1])
+        await client.stop()
+        await server.stop()
+
+    asyncio.run(scenario())
+
+
+def test_socket_is_private_and_default_codec_refuses_marshal(tmp_path):
+    async def scenario():
+        path = tmp_path / "bridge.sock"
+        server = Node(path, "server")
+        await server.start()
+        await server.bridge.serve()
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+        frame = BinaryCodec("marshal").encode(Event(TOPIC, {"i": 1}, "remote"))
+        with pytest.raises(EventCodecError):
+            server.bridge._codec.decode(frame)
+        await server.stop()
+
+    asyncio.run(scenario())
+
+
+def test_serve_refuses_to_replace_a_regular_file(tmp_path):
+    async def scenario():
+        path = tmp_path / "notes.txt"
+        path.write_text("keep me")
+        server = Node(path, "server")
+        with pytest.raises(BridgeAddressInUseError):
+            await server.bridge.serve()
+        assert path.read_text() == "keep me"
+
+    asyncio.run(scenario())
+
+
+def test_bad_frame_and_publish_failure_do_not_drop_connection(tmp_path):
+    async def scenario():
+        path = tmp_path / "bridge.sock"
+        server = Node(path, "server")
+        await server.start()
+        await server.bridge.serve()
+
+        publish = server.bus.publish
+        failures = []
+
+        async def flaky_publish(event):
+            if event.payload.get("i") == 1 and not failures:
+                failures.append(event)
+                raise EventQueueFullError("full")
+            return await publish(event)
+
+        server.bus.publish = flaky_publish
+        codec = server.bridge._codec
+        reader, writer = await asyncio.open_unix_connection(str(path))
+        frames = [
+            _HELLO_PREFIX + codec.name.encode(),
+            b"\x00garbage",
+            codec.encode(Event(TOPIC, {"i": 1}, "remote")),
+            codec.encode(Event(TOPIC, {"i": 2}, "remote")),
+        ]
+        writer.write(b"".join(EventBridge._frame(frame) for frame in frames))
+        await writer.drain()
+
+        await wait_for(lambda: remote_payloads(server) == [2])
+        assert len(failures) == 1
+        assert server.bridge.get_stats()[0]["connected"]
+        writer.close()
+        await server.stop()
+
+    asyncio.run(scenario())
+
+
+def test_client_reconnects_after_unexpected_error(tmp_path):
+    async def scenario():
+        path = tmp_path / "bridge.sock"
+        server, client = Node(path, "server"), Node(path, "client")
+        await server.start()
+        await client.start()
+        await server.bridge.serve()
+
+        run_peer = client.bridge._run_peer
+        calls = []
+
+        async def failing_once(peer, reader, writer):
+            calls.append(peer)
+            if len(calls) == 1:
+                writer.close()
+                raise RuntimeError("unexpected")
+            await run_peer(peer, reader, writer)
+
+        client.bridge._run_peer = failing_once
+        await client.bridge.connect()
+        await wait_for(lambda: client.bridge.get_stats()[0]["connected"])
+        assert len(calls) == 2
+
+        await client.bus.publish(Event(TOPIC, {"i": 3}, "client"))
+        await wait_for(lambda: remote_payloads(server) == [3])
+        await client.stop()
+        await server.stop()
+
+    asyncio.run(scenario())
+
+
+def test_serve_refuses_live_socket_and_replaces_stale_one(tmp_path):
+    async def scenario():
+        path = tmp_path / "bridge.sock"
+        # Left over from a crash: bound, but nobody listening
+        stale = socket.socket(socket.AF_UNIX)
+        stale.bind(str(path))
+        stale.close()
+        first, second = Node(path, "first"), Node(path, "second")
+        await first.bridge.serve()
+        with pytest.raises(BridgeAddressInUseError):
+            await second.bridge.serve()
+        # The live bridge keeps its socket
+        reader, writer = await asyncio.open_unix_connection(str(path))
+        writer.close()
+        await first.bridge.close()
+
+    asyncio.run(scenario())
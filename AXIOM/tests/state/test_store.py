@@ -0,0 +1,114 @@
+"""Tests for the StateStore connection pool."""
+
+import threading
+import time
+
+import pytest
+
+from axiom.config import ConfigurationError, DatabaseConfig
+from axiom.state.exceptions import DatabaseConnectionError
+from axiom.state.store import StateStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = StateStore(tmp_path / "state.db", pool_size=2, pool_timeout=0.05)
+    yield store
+    store.close()
+
+
+def test_checkouts_capped_at_pool_size(store):
+    with store._get_connection() as first, store._get_connection() as second:
+        assert first is not second
+        assert store.pool_stats()["in_use"] == 2
+        started = time.monotonic()
+        with pytest.raises(DatabaseConnectionError):
+            with store._get_connection():
+                pass
+        assert time.monotonic() - started >= 0.05
+    stats = store.pool_stats()
+    assert stats["in_use"] == 0
+    assert stats["timeouts"] == 1
+    assert stats["opened"] == 2
+
+
+def test_waiting_checkout_gets_a_returned_connection(tmp_path):
+    store = StateStore(tmp_path / "state.db", pool_size=1, pool_timeout=5.0)
+    held = threading.Event()
+    release = threading.Event()
+
+    def holder():
+        with store._get_connection():
+            held.set()
+            release.wait()
+
+    thread = threading.Thread(target=holder)
+    thread.start()
+    held.wait()
+    threading.Timer(0.05, release.set).start()
+    with store._get_connection() as connection:
+        assert connection.execute("SELECT 1").fetchone()[0] == 1
+    thread.join()
+    assert store.pool_stats()["opened"] == 1
+    store.close()
+
+
+def test_connection_replaced_after_max_lifetime(tmp_path):
+    store = StateStore(tmp_path / "state.db", max_lifetime=0.01)
+    with store._get_connection() as first:
+        pass
+    time.sleep(0.02)
+    with store._get_connection() as second:
+        assert second is not first
+    assert store.pool_stats()["recycled"] == 1
+    store.close()
+
+
+def test_connection_failing_health_check_is_replaced(store):
+    with store._get_connection() as first:
+        pass
+    first.close()  # Broken while idle
+    with store._get_connection() as second:
+        assert second is not first
+        assert second.execute("SELECT 1").fetchone()[0] == 1
+    assert store.pool_stats()["invalidated"] == 1
+
+
+def test_thread_gets_back_its_last_connection(store):
+    checked_out = threading.Event()
+    mine_returned = threading.Event()
+    others = []
+
+    def other_thread():
+        with store._get_connection() as theirs:
+            others.append(theirs)
+            checked_out.set()
+            mine_returned.wait()
+
+    thread = threading.Thread(target=other_thread)
+    with store._get_connection() as mine:
+        thread.start()
+        checked_out.wait()
+    mine_returned.set()
+    thread.join()
+    # The other thread's connection was returned last, but this thread
+    # gets back the one it used before
+    assert others[0] is not mine
+    with store._get_connection() as again:
+        assert again is mine
+
+
+def test_open_transaction_rolled_back_on_return(store):
+    with store._get_connection() as connection:
+        connection.execute("INSERT INTO system_events (event_type, payload, timestamp, source, correlation_id) "
+                           "VALUES ('x', '{}', '2026-01-01', 'test', 'c1')")
+        assert connection.in_transaction
+    assert not connection.in_transaction
+    assert store.execute_query("SELECT COUNT(*) AS n FROM system_events")[0]["n"] == 0
+
+
+def test_database_config_rejects_unknown_settings(tmp_path):
+    with pytest.raises(ConfigurationError, match="legacy_pool"):
+        DatabaseConfig.from_dict({"path": tmp_path / "state.db", "legacy_pool": 3})
+    config = DatabaseConfig.from_dict({"path": str(tmp_path / "state.db"), "max_connections": 3})
+    assert config.max_connections == 3
@@ -0,0 +1,119 @@
+"""Tests for the write-behind state writer."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from axiom.state.exceptions import DatabaseConnectionError, QueryExecutionError
+from axiom.state.models import SensorReading, SystemEvent
+from axiom.state.store import StateStore
+from axiom.state.writer import DurabilityMode, WriteBehindWriter
+
+START = datetime(2026, 1, 1)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = StateStore(tmp_path / "state.db")
+    yield store
+    store.close()
+
+
+def make_writer(store, durability=DurabilityMode.COMMITTED, **kwargs) -> WriteBehindWriter:
+    writer = WriteBehindWriter(store, durability=durability, **kwargs)
+    writer.start(register_shutdown=False)
+    return writer
+
+
+def system_event(i: int) -> SystemEvent:
+    return SystemEvent("test", {"i": i}, START + timedelta(seconds=i), "writer-test")
+
+
+def count(store, table: str) -> int:
+    return store.execute_query(f"SELECT COUNT(*) AS n FROM {table}")[0]["n"]
+
+
+@pytest.mark.parametrize("durability", list(DurabilityMode))
+def test_records_written_in_every_mode(store, durability):
+    writer = make_writer(store, durability, flush_interval=0.005)
+    for i in range(20):
+        writer.write(system_event(i))
+    writer.write(SensorReading("temp-1", "temperature", 21.5, START))
+    writer.flush()
+    assert count(store, "system_events") == 20
+    assert count(store, "sensor_data") == 1
+    assert writer.stats()["written"] == 21
+    writer.close()
+
+
+def test_duplicate_key_fails_only_its_record(store):
+    writer = make_writer(store, flush_interval=0.2)
+    futures = [writer.submit(system_event(i)) for i in (1, 2, 1, 3)]
+    with pytest.raises(QueryExecutionError):
+        futures[2].result(timeout=5)
+    for future in futures[:2] + futures[3:]:
+        assert future.result(timeout=5) is None
+    assert count(store, "system_events") == 3
+    assert writer.stats()["failed"] == 1
+    writer.close()
+
+
+def test_unconvertible_record_does_not_stop_the_writer(store):
+    writer = make_writer(store, flush_interval=0.2)
+    broken = SystemEvent("test", {}, None, "writer-test")  # No timestamp to format
+    futures = [writer.submit(system_event(1)), writer.submit(broken), writer.submit(system_event(2))]
+    with pytest.raises(QueryExecutionError):
+        futures[1].result(timeout=5)
+    assert futures[0].result(timeout=5) is None
+    assert futures[2].result(timeout=5) is None
+
+    # The thread is still running
+    writer.write(system_event(3))
+    assert count(store, "system_events") == 3
+    writer.close()
+
+
+def test_flush_raises_once_the_thread_has_stopped(store):
+    writer = make_writer(store)
+    writer._queue.put(None)  # Stop the thread behind the writer's back
+    writer._thread.join(5)
+    with pytest.raises(QueryExecutionError):
+        writer.flush()
+    with pytest.raises(QueryExecutionError):
+        writer.submit(system_event(1))
+
+
+def test_close_writes_everything_queued(store):
+    writer = make_writer(store, DurabilityMode.BUFFERED, flush_interval=10)
+    for i in range(50):
+        writer.write(system_event(i))
+    writer.close(timeout=5)
+    assert count(store, "system_events") == 50
+    with pytest.raises(QueryExecutionError):
+        writer.write(system_event(99))
+
+
+def test_write_async_waits_for_commit(store):
+    async def scenario():
+        writer = make_writer(store)
+        await asyncio.gather(*(writer.write_async(system_event(i)) for i in range(10)))
+        assert count(store, "system_events") == 10
+        writer.close()
+
+    asyncio.run(scenario())
+
+
+def test_writer_connection_counts_against_pool(tmp_path):
+    store = StateStore(tmp_path / "state.db", pool_size=2, pool_timeout=0.05)
+    writer = make_writer(store, flush_interval=0.005)
+    writer.write(system_event(1))
+    assert store.pool_stats()["in_use"] == 1
+    with store._get_connection():
+        # The writer holds the other slot, so the pool is exhausted
+        with pytest.raises(DatabaseConnectionError):
+            with store._get_connection():
+                pass
+    writer.close()
+    assert store.pool_stats()["in_use"] == 0
+    store.close()
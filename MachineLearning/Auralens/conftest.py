@@ -0,0 +1 @@
+"""Makes the Auralens ``src`` package importable from the tests."""
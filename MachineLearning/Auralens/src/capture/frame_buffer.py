@@ -0,0 +1,114 @@
+"""Camera frame hand-off to other processes through a shared-memory ring."""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from axiom.bus.events import Event, EventType
+from axiom.bus.shared_memory import SharedMemoryRing, SlotHandle, buffer_event
+
+
+class FrameBuffer:
+    """
+    Ring of fixed-shape frames shared with consumer processes.
+
+    The capture side ``put``s each frame and publishes the returned event;
+    consumers ``get`` the frame as a read-only NumPy view straight out of
+    shared memory and ``release`` it when done. Frames are never pickled or
+    JSON-encoded, only their slot handle travels on the bus.
+
+    The capture side creates the ring with ``overwrite=True`` by default, so
+    a stalled consumer costs it old frames rather than blocking the camera;
+    consumers holding a frame across a long computation should ``acquire``
+    it or check ``is_current`` before trusting results.
+    """
+
+    def __init__(self, ring: SharedMemoryRing, shape: Tuple[int, ...], dtype: np.dtype):
+        """Use ``create`` or ``attach`` instead."""
+        self._ring = ring
+        self._shape = tuple(shape)
+        self._dtype = np.dtype(dtype)
+        self._frame_bytes = int(np.prod(self._shape)) * self._dtype.itemsize
+
+    @classmethod
+    def create(cls, name: str, shape: Tuple[int, ...], dtype: np.dtype = np.uint8,
+               num_slots: int = 8, overwrite: bool = True) -> 'FrameBuffer':
+        """
+        Create the frame ring on the capture side.
+
+        Args:
+            name: Ring name consumers attach with
+            shape: Frame shape, e.g. (height, width, channels)
+            dtype: Pixel type
+            num_slots: Frames that can be in flight at once
+            overwrite: Recycle the oldest frame when every slot is in use
+        """
+        frame_bytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        ring = SharedMemoryRing.create(name, slot_size=frame_bytes, num_slots=num_slots, overwrite=overwrite)
+        return cls(ring, shape, dtype)
+
+    @classmethod
+    def attach(cls, name: str, shape: Tuple[int, ...], dtype: np.dtype = np.uint8) -> 'FrameBuffer':
+        """Attach to a frame ring from a consumer process."""
+        return cls(SharedMemoryRing.attach(name), shape, dtype)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self._shape
+
+    def put(self, frame: np.ndarray, source: str, frame_id: int,
+            consumers: int = 1, correlation_id: Optional[str] = None) -> Event:
+        """
+        Copy a frame into the ring and build the event announcing it.
+
+        Args:
+            frame: Frame with the buffer's shape and dtype
+            source: Publisher name
+            frame_id: Capture sequence number
+            consumers: Number of subscribers that will release the frame
+            correlation_id: Optional correlation ID
+
+        Returns:
+            Event to publish; it carries the slot handle, not the pixels
+        """
+        if frame.shape != self._shape or frame.dtype != self._dtype:
+            raise ValueError(
+                f"Expected a {self._shape} {self._dtype} frame, got {frame.shape} {frame.dtype}"
+            )
+        handle, view = self._ring.reserve(self._frame_bytes, refs=consumers)
+        np.copyto(np.frombuffer(view, dtype=self._dtype).reshape(self._shape), frame)
+        del view
+        return buffer_event(
+            EventType.VISION_FRAME.value,
+            source,
+            handle,
+            correlation_id=correlation_id,
+            frame_id=frame_id,
+            shape=list(self._shape),
+            dtype=self._dtype.str
+        )
+
+    def get(self, event: Event) -> np.ndarray:
+        """
+        Map a published frame as a read-only array, without copying it.
+
+        Raises:
+            StaleSlotError: If the frame was already overwritten
+        """
+        return self._ring.array(SlotHandle.from_event(event), self._dtype, self._shape)
+
+    def acquire(self, event: Event) -> bool:
+        """Keep a frame beyond its usual release; False if already gone."""
+        return self._ring.acquire(SlotHandle.from_event(event))
+
+    def release(self, event: Event) -> None:
+        """Tell the ring this consumer is done with a frame."""
+        self._ring.release(SlotHandle.from_event(event))
+
+    def is_current(self, event: Event) -> bool:
+        """Check that a frame has not been overwritten since it was published."""
+        return self._ring.is_current(SlotHandle.from_event(event))
+
+    def close(self) -> None:
+        """Unmap the ring; drop every array from ``get`` first."""
+        self._ring.close()
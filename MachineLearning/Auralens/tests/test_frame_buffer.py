@@ -0,0 +1,74 @@
+"""Tests for handing camera frames to other processes through FrameBuffer."""
+
+import multiprocessing
+import uuid
+
+import numpy as np
+import pytest
+
+from axiom.bus.exceptions import StaleSlotError
+from src.capture.frame_buffer import FrameBuffer
+
+SHAPE = (4, 6, 3)
+
+
+def ring_name() -> str:
+    return f"auralens-test-{uuid.uuid4().hex[:8]}"
+
+
+def frame(value: int) -> np.ndarray:
+    return np.full(SHAPE, value, dtype=np.uint8)
+
+
+def read_in_child(name: str, event, results) -> None:
+    buffer = FrameBuffer.attach(name, SHAPE)
+    array = buffer.get(event)
+    results.put((int(array.sum()), array.flags.writeable))
+    del array
+    buffer.release(event)
+    buffer.close()
+
+
+@pytest.fixture
+def buffer():
+    buffer = FrameBuffer.create(ring_name(), SHAPE, num_slots=2)
+    yield buffer
+    buffer.close()
+
+
+def test_put_and_get_round_trip(buffer):
+    event = buffer.put(frame(7), "camera", frame_id=1)
+    assert event.payload["frame_id"] == 1
+    assert event.payload["shape"] == list(SHAPE)
+    array = buffer.get(event)
+    assert np.array_equal(array, frame(7))
+    assert not array.flags.writeable
+    del array
+    buffer.release(event)
+
+
+def test_consumer_in_another_process_reads_the_frame(buffer):
+    event = buffer.put(frame(3), "camera", frame_id=1)
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    child = context.Process(target=read_in_child, args=(buffer._ring.name, event, results))
+    child.start()
+    child.join(30)
+    assert child.exitcode == 0
+    assert results.get(timeout=5) == (3 * np.prod(SHAPE), False)
+    # The child's release freed the slot
+    assert buffer._ring.stats()["in_use"] == 0
+
+
+def test_overwritten_frame_is_detected(buffer):
+    first = buffer.put(frame(1), "camera", frame_id=1)
+    buffer.put(frame(2), "camera", frame_id=2)
+    buffer.put(frame(3), "camera", frame_id=3)  # Ring of two: recycles the first slot
+    assert not buffer.is_current(first)
+    with pytest.raises(StaleSlotError):
+        buffer.get(first)
+
+
+def test_rejects_frames_of_the_wrong_shape(buffer):
+    with pytest.raises(ValueError):
+        buffer.put(np.zeros((2, 2), dtype=np.uint8), "camera", frame_id=1)